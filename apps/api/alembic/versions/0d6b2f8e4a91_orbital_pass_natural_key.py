@@ -0,0 +1,57 @@
+"""Unique natural key on orbital passes
+
+Revision ID: 0d6b2f8e4a91
+Revises: f2a9c4d61b8e
+Create Date: 2026-10-18 15:24:40.118702
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0d6b2f8e4a91"
+down_revision: Union[str, Sequence[str], None] = "f2a9c4d61b8e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep the oldest copy of passes stored more than once
+    op.execute(
+        """
+        DELETE FROM orbital_passes a
+        USING orbital_passes b
+        WHERE a.id > b.id
+          AND a.tle_id = b.tle_id
+          AND a.aoi_id = b.aoi_id
+          AND a.min_elevation_deg = b.min_elevation_deg
+          AND a.start_time = b.start_time
+          AND a.satellite_id = b.satellite_id
+        """
+    )
+    # The unique index leads with the cache lookup columns, so it replaces the
+    # plain lookup index
+    op.drop_index("ix_orbital_passes_cache_key", table_name="orbital_passes")
+    op.create_unique_constraint(
+        "uq_orbital_passes_natural_key",
+        "orbital_passes",
+        ["tle_id", "aoi_id", "min_elevation_deg", "start_time", "satellite_id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(
+        "uq_orbital_passes_natural_key", "orbital_passes", type_="unique"
+    )
+    op.create_index(
+        "ix_orbital_passes_cache_key",
+        "orbital_passes",
+        ["tle_id", "aoi_id", "min_elevation_deg", "start_time"],
+        unique=False,
+    )
@@ -0,0 +1,33 @@
+"""List filter indexes on TLEs
+
+Revision ID: 3b8f5d2e7a64
+Revises: 7c3e1a5d9f20
+Create Date: 2026-10-18 17:12:40.318207
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3b8f5d2e7a64"
+down_revision: Union[str, Sequence[str], None] = "7c3e1a5d9f20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_tles_satnum_epoch", "tles", ["satnum", "epoch_utc"], unique=False
+    )
+    op.create_index("ix_tles_epoch", "tles", ["epoch_utc"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_tles_epoch", table_name="tles")
+    op.drop_index("ix_tles_satnum_epoch", table_name="tles")
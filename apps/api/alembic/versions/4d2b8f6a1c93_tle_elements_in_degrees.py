@@ -0,0 +1,50 @@
+"""Re-derive TLE elements in degrees and rev/day
+
+Revision ID: 4d2b8f6a1c93
+Revises: 8e5a1c7d3f46
+Create Date: 2026-10-18 21:05:12.540391
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4d2b8f6a1c93"
+down_revision: Union[str, Sequence[str], None] = "8e5a1c7d3f46"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Rows ingested before the fixed-column parser hold radians and rad/min.
+    # Their values cannot be told apart from new ones, so every row is read
+    # again from line 2 (same columns as tle_parser.parse_tle_block).
+    op.execute(
+        """
+        UPDATE tles SET
+            inclination_deg = CAST(substr(line2, 9, 8) AS numeric),
+            raan_deg = CAST(substr(line2, 18, 8) AS numeric),
+            arg_perigee_deg = CAST(substr(line2, 35, 8) AS numeric),
+            mean_anomaly_deg = CAST(substr(line2, 44, 8) AS numeric),
+            mean_motion_rev_per_day = CAST(substr(line2, 53, 11) AS numeric)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        """
+        UPDATE tles SET
+            inclination_deg = radians(inclination_deg),
+            raan_deg = radians(raan_deg),
+            arg_perigee_deg = radians(arg_perigee_deg),
+            mean_anomaly_deg = radians(mean_anomaly_deg),
+            mean_motion_rev_per_day = mean_motion_rev_per_day * 2 * pi() / 1440
+        """
+    )
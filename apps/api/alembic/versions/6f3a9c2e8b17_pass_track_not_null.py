@@ -0,0 +1,59 @@
+"""Require a stored track on every orbital pass
+
+Revision ID: 6f3a9c2e8b17
+Revises: 4d2b8f6a1c93
+Create Date: 2026-10-18 23:12:40.918254
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import geoalchemy2
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6f3a9c2e8b17"
+down_revision: Union[str, Sequence[str], None] = "4d2b8f6a1c93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Passes stored without a track (allowed since e1d4a7b9c352) are dropped
+    # together with the coverage of their key, so they are recomputed with a
+    # track on the next request
+    op.execute(
+        """
+        DELETE FROM pass_coverage c
+        USING orbital_passes p
+        WHERE p.track_geom IS NULL
+          AND c.tle_id = p.tle_id
+          AND c.aoi_id = p.aoi_id
+          AND c.min_elevation_deg = p.min_elevation_deg
+          AND c.search_mode = p.search_mode
+        """
+    )
+    op.execute("DELETE FROM orbital_passes WHERE track_geom IS NULL")
+    op.alter_column(
+        "orbital_passes",
+        "track_geom",
+        existing_type=geoalchemy2.types.Geometry(
+            geometry_type="MULTILINESTRING", srid=4326
+        ),
+        nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        "orbital_passes",
+        "track_geom",
+        existing_type=geoalchemy2.types.Geometry(
+            geometry_type="MULTILINESTRING", srid=4326
+        ),
+        nullable=True,
+    )
@@ -0,0 +1,41 @@
+"""Schedule query indexes on orbital passes
+
+Revision ID: 7c3e1a5d9f20
+Revises: 0d6b2f8e4a91
+Create Date: 2026-10-18 15:47:03.552846
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7c3e1a5d9f20"
+down_revision: Union[str, Sequence[str], None] = "0d6b2f8e4a91"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_orbital_passes_aoi_start",
+        "orbital_passes",
+        ["aoi_id", "start_time"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_orbital_passes_satellite_start",
+        "orbital_passes",
+        ["satellite_id", "start_time"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_orbital_passes_satellite_start", table_name="orbital_passes")
+    op.drop_index("ix_orbital_passes_aoi_start", table_name="orbital_passes")
@@ -0,0 +1,98 @@
+"""Search mode on stored passes and pass coverage
+
+Revision ID: 8e5a1c7d3f46
+Revises: 3b8f5d2e7a64
+Create Date: 2026-10-19 09:41:27.604183
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8e5a1c7d3f46"
+down_revision: Union[str, Sequence[str], None] = "3b8f5d2e7a64"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Coverage does not record which search produced it, so the pass cache is
+    # rebuilt on demand under the new key. Stored passes are kept as history
+    # and backfilled as "sampled".
+    op.execute("DELETE FROM pass_coverage")
+
+    op.add_column(
+        "pass_coverage", sa.Column("search_mode", sa.String(16), nullable=False)
+    )
+    op.drop_index("ix_pass_coverage_key_start", table_name="pass_coverage")
+    op.create_index(
+        "ix_pass_coverage_key_start",
+        "pass_coverage",
+        ["tle_id", "aoi_id", "min_elevation_deg", "search_mode", "start_time"],
+        unique=False,
+    )
+
+    op.add_column(
+        "orbital_passes",
+        sa.Column(
+            "search_mode", sa.String(16), nullable=False, server_default="sampled"
+        ),
+    )
+    op.alter_column("orbital_passes", "search_mode", server_default=None)
+    op.drop_constraint(
+        "uq_orbital_passes_natural_key", "orbital_passes", type_="unique"
+    )
+    op.create_unique_constraint(
+        "uq_orbital_passes_natural_key",
+        "orbital_passes",
+        [
+            "tle_id",
+            "aoi_id",
+            "min_elevation_deg",
+            "search_mode",
+            "start_time",
+            "satellite_id",
+        ],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM pass_coverage")
+    # Passes stored for both search modes collide under the old key: keep one
+    op.execute(
+        """
+        DELETE FROM orbital_passes p
+        USING orbital_passes q
+        WHERE p.tle_id = q.tle_id
+          AND p.aoi_id = q.aoi_id
+          AND p.min_elevation_deg = q.min_elevation_deg
+          AND p.start_time = q.start_time
+          AND p.satellite_id = q.satellite_id
+          AND p.id > q.id
+        """
+    )
+
+    op.drop_constraint(
+        "uq_orbital_passes_natural_key", "orbital_passes", type_="unique"
+    )
+    op.create_unique_constraint(
+        "uq_orbital_passes_natural_key",
+        "orbital_passes",
+        ["tle_id", "aoi_id", "min_elevation_deg", "start_time", "satellite_id"],
+    )
+    op.drop_column("orbital_passes", "search_mode")
+
+    op.drop_index("ix_pass_coverage_key_start", table_name="pass_coverage")
+    op.create_index(
+        "ix_pass_coverage_key_start",
+        "pass_coverage",
+        ["tle_id", "aoi_id", "min_elevation_deg", "start_time"],
+        unique=False,
+    )
+    op.drop_column("pass_coverage", "search_mode")
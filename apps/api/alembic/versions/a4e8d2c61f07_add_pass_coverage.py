@@ -0,0 +1,61 @@
+"""Add pass coverage and cached pass lookup index
+
+Revision ID: a4e8d2c61f07
+Revises: 5c1f7a9e2b3d
+Create Date: 2026-10-18 11:03:27.902114
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a4e8d2c61f07"
+down_revision: Union[str, Sequence[str], None] = "5c1f7a9e2b3d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "pass_coverage",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("tle_id", sa.Integer(), nullable=False),
+        sa.Column("aoi_id", sa.Integer(), nullable=False),
+        sa.Column("min_elevation_deg", sa.Float(), nullable=False),
+        sa.Column("start_time", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("end_time", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.CheckConstraint("end_time > start_time", name="ck_coverage_time_order"),
+        sa.ForeignKeyConstraint(["aoi_id"], ["aois.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["tle_id"], ["tles.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_pass_coverage_key_start",
+        "pass_coverage",
+        ["tle_id", "aoi_id", "min_elevation_deg", "start_time"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_orbital_passes_cache_key",
+        "orbital_passes",
+        ["tle_id", "aoi_id", "min_elevation_deg", "start_time"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_orbital_passes_cache_key", table_name="orbital_passes")
+    op.drop_index("ix_pass_coverage_key_start", table_name="pass_coverage")
+    op.drop_table("pass_coverage")
@@ -0,0 +1,56 @@
+"""Add current_tles pointer table and latest-TLE index
+
+Revision ID: c7b3e9f04a12
+Revises: a4e8d2c61f07
+Create Date: 2026-10-18 12:21:09.517730
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7b3e9f04a12"
+down_revision: Union[str, Sequence[str], None] = "a4e8d2c61f07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_tles_satellite_epoch_desc",
+        "tles",
+        ["satellite_id", sa.text("epoch_utc DESC")],
+        unique=False,
+    )
+    op.create_table(
+        "current_tles",
+        sa.Column("satellite_id", sa.Integer(), nullable=False),
+        sa.Column("tle_id", sa.Integer(), nullable=False),
+        sa.Column("epoch_utc", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["satellite_id"], ["satellites.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(["tle_id"], ["tles.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("satellite_id"),
+        sa.UniqueConstraint("tle_id"),
+    )
+    # Backfill from the existing TLE history
+    op.execute(
+        """
+        INSERT INTO current_tles (satellite_id, tle_id, epoch_utc)
+        SELECT DISTINCT ON (satellite_id) satellite_id, id, epoch_utc
+        FROM tles
+        ORDER BY satellite_id, epoch_utc DESC
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("current_tles")
+    op.drop_index("ix_tles_satellite_epoch_desc", table_name="tles")
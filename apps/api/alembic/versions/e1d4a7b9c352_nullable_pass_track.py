@@ -0,0 +1,53 @@
+"""Allow orbital passes without a stored track
+
+Revision ID: e1d4a7b9c352
+Revises: c7b3e9f04a12
+Create Date: 2026-10-18 14:41:52.306118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import geoalchemy2
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e1d4a7b9c352"
+down_revision: Union[str, Sequence[str], None] = "c7b3e9f04a12"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        "orbital_passes",
+        "track_geom",
+        existing_type=geoalchemy2.types.Geometry(geometry_type="LINESTRING", srid=4326),
+        nullable=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Passes stored without a track are dropped together with the coverage of
+    # their key, so they are recomputed on the next request
+    op.execute(
+        """
+        DELETE FROM pass_coverage c
+        USING orbital_passes p
+        WHERE p.track_geom IS NULL
+          AND c.tle_id = p.tle_id
+          AND c.aoi_id = p.aoi_id
+          AND c.min_elevation_deg = p.min_elevation_deg
+        """
+    )
+    op.execute("DELETE FROM orbital_passes WHERE track_geom IS NULL")
+    op.alter_column(
+        "orbital_passes",
+        "track_geom",
+        existing_type=geoalchemy2.types.Geometry(geometry_type="LINESTRING", srid=4326),
+        nullable=False,
+    )
@@ -0,0 +1,50 @@
+"""Store pass tracks as antimeridian-split MultiLineStrings
+
+Revision ID: f2a9c4d61b8e
+Revises: e1d4a7b9c352
+Create Date: 2026-10-18 15:02:11.640357
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2a9c4d61b8e"
+down_revision: Union[str, Sequence[str], None] = "e1d4a7b9c352"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        ALTER TABLE orbital_passes
+        ALTER COLUMN track_geom TYPE geometry(MultiLineString, 4326)
+        USING ST_Multi(track_geom)
+        """
+    )
+    # Tracks stored before the split jump across the map at the antimeridian:
+    # shift them to 0..360 so they are continuous, then cut them back at 180
+    op.execute(
+        """
+        UPDATE orbital_passes
+        SET track_geom = ST_Multi(ST_WrapX(ST_ShiftLongitude(track_geom), 180, -360))
+        WHERE ST_XMax(track_geom) - ST_XMin(track_geom) > 180
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        """
+        ALTER TABLE orbital_passes
+        ALTER COLUMN track_geom TYPE geometry(LineString, 4326)
+        USING ST_LineFromMultiPoint(ST_Points(track_geom))
+        """
+    )
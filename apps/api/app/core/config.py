@@ -8,7 +8,33 @@ class Settings(BaseModel):
     database_url: str = os.getenv(
         "DATABASE_URL", "postgresql+psycopg://oei:oei@db:5432/oei"
     )
+    # Async engine URL; psycopg 3 URLs work for both engines
+    async_database_url: str = os.getenv("ASYNC_DATABASE_URL", database_url)
+    # Connection pool of each engine (sync and async)
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    db_pool_timeout: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    # Seconds after which pooled connections are replaced (-1 = never)
+    db_pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
     cors_origins: list[str] = os.getenv("CORS_ORIGINS", "*").split(",")
+    # Max EarthSatellite objects kept in memory by the pass engine (LRU)
+    satellite_cache_size: int = int(os.getenv("SATELLITE_CACHE_SIZE", "1024"))
+    # Worker processes for CPU-bound pass computation (0 = run in a thread)
+    pass_compute_workers: int = int(
+        os.getenv("PASS_COMPUTE_WORKERS", str(os.cpu_count() or 1))
+    )
+    # Element sets committed per batch by the streaming TLE ingest
+    tle_ingest_batch_size: int = int(os.getenv("TLE_INGEST_BATCH_SIZE", "5000"))
+    # Background pass-job worker (PostgreSQL-backed queue)
+    pass_job_worker_enabled: bool = os.getenv("PASS_JOB_WORKER", "1") == "1"
+    pass_job_concurrency: int = int(os.getenv("PASS_JOB_CONCURRENCY", "1"))
+    pass_job_poll_seconds: float = float(os.getenv("PASS_JOB_POLL_SECONDS", "1.0"))
+    # Running jobs touch updated_at this often while they compute
+    pass_job_heartbeat_seconds: float = float(
+        os.getenv("PASS_JOB_HEARTBEAT_SECONDS", "30")
+    )
+    # Running jobs without a heartbeat for this long are re-queued (crashed worker)
+    pass_job_stale_seconds: int = int(os.getenv("PASS_JOB_STALE_SECONDS", "600"))
 
 
 settings = Settings()
@@ -6,4 +6,12 @@ class Base(DeclarativeBase):
 
 
 # Import models so Alembic sees them
-from app.models import satellite, tle, aoi, orbital_pass  # noqa: E402,F401
+from app.models import (  # noqa: E402,F401
+    satellite,
+    tle,
+    current_tle,
+    aoi,
+    orbital_pass,
+    pass_coverage,
+    pass_job,
+)
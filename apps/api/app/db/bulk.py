@@ -0,0 +1,87 @@
+import csv
+import io
+from typing import Iterable, Optional, Sequence
+
+from sqlalchemy import Table, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+
+def copy_insert(
+    session: Session,
+    table: Table,
+    columns: Sequence[str],
+    rows: Iterable[Sequence],
+    conflict_columns: Sequence[str],
+    replace_if: Optional[str] = None,
+) -> int:
+    """
+    Bulk-inserts rows with COPY into a temporary staging table followed by a single
+    INSERT ... SELECT ... ON CONFLICT DO NOTHING into the target table (or DO
+    UPDATE, see replace_if).
+
+    Runs inside the session's current transaction (nothing is committed), so the
+    rows become visible together with the rest of the unit of work.
+
+    Args:
+        session (Session): Active session (PostgreSQL, psycopg or psycopg2).
+        table (Table): Target table.
+        columns (Sequence[str]): Target columns, in the order of each row.
+        rows (Iterable[Sequence]): Row values; None is stored as NULL.
+        conflict_columns (Sequence[str]): Unique key used to skip existing rows.
+        replace_if (str, optional): SQL condition over the existing row (the
+            table name) and the new one (EXCLUDED) under which an existing row is
+            overwritten instead of skipped.
+
+    Returns:
+        int: Number of rows actually inserted or replaced.
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    if not buffer.tell():
+        return 0
+    buffer.seek(0)
+
+    stage = f"_stage_{table.name}"
+    column_list = ", ".join(columns)
+    session.execute(text(f"DROP TABLE IF EXISTS {stage}"))
+    session.execute(
+        text(
+            f"CREATE TEMP TABLE {stage} (LIKE {table.name} INCLUDING DEFAULTS) "
+            "ON COMMIT DROP"
+        )
+    )
+
+    copy_sql = f"COPY {stage} ({column_list}) FROM STDIN WITH (FORMAT csv)"
+    connection = session.connection()
+    dialect = connection.dialect
+    cursor = connection.connection.driver_connection.cursor()
+    try:
+        if hasattr(cursor, "copy"):  # psycopg 3
+            with cursor.copy(copy_sql) as copy:
+                copy.write(buffer.getvalue())
+        else:  # psycopg2
+            cursor.copy_expert(copy_sql, buffer)
+    except dialect.loaded_dbapi.Error as e:
+        # The raw cursor bypasses SQLAlchemy's exception translation; callers
+        # handle SQLAlchemyError
+        raise DBAPIError.instance(
+            copy_sql, None, e, dialect.loaded_dbapi.Error, dialect=dialect
+        ) from e
+    finally:
+        cursor.close()
+
+    on_conflict = "DO NOTHING"
+    if replace_if is not None:
+        assignments = ", ".join(
+            f"{c} = EXCLUDED.{c}" for c in columns if c not in conflict_columns
+        )
+        on_conflict = f"DO UPDATE SET {assignments} WHERE {replace_if}"
+    result = session.execute(
+        text(
+            f"INSERT INTO {table.name} ({column_list}) "
+            f"SELECT {column_list} FROM {stage} "
+            f"ON CONFLICT ({', '.join(conflict_columns)}) {on_conflict}"
+        )
+    )
+    return result.rowcount
@@ -0,0 +1,31 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy import event
+
+
+@contextmanager
+def count_queries(*engines) -> Iterator[list[str]]:
+    """
+    Records every SQL statement sent to the given engines while the block runs.
+
+    Args:
+        engines: Engines to watch (Engine or AsyncEngine).
+
+    Yields:
+        list[str]: Statements in execution order, filled as they run, so
+        len() gives the round trips of the block (executemany counts once).
+    """
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    targets = [getattr(e, "sync_engine", e) for e in engines]
+    for target in targets:
+        event.listen(target, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        for target in targets:
+            event.remove(target, "before_cursor_execute", record)
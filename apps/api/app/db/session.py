@@ -1,15 +1,29 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
 
-engine = create_engine(
-    settings.database_url,
+pool_options = dict(
     pool_pre_ping=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
 )
 
+engine = create_engine(settings.database_url, **pool_options)
+
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 
+# Async engine for I/O-bound routes, so a request waiting on the database
+# does not hold one of the threadpool's threads
+async_engine = create_async_engine(settings.async_database_url, **pool_options)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
 
 def get_db():
     db = SessionLocal()
@@ -18,3 +32,9 @@ def get_db():
         db.commit()
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+        await db.commit()
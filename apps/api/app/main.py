@@ -1,9 +1,25 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.db.session import async_engine
 from app.routers.main import all_routers
+from app.routers.pass_job import start_job_workers
+from app.utils.compute_pool import shutdown_executor
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    workers = start_job_workers() if settings.pass_job_worker_enabled else []
+    yield
+    for task in workers:
+        task.cancel()
+    shutdown_executor()
+    await async_engine.dispose()
+
 
-app = FastAPI(title=settings.app_name)
+app = FastAPI(title=settings.app_name, lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -11,6 +27,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Total-Count"],
 )
 
 for r in all_routers:
@@ -0,0 +1,23 @@
+from datetime import datetime
+from sqlalchemy import DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+
+class CurrentTLE(Base):
+    """
+    Materialized pointer to the newest TLE (by epoch) of each satellite.
+
+    Maintained by TLERepo on every TLE write, so latest-element-set lookups are a
+    primary-key join instead of a scan over the TLE history.
+    """
+
+    __tablename__ = "current_tles"
+
+    satellite_id: Mapped[int] = mapped_column(
+        ForeignKey("satellites.id", ondelete="CASCADE"), primary_key=True
+    )
+    tle_id: Mapped[int] = mapped_column(
+        ForeignKey("tles.id", ondelete="CASCADE"), nullable=False, unique=True
+    )
+    epoch_utc: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
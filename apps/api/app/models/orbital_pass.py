@@ -1,5 +1,15 @@
 import datetime as dt
-from sqlalchemy import Integer, Float, DateTime, func, CheckConstraint, ForeignKey
+from sqlalchemy import (
+    Integer,
+    Float,
+    String,
+    DateTime,
+    func,
+    CheckConstraint,
+    ForeignKey,
+    Index,
+    UniqueConstraint,
+)
 from app.db.base import Base
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import JSONB
@@ -43,9 +53,10 @@ class OrbitalPass(Base):
     )
 
     track_geom: Mapped[str] = mapped_column(
-        Geometry(geometry_type="LINESTRING", srid=4326, spatial_index=True),
+        Geometry(geometry_type="MULTILINESTRING", srid=4326, spatial_index=True),
         nullable=False,
-        doc="Sub-satellite ground track as a LINESTRING in EPSG:4326.",
+        doc="Sub-satellite ground track as a MULTILINESTRING in EPSG:4326, split "
+        "at the antimeridian.",
     )
 
     min_elevation_deg: Mapped[float] = mapped_column(
@@ -55,6 +66,13 @@ class OrbitalPass(Base):
         doc="Elevation threshold (deg) used to detect the pass.",
     )
 
+    search_mode: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+        doc="Pass search that produced the row ('adaptive' or 'sampled'); the "
+        "modes report slightly different AOS/LOS times.",
+    )
+
     created_at: Mapped[dt.datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -72,4 +90,18 @@ class OrbitalPass(Base):
             "max_elevation_time >= start_time AND max_elevation_time <= end_time",
             name="ck_pass_peak_within_window",
         ),
+        # Natural key: recomputing a pass is idempotent. Column order also serves
+        # cached pass lookups by (TLE, AOI, threshold, search mode, time)
+        UniqueConstraint(
+            "tle_id",
+            "aoi_id",
+            "min_elevation_deg",
+            "search_mode",
+            "start_time",
+            "satellite_id",
+            name="uq_orbital_passes_natural_key",
+        ),
+        # Schedule queries per AOI / satellite, ordered by time
+        Index("ix_orbital_passes_aoi_start", "aoi_id", "start_time"),
+        Index("ix_orbital_passes_satellite_start", "satellite_id", "start_time"),
     )
@@ -0,0 +1,57 @@
+import datetime as dt
+from sqlalchemy import (
+    Integer,
+    Float,
+    String,
+    DateTime,
+    ForeignKey,
+    Index,
+    func,
+    CheckConstraint,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+
+class PassCoverage(Base):
+    """
+    Time ranges for which passes of a (TLE, AOI, threshold, search mode) key
+    were computed.
+
+    Stored passes alone cannot tell an empty computed range from one never
+    computed, so every computation records its window here.
+    """
+
+    __tablename__ = "pass_coverage"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    tle_id: Mapped[int] = mapped_column(
+        ForeignKey("tles.id", ondelete="CASCADE"), nullable=False
+    )
+    aoi_id: Mapped[int] = mapped_column(
+        ForeignKey("aois.id", ondelete="CASCADE"), nullable=False
+    )
+    min_elevation_deg: Mapped[float] = mapped_column(Float, nullable=False)
+    # "adaptive" or "sampled": the modes report slightly different AOS/LOS
+    search_mode: Mapped[str] = mapped_column(String(16), nullable=False)
+    start_time: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    end_time: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    created_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        CheckConstraint("end_time > start_time", name="ck_coverage_time_order"),
+        Index(
+            "ix_pass_coverage_key_start",
+            "tle_id",
+            "aoi_id",
+            "min_elevation_deg",
+            "search_mode",
+            "start_time",
+        ),
+    )
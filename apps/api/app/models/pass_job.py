@@ -0,0 +1,57 @@
+import datetime as dt
+from sqlalchemy import Integer, String, Float, Text, DateTime, Index, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+
+class PassJob(Base):
+    """Queued pass computation, executed by the in-process job worker."""
+
+    __tablename__ = "pass_jobs"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    kind: Mapped[str] = mapped_column(
+        String(16), nullable=False, doc="'single' (PassComputeRequest) or 'batch'."
+    )
+    request: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    request_hash: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        doc="SHA-256 of kind + canonical request JSON, used for deduplication.",
+    )
+    status: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+        default="queued",
+        doc="queued | running | succeeded | failed",
+    )
+    progress: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    result: Mapped[list | None] = mapped_column(JSONB)
+    error: Mapped[str | None] = mapped_column(Text)
+
+    created_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        doc="Last state, progress or heartbeat; stale running jobs are re-queued.",
+    )
+    started_at: Mapped[dt.datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        doc="Time of the current claim; doubles as its lease token.",
+    )
+    finished_at: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True))
+
+    __table_args__ = (
+        # At most one active job per identical request
+        Index(
+            "uq_pass_jobs_active_request",
+            "request_hash",
+            unique=True,
+            postgresql_where=text("status IN ('queued', 'running')"),
+        ),
+        Index("ix_pass_jobs_status_created", "status", "created_at"),
+    )
@@ -11,4 +11,11 @@ class Satellite(Base):
     norad_id: Mapped[int] = mapped_column(Integer, nullable=False)
     name: Mapped[str] = mapped_column(String(128), nullable=False)
 
-    tles = relationship("TLE", back_populates="satellite", cascade="all, delete-orphan")
+    # Never loaded implicitly: use the repositories' load=("tles",) (selectinload)
+    tles = relationship(
+        "TLE",
+        back_populates="satellite",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
+    )
@@ -57,9 +57,14 @@ class TLE(Base):
     satellite_id: Mapped[int] = mapped_column(
         ForeignKey("satellites.id", ondelete="CASCADE"), nullable=False
     )
-    satellite = relationship("Satellite", back_populates="tles")
+    satellite = relationship("Satellite", back_populates="tles", lazy="raise_on_sql")
 
     __table_args__ = (
         # prevent duplicates for the same sat & epoch
         UniqueConstraint("satellite_id", "epoch_utc", name="uq_tle_sat_epoch"),
+        # newest-first access path per satellite (latest TLE, DISTINCT ON)
+        Index("ix_tles_satellite_epoch_desc", "satellite_id", epoch_utc.desc()),
+        # list filters by catalog number and by epoch range (e.g. pruning)
+        Index("ix_tles_satnum_epoch", "satnum", "epoch_utc"),
+        Index("ix_tles_epoch", "epoch_utc"),
     )
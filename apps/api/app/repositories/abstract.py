@@ -2,9 +2,23 @@
 from __future__ import annotations
 from typing import Any, Optional, Sequence, Type, TypeVar, Generic
 from pydantic import BaseModel
-from sqlalchemy import select, delete
+from sqlalchemy import (
+    Column,
+    UniqueConstraint,
+    cast,
+    column as sql_column,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+    update,
+    values,
+)
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 
 TModel = TypeVar("TModel")
 TCreate = TypeVar("TCreate", bound=BaseModel)
@@ -20,6 +34,17 @@ class IntegrityConflictException(CrudException): ...
 class NotFoundException(CrudException): ...
 
 
+# Operators accepted in list filters: (column, operator, value)
+FILTER_OPERATORS = {
+    "eq": lambda col, v: col == v,
+    "gt": lambda col, v: col > v,
+    "gte": lambda col, v: col >= v,
+    "lt": lambda col, v: col < v,
+    "lte": lambda col, v: col <= v,
+    "in": lambda col, v: col.in_(v),
+}
+
+
 def AbstractRepository(model: Type[TModel]):
     class Repo(Generic[TModel, TCreate, TUpdate]):
 
@@ -28,12 +53,16 @@ def AbstractRepository(model: Type[TModel]):
         def create(
             cls, session: Session, data: TCreate, *, commit: bool = True
         ) -> TModel:
+            """
+            Inserts one row with INSERT ... RETURNING, so the returned object
+            carries server defaults without a refresh query.
+            """
             try:
-                obj = cls.model(**data.model_dump())
-                session.add(obj)
+                obj = session.scalars(
+                    insert(cls.model).values(**data.model_dump()).returning(cls.model)
+                ).one()
                 if commit:
                     session.commit()
-                    session.refresh(obj)
                 return obj
             except IntegrityError as e:
                 session.rollback()
@@ -42,7 +71,7 @@ def AbstractRepository(model: Type[TModel]):
                 session.rollback()
                 raise CrudException(f"Create failed: {e}") from e
 
-        # READ ALL (optional pagination only)
+        # READ ALL (filters, sort, offset or keyset pagination, projection)
         @classmethod
         def list_all(
             cls,
@@ -50,34 +79,145 @@ def AbstractRepository(model: Type[TModel]):
             *,
             limit: Optional[int] = None,
             offset: Optional[int] = None,
-        ) -> list[TModel]:
+            after: Any = None,
+            columns: Optional[Sequence[str]] = None,
+            column: str = "id",
+            filters: Sequence[tuple[str, str, Any]] = (),
+            order_by: Optional[str] = None,
+            descending: bool = False,
+            load: Sequence[str] = (),
+        ) -> list:
+            """
+            Lists rows ordered by order_by (if given) and then column, which must
+            be unique (e.g. the primary key) for pages to be stable.
+
+            Args:
+                after: Keyset cursor; only rows sorting after it are returned,
+                    so every page costs one index range scan however deep it
+                    is. It is the column value of the last row, or its
+                    (order_by, column) pair when order_by is given.
+                columns: Column names to load. Rows are then returned as
+                    mappings instead of ORM objects; column and order_by are
+                    always included.
+                filters: (column, operator, value) predicates, see
+                    FILTER_OPERATORS.
+                order_by: Non-nullable column to sort on before column.
+                descending: Sort (and page) in descending order.
+                load: Relationships to eager-load, see _load_options.
+            """
+            key = cls._column(column)
+            sort_names = (
+                [order_by, column] if order_by not in (None, column) else [column]
+            )
+            sort = [cls._column(name) for name in sort_names]
             try:
-                stmt = select(cls.model)
+                if columns:
+                    names = [*sort_names, *(c for c in columns if c not in sort_names)]
+                    stmt = select(*(cls._column(c) for c in names))
+                else:
+                    stmt = select(cls.model).options(*cls._load_options(load))
+                stmt = stmt.where(*cls._predicates(filters))
+                if after is not None:
+                    cursor = tuple_(*sort) if len(sort) > 1 else key
+                    after = tuple_(*after) if len(sort) > 1 else after
+                    stmt = stmt.where(cursor < after if descending else cursor > after)
+                stmt = stmt.order_by(*(c.desc() if descending else c for c in sort))
                 if offset is not None:
                     stmt = stmt.offset(offset)
                 if limit is not None:
                     stmt = stmt.limit(limit)
-                return session.execute(stmt).scalars().all()
+                result = session.execute(stmt)
+                return result.mappings().all() if columns else result.scalars().all()
+            except CrudException:
+                raise
             except Exception as e:
                 session.rollback()
                 raise CrudException(f"List failed: {e}") from e
 
+        # COUNT
+        @classmethod
+        def count_all(
+            cls, session: Session, *, filters: Sequence[tuple[str, str, Any]] = ()
+        ) -> int:
+            try:
+                return session.execute(
+                    select(func.count())
+                    .select_from(cls.model)
+                    .where(*cls._predicates(filters))
+                ).scalar_one()
+            except CrudException:
+                raise
+            except Exception as e:
+                session.rollback()
+                raise CrudException(f"Count failed: {e}") from e
+
+        @classmethod
+        def indexed_columns(cls) -> set[str]:
+            """
+            Columns a B-tree lookup can start from: the primary key and the
+            leading column of every index or unique constraint.
+            """
+            table = cls.model.__table__
+            leading = [next(iter(table.primary_key.columns))]
+            for index in table.indexes:
+                expr = index.expressions[0]
+                leading.append(getattr(expr, "element", expr))  # unwrap DESC
+            for constraint in table.constraints:
+                if isinstance(constraint, UniqueConstraint):
+                    leading.append(next(iter(constraint.columns)))
+            return {col.key for col in leading if isinstance(col, Column)}
+
+        @classmethod
+        def _predicates(cls, filters: Sequence[tuple[str, str, Any]]) -> list:
+            predicates = []
+            for name, op, value in filters:
+                if op not in FILTER_OPERATORS:
+                    raise CrudException(f"Unsupported filter operator {op}.")
+                predicates.append(FILTER_OPERATORS[op](cls._column(name), value))
+            return predicates
+
+        @classmethod
+        def _load_options(cls, load: Sequence[str]) -> list:
+            """
+            selectinload options for the named relationships: one extra SELECT
+            per relationship for the whole result, instead of one per row.
+            Relationships are declared lazy="raise_on_sql", so anything not
+            loaded this way fails loudly instead of issuing N+1 queries.
+            """
+            relationships = cls.model.__mapper__.relationships
+            for name in load:
+                if name not in relationships:
+                    raise CrudException(
+                        f"Relationship {name} not found on {cls.model.__tablename__}."
+                    )
+            return [selectinload(getattr(cls.model, name)) for name in load]
+
+        @classmethod
+        def _column(cls, name: str):
+            """Mapped column attribute by name; relationships are rejected."""
+            if name not in cls.model.__mapper__.columns:
+                raise CrudException(
+                    f"Column {name} not found on {cls.model.__tablename__}."
+                )
+            return getattr(cls.model, name)
+
         # READ ONE
         @classmethod
         def get_one_by_id(
-            cls, session: Session, id_: Any, column: str = "id"
+            cls,
+            session: Session,
+            id_: Any,
+            column: str = "id",
+            *,
+            load: Sequence[str] = (),
         ) -> TModel:
+            options = cls._load_options(load)
             if column == "id":
-                obj = session.get(cls.model, id_)
+                obj = session.get(cls.model, id_, options=options)
             else:
-                try:
-                    col = getattr(cls.model, column)
-                except AttributeError:
-                    raise CrudException(
-                        f"Column {column} not found on {cls.model.__tablename__}."
-                    )
+                col = cls._column(column)
                 obj = session.execute(
-                    select(cls.model).where(col == id_)
+                    select(cls.model).options(*options).where(col == id_)
                 ).scalar_one_or_none()
             if not obj:
                 raise NotFoundException(
@@ -96,14 +236,31 @@ def AbstractRepository(model: Type[TModel]):
             commit: bool = True,
             column: str = "id",
         ) -> TModel:
-            obj = cls.get_one_by_id(session, id_, column)
-            for k, v in data.model_dump(exclude_unset=True).items():
-                setattr(obj, k, v)
+            """
+            Applies the fields set on data with a single UPDATE ... RETURNING,
+            without loading the row first.
+            """
+            changes = data.model_dump(exclude_unset=True)
+            if not changes:
+                return cls.get_one_by_id(session, id_, column)
+            stmt = (
+                update(cls.model)
+                .where(cls._column(column) == id_)
+                .values(**changes)
+                .returning(cls.model)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
             try:
+                obj = session.scalars(stmt).one_or_none()
+                if obj is None:
+                    raise NotFoundException(
+                        f"{cls.model.__tablename__} with {column}={id_} not found."
+                    )
                 if commit:
                     session.commit()
-                    session.refresh(obj)
                 return obj
+            except NotFoundException:
+                raise
             except IntegrityError as e:
                 session.rollback()
                 raise IntegrityConflictException(str(e)) from e
@@ -116,16 +273,226 @@ def AbstractRepository(model: Type[TModel]):
         def remove_by_id(
             cls, session: Session, id_: Any, *, commit: bool = True, column: str = "id"
         ) -> int:
-            try:
-                col = getattr(cls.model, column)
-            except AttributeError:
-                raise CrudException(
-                    f"Column {column} not found on {cls.model.__tablename__}."
-                )
+            col = cls._column(column)
             result = session.execute(delete(cls.model).where(col == id_))
             if commit:
                 session.commit()
             return result.rowcount or 0
 
+        # BULK (set-based, one statement per operation)
+        @classmethod
+        def bulk_create(
+            cls, session: Session, items: Sequence[TCreate], *, commit: bool = True
+        ) -> list[TModel]:
+            """
+            Inserts all items with a single INSERT ... RETURNING, so the
+            returned rows (in input order) need no refresh. The batch is
+            atomic: a conflict on any item rolls back every item.
+            """
+            if not items:
+                return []
+            try:
+                objs = session.scalars(
+                    insert(cls.model).returning(
+                        cls.model, sort_by_parameter_order=True
+                    ),
+                    [item.model_dump() for item in items],
+                ).all()
+                if commit:
+                    session.commit()
+                return objs
+            except IntegrityError as e:
+                session.rollback()
+                raise IntegrityConflictException(str(e)) from e
+            except Exception as e:
+                session.rollback()
+                raise CrudException(f"Bulk create failed: {e}") from e
+
+        @classmethod
+        def bulk_update(
+            cls,
+            session: Session,
+            items: Sequence[tuple[Any, TUpdate]],
+            *,
+            commit: bool = True,
+            column: str = "id",
+        ) -> tuple[list[TModel], list[Any]]:
+            """
+            Applies partial updates given as (id, data) pairs.
+
+            Items setting the same fields are joined against a VALUES list and
+            written by one UPDATE ... FROM ... RETURNING, so a batch costs one
+            statement per distinct field set instead of a load and a write per
+            row. A conflict on any item rolls back every item.
+
+            Returns:
+                tuple[list, list]: Updated rows and the ids that matched no row.
+            """
+            key = cls._column(column)
+            groups: dict[tuple[str, ...], list[dict]] = {}
+            for id_, data in items:
+                changes = data.model_dump(exclude_unset=True)
+                if column in changes:
+                    raise CrudException(f"Cannot update key column {column}.")
+                groups.setdefault(tuple(sorted(changes)), []).append(
+                    {column: id_, **changes}
+                )
+
+            objs = []
+            try:
+                for names, rows in groups.items():
+                    if not names:
+                        continue
+                    types = [key.type] + [
+                        cls._column(n).property.columns[0].type for n in names
+                    ]
+                    # Cast every value: PostgreSQL types an all-NULL VALUES
+                    # column as text, which then fails to assign to e.g. floats
+                    source = values(
+                        *(sql_column(n, t) for n, t in zip((column, *names), types)),
+                        name="changes",
+                    ).data(
+                        [
+                            tuple(
+                                cast(literal(row[n], t), t)
+                                for n, t in zip((column, *names), types)
+                            )
+                            for row in rows
+                        ]
+                    )
+                    stmt = (
+                        update(cls.model)
+                        .where(key == source.c[column])
+                        .values({n: source.c[n] for n in names})
+                        .returning(cls.model)
+                        .execution_options(
+                            synchronize_session=False, populate_existing=True
+                        )
+                    )
+                    objs += session.scalars(stmt).all()
+
+                # Items without changes are still reported if they do not exist
+                unchanged = [row[column] for row in groups.get((), [])]
+                if unchanged:
+                    objs += session.scalars(
+                        select(cls.model).where(key.in_(unchanged))
+                    ).all()
+                if commit:
+                    session.commit()
+            except IntegrityError as e:
+                session.rollback()
+                raise IntegrityConflictException(str(e)) from e
+            except Exception as e:
+                session.rollback()
+                raise CrudException(f"Bulk update failed: {e}") from e
+
+            found = {getattr(obj, column) for obj in objs}
+            return objs, [id_ for id_, _ in items if id_ not in found]
+
+        @classmethod
+        def bulk_remove(
+            cls,
+            session: Session,
+            ids: Sequence[Any],
+            *,
+            commit: bool = True,
+            column: str = "id",
+        ) -> list[Any]:
+            """
+            Deletes all ids with one DELETE ... RETURNING.
+
+            Returns:
+                list: The ids that were deleted; the others matched no row.
+            """
+            key = cls._column(column)
+            try:
+                deleted = session.scalars(
+                    delete(cls.model).where(key.in_(ids)).returning(key)
+                ).all()
+                if commit:
+                    session.commit()
+                return deleted
+            except IntegrityError as e:
+                session.rollback()
+                raise IntegrityConflictException(str(e)) from e
+            except Exception as e:
+                session.rollback()
+                raise CrudException(f"Bulk delete failed: {e}") from e
+
+        # ASYNC VARIANTS
+        # Each one runs its sync counterpart on the AsyncSession's sync facade,
+        # so subclass overrides (e.g. TLERepo keeping current_tles in sync)
+        # apply to both APIs while the I/O itself stays non-blocking.
+        @classmethod
+        async def create_async(
+            cls, session: AsyncSession, data: TCreate, *, commit: bool = True
+        ) -> TModel:
+            return await session.run_sync(lambda s: cls.create(s, data, commit=commit))
+
+        @classmethod
+        async def list_all_async(
+            cls,
+            session: AsyncSession,
+            **kwargs: Any,
+        ) -> list:
+            return await session.run_sync(lambda s: cls.list_all(s, **kwargs))
+
+        @classmethod
+        async def count_all_async(cls, session: AsyncSession, **kwargs: Any) -> int:
+            return await session.run_sync(lambda s: cls.count_all(s, **kwargs))
+
+        @classmethod
+        async def get_one_by_id_async(
+            cls, session: AsyncSession, id_: Any, column: str = "id", **kwargs: Any
+        ) -> TModel:
+            return await session.run_sync(
+                lambda s: cls.get_one_by_id(s, id_, column, **kwargs)
+            )
+
+        @classmethod
+        async def update_by_id_async(
+            cls,
+            session: AsyncSession,
+            id_: Any,
+            data: TUpdate,
+            *,
+            commit: bool = True,
+            column: str = "id",
+        ) -> TModel:
+            return await session.run_sync(
+                lambda s: cls.update_by_id(s, id_, data, commit=commit, column=column)
+            )
+
+        @classmethod
+        async def remove_by_id_async(
+            cls,
+            session: AsyncSession,
+            id_: Any,
+            *,
+            commit: bool = True,
+            column: str = "id",
+        ) -> int:
+            return await session.run_sync(
+                lambda s: cls.remove_by_id(s, id_, commit=commit, column=column)
+            )
+
+        @classmethod
+        async def bulk_create_async(
+            cls, session: AsyncSession, items: Sequence[TCreate], **kwargs: Any
+        ) -> list[TModel]:
+            return await session.run_sync(lambda s: cls.bulk_create(s, items, **kwargs))
+
+        @classmethod
+        async def bulk_update_async(
+            cls, session: AsyncSession, items: Sequence[tuple[Any, TUpdate]], **kwargs
+        ) -> tuple[list[TModel], list[Any]]:
+            return await session.run_sync(lambda s: cls.bulk_update(s, items, **kwargs))
+
+        @classmethod
+        async def bulk_remove_async(
+            cls, session: AsyncSession, ids: Sequence[Any], **kwargs: Any
+        ) -> list[Any]:
+            return await session.run_sync(lambda s: cls.bulk_remove(s, ids, **kwargs))
+
     Repo.model = model
     return Repo
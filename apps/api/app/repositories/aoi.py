@@ -0,0 +1,47 @@
+from geoalchemy2 import Geometry
+from geoalchemy2.shape import from_shape
+from shapely.geometry import MultiPolygon, box
+from sqlalchemy import column, exists, func, select
+from sqlalchemy.orm import Session
+
+from app.models.aoi import AOI
+from app.repositories.abstract import AbstractRepository
+
+
+class AOIRepo(AbstractRepository(AOI)):
+
+    @classmethod
+    def overlapping_envelopes(
+        cls, session: Session, envelopes: list[tuple[float, float, float, float]]
+    ) -> list[AOI]:
+        """
+        Returns the AOIs whose bounding box overlaps any of the given lon/lat
+        rectangles, ordered by id.
+
+        The rectangles travel as one MULTIPOLYGON parameter that ST_Dump splits
+        back into parts, each matched with && (bounding box) against the
+        idx_aois_geometry GiST index. The statement and its plan stay the same
+        size however many rectangles a long window produces; a single && against
+        the whole collection would compare with its (often global) bounding box.
+
+        Args:
+            envelopes (list[tuple[float, float, float, float]]): (xmin, ymin,
+                xmax, ymax) rectangles in EPSG:4326.
+        """
+        if not envelopes:
+            return []
+        rectangles = from_shape(
+            MultiPolygon([box(*envelope) for envelope in envelopes]), srid=4326
+        )
+        parts = func.ST_Dump(rectangles).table_valued(
+            column("geom", Geometry(srid=4326))
+        )
+        return (
+            session.execute(
+                select(AOI)
+                .where(exists().where(AOI.geometry.intersects(parts.c.geom)))
+                .order_by(AOI.id)
+            )
+            .scalars()
+            .all()
+        )
@@ -0,0 +1,292 @@
+from datetime import datetime
+from typing import Iterable, Optional
+
+import numpy as np
+import shapely
+from shapely.geometry import MultiLineString
+
+from geoalchemy2.shape import from_shape, to_shape
+from sqlalchemy import delete, func, or_, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.db.bulk import copy_insert
+from app.models.orbital_pass import OrbitalPass
+from app.models.pass_coverage import PassCoverage
+from app.repositories.abstract import AbstractRepository
+from app.schemas.orbital_pass import PassComputeResult
+from app.utils.track import geometry_to_track_geojson, track_parts
+
+# Columns written by bulk pass storage (id and created_at use their defaults)
+PASS_INSERT_COLUMNS = [
+    "satellite_id",
+    "aoi_id",
+    "tle_id",
+    "start_time",
+    "end_time",
+    "max_elevation_deg",
+    "max_elevation_time",
+    "min_elevation_deg",
+    "search_mode",
+    "track_geom",
+]
+PASS_NATURAL_KEY = [
+    "tle_id",
+    "aoi_id",
+    "min_elevation_deg",
+    "search_mode",
+    "start_time",
+    "satellite_id",
+]
+
+
+class OrbitalPassRepo(AbstractRepository(OrbitalPass)):
+
+    @classmethod
+    def search(
+        cls,
+        session: Session,
+        *,
+        satellite_ids: Optional[list[int]] = None,
+        aoi_ids: Optional[list[int]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        min_max_elevation_deg: Optional[float] = None,
+        min_elevation_deg: Optional[float] = None,
+        search_mode: Optional[str] = None,
+        intersects: Optional[list] = None,
+        after: Optional[tuple[datetime, int]] = None,
+        limit: int = 100,
+    ) -> list[OrbitalPass]:
+        """
+        Stored passes matching all given filters, ordered by (start_time, id).
+
+        Args:
+            start, end: Keep passes overlapping [start, end].
+            min_max_elevation_deg: Keep passes culminating at or above this.
+            min_elevation_deg: Keep passes computed with this threshold.
+            search_mode: Keep passes found by this search ("adaptive" or
+                "sampled").
+            intersects: Shapely geometries (EPSG:4326); keep passes whose track
+                intersects any of them.
+            after: Keyset cursor, the (start_time, id) of the last row of the
+                previous page.
+            limit: Page size.
+        """
+        stmt = select(OrbitalPass)
+        if satellite_ids:
+            stmt = stmt.where(OrbitalPass.satellite_id.in_(satellite_ids))
+        if aoi_ids:
+            stmt = stmt.where(OrbitalPass.aoi_id.in_(aoi_ids))
+        if start is not None:
+            stmt = stmt.where(OrbitalPass.end_time >= start)
+        if end is not None:
+            stmt = stmt.where(OrbitalPass.start_time <= end)
+        if min_max_elevation_deg is not None:
+            stmt = stmt.where(OrbitalPass.max_elevation_deg >= min_max_elevation_deg)
+        if min_elevation_deg is not None:
+            stmt = stmt.where(OrbitalPass.min_elevation_deg == min_elevation_deg)
+        if search_mode is not None:
+            stmt = stmt.where(OrbitalPass.search_mode == search_mode)
+        if intersects:
+            stmt = stmt.where(
+                or_(
+                    *(
+                        func.ST_Intersects(
+                            OrbitalPass.track_geom, from_shape(geometry, srid=4326)
+                        )
+                        for geometry in intersects
+                    )
+                )
+            )
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(OrbitalPass.start_time, OrbitalPass.id) > tuple_(*after)
+            )
+        stmt = stmt.order_by(OrbitalPass.start_time, OrbitalPass.id).limit(limit)
+        return session.execute(stmt).scalars().all()
+
+    @classmethod
+    def bulk_insert(
+        cls,
+        session: Session,
+        satellite_id: int,
+        aoi_id: int,
+        tle_id: int,
+        min_elevation_deg: float,
+        search_mode: str,
+        passes: Iterable[PassComputeResult],
+    ) -> int:
+        """
+        Stores the passes of one (TLE, AOI, threshold, search mode) key; see
+        bulk_insert_many.
+        """
+        return cls.bulk_insert_many(
+            session,
+            [(satellite_id, aoi_id, tle_id, min_elevation_deg, search_mode, passes)],
+        )
+
+    @classmethod
+    def bulk_insert_many(cls, session: Session, groups) -> int:
+        """
+        Stores computed passes with one COPY and a single INSERT ... SELECT,
+        skipping passes already stored under the natural key (TLE, AOI,
+        threshold, search mode, start time, satellite) so recomputation is
+        idempotent. Start times come from a grid aligned independently of the
+        window (see pass_engine.grid_offsets), so overlapping windows agree on
+        the key; a stored pass is only replaced by one that ends later.
+        Tracks are shipped as hex EWKB. Does not commit.
+
+        Args:
+            groups (Iterable[tuple]): (satellite_id, aoi_id, tle_id,
+                min_elevation_deg, search_mode, passes) per key.
+
+        Returns:
+            int: Number of passes actually inserted.
+        """
+        keys, passes = [], []
+        for *key, group in groups:
+            for p in group:
+                keys.append(tuple(key))
+                passes.append(p)
+        if not passes:
+            return 0
+
+        tracks = np.array(
+            [MultiLineString(track_parts(p.track_geojson)) for p in passes],
+            dtype=object,
+        )
+        wkb = shapely.to_wkb(
+            shapely.set_srid(tracks, 4326), hex=True, include_srid=True
+        )
+        rows = (
+            [
+                satellite_id,
+                aoi_id,
+                tle_id,
+                p.start_time,
+                p.end_time,
+                p.max_elevation_deg,
+                p.max_elevation_time,
+                min_elevation_deg,
+                search_mode,
+                track,
+            ]
+            for (
+                satellite_id,
+                aoi_id,
+                tle_id,
+                min_elevation_deg,
+                search_mode,
+            ), p, track in zip(keys, passes, wkb)
+        )
+        return copy_insert(
+            session,
+            OrbitalPass.__table__,
+            PASS_INSERT_COLUMNS,
+            rows,
+            conflict_columns=PASS_NATURAL_KEY,
+            # A pass cut off by the end of an earlier window gives way to the
+            # whole pass found by a later, overlapping one
+            replace_if="EXCLUDED.end_time > orbital_passes.end_time",
+        )
+
+    @classmethod
+    def find_cached(
+        cls,
+        session: Session,
+        tle_id: int,
+        aoi_id: int,
+        min_elevation_deg: float,
+        search_mode: str,
+        start: datetime,
+        end: datetime,
+    ) -> tuple[list[tuple[datetime, datetime]], list[PassComputeResult]]:
+        """
+        Returns the computed time ranges overlapping [start, end] for the key and
+        the stored passes overlapping it.
+        """
+        covered = session.execute(
+            select(PassCoverage.start_time, PassCoverage.end_time)
+            .where(
+                PassCoverage.tle_id == tle_id,
+                PassCoverage.aoi_id == aoi_id,
+                PassCoverage.min_elevation_deg == min_elevation_deg,
+                PassCoverage.search_mode == search_mode,
+                PassCoverage.start_time <= end,
+                PassCoverage.end_time >= start,
+            )
+            .order_by(PassCoverage.start_time)
+        ).all()
+
+        rows = (
+            session.execute(
+                select(OrbitalPass)
+                .where(
+                    OrbitalPass.tle_id == tle_id,
+                    OrbitalPass.aoi_id == aoi_id,
+                    OrbitalPass.min_elevation_deg == min_elevation_deg,
+                    OrbitalPass.search_mode == search_mode,
+                    OrbitalPass.start_time <= end,
+                    OrbitalPass.end_time >= start,
+                )
+                .order_by(OrbitalPass.start_time)
+            )
+            .scalars()
+            .all()
+        )
+        passes = [
+            PassComputeResult(
+                start_time=row.start_time,
+                end_time=row.end_time,
+                max_elevation_deg=row.max_elevation_deg,
+                max_elevation_time=row.max_elevation_time,
+                track_geojson=geometry_to_track_geojson(to_shape(row.track_geom)),
+            )
+            for row in rows
+        ]
+        return [tuple(c) for c in covered], passes
+
+    @classmethod
+    def record_coverage(
+        cls,
+        session: Session,
+        tle_id: int,
+        aoi_id: int,
+        min_elevation_deg: float,
+        search_mode: str,
+        start: datetime,
+        end: datetime,
+    ) -> None:
+        """
+        Marks [start, end] as computed, coalescing it with overlapping or touching
+        ranges of the same key into a single row. Does not commit.
+        """
+        key = (
+            PassCoverage.tle_id == tle_id,
+            PassCoverage.aoi_id == aoi_id,
+            PassCoverage.min_elevation_deg == min_elevation_deg,
+            PassCoverage.search_mode == search_mode,
+        )
+        overlapping = session.execute(
+            select(PassCoverage.id, PassCoverage.start_time, PassCoverage.end_time)
+            .where(*key, PassCoverage.start_time <= end, PassCoverage.end_time >= start)
+            .with_for_update()
+        ).all()
+        if overlapping:
+            start = min([start] + [row.start_time for row in overlapping])
+            end = max([end] + [row.end_time for row in overlapping])
+            session.execute(
+                delete(PassCoverage).where(
+                    PassCoverage.id.in_([row.id for row in overlapping])
+                )
+            )
+        session.add(
+            PassCoverage(
+                tle_id=tle_id,
+                aoi_id=aoi_id,
+                min_elevation_deg=min_elevation_deg,
+                search_mode=search_mode,
+                start_time=start,
+                end_time=end,
+            )
+        )
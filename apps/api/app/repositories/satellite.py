@@ -1,4 +1,37 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.bulk import copy_insert
 from app.models.satellite import Satellite
 from app.repositories.abstract import AbstractRepository
 
-SatelliteRepo = AbstractRepository(Satellite)
+
+class SatelliteRepo(AbstractRepository(Satellite)):
+
+    @classmethod
+    def upsert_by_norad(cls, session: Session, names: dict[int, str]) -> dict[int, int]:
+        """
+        Creates the satellites missing for the given NORAD ids in one bulk insert.
+
+        Args:
+            names (dict[int, str]): Satellite name keyed by NORAD id; names of
+                existing satellites are left unchanged.
+
+        Returns:
+            dict[int, int]: Satellite id keyed by NORAD id.
+        """
+        if not names:
+            return {}
+        copy_insert(
+            session,
+            Satellite.__table__,
+            ["norad_id", "name"],
+            names.items(),
+            conflict_columns=["norad_id"],
+        )
+        rows = session.execute(
+            select(Satellite.norad_id, Satellite.id).where(
+                Satellite.norad_id.in_(names)
+            )
+        ).all()
+        return dict(rows)
@@ -1,4 +1,299 @@
+from datetime import datetime
+from typing import Any, Iterable
+
+from pydantic import BaseModel
+from sqlalchemy import delete, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.db.bulk import copy_insert
+from app.models.current_tle import CurrentTLE
 from app.models.tle import TLE
-from app.repositories.abstract import AbstractRepository
+from app.repositories.abstract import (
+    AbstractRepository,
+    CrudException,
+    IntegrityConflictException,
+)
+
+# Columns written by bulk ingestion (id and fetched_at use their defaults)
+TLE_INGEST_COLUMNS = [
+    "name",
+    "line1",
+    "line2",
+    "epoch_utc",
+    "satnum",
+    "intl_desg",
+    "inclination_deg",
+    "raan_deg",
+    "eccentricity",
+    "arg_perigee_deg",
+    "mean_anomaly_deg",
+    "mean_motion_rev_per_day",
+    "bstar",
+    "rev_number",
+    "checksum_ok_l1",
+    "checksum_ok_l2",
+    "source",
+    "satellite_id",
+]
+
+
+class TLERepo(AbstractRepository(TLE)):
+
+    @classmethod
+    def bulk_insert(cls, session: Session, rows: list[dict]) -> int:
+        """
+        Inserts parsed TLE rows with COPY + INSERT ... ON CONFLICT DO NOTHING.
+
+        Rows whose (satellite_id, epoch_utc) already exists are skipped instead of
+        aborting the batch. Does not commit.
+
+        Returns:
+            int: Number of rows actually inserted.
+        """
+        return copy_insert(
+            session,
+            TLE.__table__,
+            TLE_INGEST_COLUMNS,
+            ([row.get(c) for c in TLE_INGEST_COLUMNS] for row in rows),
+            conflict_columns=["satellite_id", "epoch_utc"],
+        )
+
+    @classmethod
+    def refresh_current(
+        cls,
+        session: Session,
+        satellite_ids: Iterable[int],
+        moved_tle_ids: Iterable[int] = (),
+    ) -> None:
+        """
+        Points current_tles at the newest TLE of each given satellite, in one
+        INSERT ... SELECT DISTINCT ON ... ON CONFLICT DO UPDATE. Does not commit.
+
+        Args:
+            satellite_ids: Satellites to repoint, including the previous
+                satellites of moved TLEs.
+            moved_tle_ids: TLEs whose satellite_id changed. A moved TLE may still
+                be current for its old satellite, which would make the upsert
+                violate UNIQUE(tle_id), so the affected pointers are deleted
+                first (one extra DELETE, only when something moved).
+        """
+        satellite_ids = list(set(satellite_ids))
+        if not satellite_ids:
+            return
+        moved_tle_ids = list(set(moved_tle_ids))
+        if moved_tle_ids:
+            session.execute(
+                delete(CurrentTLE).where(
+                    or_(
+                        CurrentTLE.satellite_id.in_(satellite_ids),
+                        CurrentTLE.tle_id.in_(moved_tle_ids),
+                    )
+                )
+            )
+        latest = (
+            select(TLE.satellite_id, TLE.id, TLE.epoch_utc)
+            .where(TLE.satellite_id.in_(satellite_ids))
+            .distinct(TLE.satellite_id)
+            .order_by(TLE.satellite_id, TLE.epoch_utc.desc())
+        )
+        stmt = insert(CurrentTLE).from_select(
+            ["satellite_id", "tle_id", "epoch_utc"], latest
+        )
+        session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["satellite_id"],
+                set_={
+                    "tle_id": stmt.excluded.tle_id,
+                    "epoch_utc": stmt.excluded.epoch_utc,
+                },
+                where=CurrentTLE.tle_id != stmt.excluded.tle_id,
+            )
+        )
+
+    @classmethod
+    def latest_for_satellites(
+        cls, session: Session, satellite_ids: Iterable[int]
+    ) -> list[TLE]:
+        """
+        Returns the current TLE of each given satellite (satellites without TLEs
+        are omitted), ordered by satellite id, in one indexed join.
+        """
+        return (
+            session.execute(
+                select(TLE)
+                .join(CurrentTLE, CurrentTLE.tle_id == TLE.id)
+                .where(CurrentTLE.satellite_id.in_(list(satellite_ids)))
+                .order_by(CurrentTLE.satellite_id)
+            )
+            .scalars()
+            .all()
+        )
+
+    @classmethod
+    def covering_window(
+        cls, session: Session, satellite_id: int, start: datetime, end: datetime
+    ) -> list[TLE]:
+        """
+        Returns the TLEs of a satellite needed to propagate [start, end] with the
+        nearest element set: every TLE with an epoch inside the window plus the
+        last one before it and the first one after it, ordered by epoch, in one
+        range query on (satellite_id, epoch_utc).
+        """
+        last_before = (
+            select(func.max(TLE.epoch_utc))
+            .where(TLE.satellite_id == satellite_id, TLE.epoch_utc <= start)
+            .scalar_subquery()
+        )
+        first_after = (
+            select(func.min(TLE.epoch_utc))
+            .where(TLE.satellite_id == satellite_id, TLE.epoch_utc >= end)
+            .scalar_subquery()
+        )
+        return (
+            session.execute(
+                select(TLE)
+                .where(
+                    TLE.satellite_id == satellite_id,
+                    TLE.epoch_utc >= func.coalesce(last_before, start),
+                    TLE.epoch_utc <= func.coalesce(first_after, end),
+                )
+                .order_by(TLE.epoch_utc)
+            )
+            .scalars()
+            .all()
+        )
+
+    # Generic CRUD writes keep current_tles in sync as well
+
+    @classmethod
+    def _flush_and_refresh_current(
+        cls, session: Session, satellite_ids, moved_tle_ids=()
+    ) -> None:
+        try:
+            session.flush()
+            cls.refresh_current(session, satellite_ids, moved_tle_ids)
+        except IntegrityError as e:
+            session.rollback()
+            raise IntegrityConflictException(str(e)) from e
+
+    @classmethod
+    def create(cls, session: Session, data: BaseModel, *, commit: bool = True) -> TLE:
+        obj = super().create(session, data, commit=False)
+        cls._flush_and_refresh_current(session, [obj.satellite_id])
+        if commit:
+            session.commit()
+        return obj
+
+    @classmethod
+    def update_by_id(
+        cls,
+        session: Session,
+        id_: Any,
+        data: BaseModel,
+        *,
+        commit: bool = True,
+        column: str = "id",
+    ) -> TLE:
+        # The previous satellite only needs a refresh when the TLE moves
+        previous_satellite_ids = (
+            cls._satellite_ids(session, [id_], column)
+            if "satellite_id" in data.model_fields_set
+            else set()
+        )
+        obj = super().update_by_id(session, id_, data, commit=False, column=column)
+        cls._flush_and_refresh_current(
+            session,
+            previous_satellite_ids | {obj.satellite_id},
+            [obj.id] if previous_satellite_ids - {obj.satellite_id} else [],
+        )
+        if commit:
+            session.commit()
+        return obj
+
+    @classmethod
+    def remove_by_id(
+        cls, session: Session, id_: Any, *, commit: bool = True, column: str = "id"
+    ) -> int:
+        return len(cls._remove_returning(session, [id_], commit, column))
+
+    @classmethod
+    def bulk_create(
+        cls, session: Session, items: list[BaseModel], *, commit: bool = True
+    ) -> list[TLE]:
+        objs = super().bulk_create(session, items, commit=False)
+        cls._flush_and_refresh_current(session, {obj.satellite_id for obj in objs})
+        if commit:
+            session.commit()
+        return objs
+
+    @classmethod
+    def bulk_update(
+        cls,
+        session: Session,
+        items: list[tuple[Any, BaseModel]],
+        *,
+        commit: bool = True,
+        column: str = "id",
+    ) -> tuple[list[TLE], list[Any]]:
+        moved = [id_ for id_, data in items if "satellite_id" in data.model_fields_set]
+        previous_satellite_ids = (
+            cls._satellite_ids(session, moved, column) if moved else set()
+        )
+        objs, missing = super().bulk_update(session, items, commit=False, column=column)
+        moved = set(moved)
+        cls._flush_and_refresh_current(
+            session,
+            previous_satellite_ids | {obj.satellite_id for obj in objs},
+            [obj.id for obj in objs if getattr(obj, column) in moved],
+        )
+        if commit:
+            session.commit()
+        return objs, missing
+
+    @classmethod
+    def bulk_remove(
+        cls,
+        session: Session,
+        ids: list[Any],
+        *,
+        commit: bool = True,
+        column: str = "id",
+    ) -> list[Any]:
+        return [key for key, _ in cls._remove_returning(session, ids, commit, column)]
+
+    @classmethod
+    def _remove_returning(
+        cls, session: Session, ids: list[Any], commit: bool, column: str
+    ) -> list[tuple[Any, int]]:
+        """
+        Deletes the given TLEs with one DELETE ... RETURNING their satellites,
+        then repoints current_tles for those satellites.
+
+        Returns:
+            list[tuple[Any, int]]: (key, satellite_id) of each deleted TLE.
+        """
+        col = cls._column(column)
+        try:
+            rows = session.execute(
+                delete(TLE).where(col.in_(ids)).returning(col, TLE.satellite_id)
+            ).all()
+            cls.refresh_current(session, {satellite_id for _, satellite_id in rows})
+            if commit:
+                session.commit()
+            return rows
+        except IntegrityError as e:
+            session.rollback()
+            raise IntegrityConflictException(str(e)) from e
+        except Exception as e:
+            session.rollback()
+            raise CrudException(f"Delete failed: {e}") from e
 
-TLERepo = AbstractRepository(TLE)
+    @classmethod
+    def _satellite_ids(cls, session: Session, ids: list[Any], column: str) -> set[int]:
+        return set(
+            session.execute(
+                select(TLE.satellite_id).where(cls._column(column).in_(ids)).distinct()
+            ).scalars()
+        )
@@ -1,20 +1,38 @@
 # apps/api/app/routers/router_factory.py
-from typing import Callable, Optional, Type, List, TypeVar
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from typing import Any, Callable, Optional, Sequence, Type, List, TypeVar
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError, create_model
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.repositories.abstract import (
     NotFoundException,
     IntegrityConflictException,
     CrudException,
+    FILTER_OPERATORS,
 )
+from app.schemas.bulk import BulkDeleteResult, BulkItemError, BulkUpdateResult
+from app.utils.pagination import decode_cursor, encode_cursor
 
 CreateSchema = TypeVar("CreateSchema", bound=BaseModel)
 UpdateSchema = TypeVar("UpdateSchema", bound=BaseModel)
 ReadSchema = TypeVar("ReadSchema", bound=BaseModel)
 
+LIST_PARAMS = {"limit", "offset", "after", "fields", "count", "sort"}
+MAX_IN_VALUES = 1000
+MAX_BULK_ITEMS = 1000
+
 
 def RouterFactory(
     *,
@@ -26,10 +44,83 @@ def RouterFactory(
     repo,  # AbstractRepository(model) instance
     pk_field: str = "id",
     extra_routes: Optional[Callable[[APIRouter], None]] = None,
+    on_item_changed: Optional[Callable[[Any], None]] = None,
+    filterable: Sequence[str] = (),
+    sortable: Sequence[str] = (),
 ) -> APIRouter:
     """
     Minimal, safe CRUD router for POC: list (pagination), get, create, update, delete.
+
+    The list route pages by offset or, for deep pages, by keyset: it sets an
+    X-Next-Cursor header to pass back as after while more rows remain. fields
+    restricts the returned columns, and X-Total-Count is only computed when
+    count is requested.
+
+    filterable columns can be filtered on with field=value, field__in=a,b and
+    field__gt/gte/lt/lte=value query parameters, and sortable columns with
+    sort=field or sort=-field (descending). Both must be indexed, which is
+    checked when the router is built, so every list query stays an index scan.
+
+    Bulk routes (POST /bulk, PATCH /bulk, POST /bulk/delete) run one set-based
+    statement per request in a single transaction. Ids that do not exist or
+    repeat are reported per item; a constraint violation rejects the batch.
+
+    on_item_changed is called with the primary key after a successful update or
+    delete, e.g. to invalidate in-memory caches derived from the row.
     """
+    unindexed = (set(filterable) | set(sortable)) - repo.indexed_columns()
+    if unindexed:
+        raise ValueError(f"{name}: no index on list columns {sorted(unindexed)}")
+    columns = repo.model.__table__.columns
+    nullable = [c for c in sortable if columns[c].nullable]
+    if nullable:
+        raise ValueError(f"{name}: cannot sort (keyset) on nullable {nullable}")
+    sortable = {pk_field, *sortable}
+    adapters = {
+        c: TypeAdapter(columns[c].type.python_type) for c in {*filterable, *sortable}
+    }
+
+    def parse_filters(request: Request) -> list[tuple[str, str, Any]]:
+        filters = []
+        for param, raw in request.query_params.multi_items():
+            if param in LIST_PARAMS:
+                continue
+            field, _, op = param.partition("__")
+            op = op or "eq"
+            if field not in filterable or op not in FILTER_OPERATORS:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Unsupported filter {param}; filterable: {list(filterable)}",
+                )
+            values = raw.split(",") if op == "in" else [raw]
+            if len(values) > MAX_IN_VALUES:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"{param} accepts at most {MAX_IN_VALUES} values",
+                )
+            try:
+                values = [adapters[field].validate_python(v) for v in values]
+            except ValidationError as e:
+                raise HTTPException(
+                    status_code=400, detail=f"Invalid value for {param}: {e}"
+                )
+            filters.append((field, op, values if op == "in" else values[0]))
+        return filters
+
+    bulk_update_schema = create_model(
+        f"Bulk{update_schema.__name__}",
+        __base__=update_schema,
+        **{pk_field: (pk_type, ...)},
+    )
+
+    def unique_ids(ids: list) -> tuple[list, list[BulkItemError]]:
+        seen, errors = set(), []
+        for index, id_ in enumerate(ids):
+            if id_ in seen:
+                errors.append(BulkItemError(index=index, id=id_, detail="Duplicate id"))
+            seen.add(id_)
+        return list(dict.fromkeys(ids)), errors
+
     tag = name.capitalize()
     router = APIRouter(prefix=f"/{name}", tags=[tag])
 
@@ -37,22 +128,168 @@ def RouterFactory(
         extra_routes(router)
 
     @router.get("/", response_model=List[read_schema], response_model_exclude_none=True)
-    def list_items(
-        db: Session = Depends(get_db),
+    async def list_items(
+        request: Request,
+        response: Response,
+        db: AsyncSession = Depends(get_async_db),
         limit: int = Query(100, ge=1, le=1000),
         offset: int = Query(0, ge=0),
+        after: Optional[str] = Query(
+            None, description="X-Next-Cursor header of the previous page."
+        ),
+        fields: Optional[str] = Query(
+            None, description="Comma-separated fields to return (default: all)."
+        ),
+        count: bool = Query(False, description="Return X-Total-Count (slower)."),
+        sort: Optional[str] = Query(
+            None,
+            description=f"One of {sorted(sortable)}; prefix with - for descending.",
+        ),
+    ):
+        if fields:
+            fields = [f.strip() for f in fields.split(",") if f.strip()]
+            unknown = set(fields) - set(read_schema.model_fields)
+            if unknown:
+                raise HTTPException(
+                    status_code=400, detail=f"Unknown fields: {sorted(unknown)}"
+                )
+        if after and offset:
+            raise HTTPException(
+                status_code=400, detail="Use either offset or after, not both."
+            )
+        filters = parse_filters(request)
+        descending = bool(sort) and sort.startswith("-")
+        order_by = sort.lstrip("-") if sort else pk_field
+        if order_by not in sortable:
+            raise HTTPException(status_code=400, detail=f"Cannot sort by {order_by}")
+        cursor_fields = [order_by, pk_field] if order_by != pk_field else [pk_field]
+        after_key = None
+        if after:
+            try:
+                types = [columns[f].type.python_type for f in cursor_fields]
+                after_key = decode_cursor(after, *types)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            if len(after_key) == 1:
+                after_key = after_key[0]
+
+        try:
+            rows = await repo.list_all_async(
+                db,
+                limit=limit + 1,
+                offset=offset or None,
+                after=after_key,
+                columns=fields,
+                column=pk_field,
+                filters=filters,
+                order_by=order_by,
+                descending=descending,
+            )
+            headers = {}
+            if count:
+                headers["X-Total-Count"] = str(
+                    await repo.count_all_async(db, filters=filters)
+                )
+        except CrudException as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            key = [last[f] if fields else getattr(last, f) for f in cursor_fields]
+            headers["X-Next-Cursor"] = encode_cursor(*key)
+
+        if fields:
+            # Partial rows do not validate against read_schema
+            return JSONResponse(
+                jsonable_encoder([dict(row) for row in rows]), headers=headers
+            )
+        response.headers.update(headers)
+        return rows
+
+    @router.post(
+        "/bulk",
+        response_model=List[read_schema],
+        response_model_exclude_none=True,
+        status_code=status.HTTP_201_CREATED,
+    )
+    async def create_items(
+        payload: List[create_schema] = Body(..., max_length=MAX_BULK_ITEMS),
+        db: AsyncSession = Depends(get_async_db),
     ):
         try:
-            return repo.list_all(session=db, limit=limit, offset=offset)
+            return await repo.bulk_create_async(db, payload)
+        except IntegrityConflictException as e:
+            raise HTTPException(status_code=409, detail=str(e))
         except CrudException as e:
             raise HTTPException(status_code=400, detail=str(e))
 
+    @router.patch(
+        "/bulk",
+        response_model=BulkUpdateResult[read_schema],
+        response_model_exclude_none=True,
+    )
+    async def update_items(
+        payload: List[bulk_update_schema] = Body(..., max_length=MAX_BULK_ITEMS),
+        db: AsyncSession = Depends(get_async_db),
+    ):
+        ids = [getattr(item, pk_field) for item in payload]
+        _, errors = unique_ids(ids)
+        changes = {}
+        for item in payload:
+            # Keep only the fields the client sent (partial update)
+            changes.setdefault(
+                getattr(item, pk_field),
+                update_schema.model_validate(
+                    item.model_dump(exclude={pk_field}, exclude_unset=True)
+                ),
+            )
+        try:
+            objs, missing = await repo.bulk_update_async(
+                db, list(changes.items()), column=pk_field
+            )
+        except IntegrityConflictException as e:
+            raise HTTPException(status_code=409, detail=str(e))
+        except CrudException as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        errors += [
+            BulkItemError(index=ids.index(id_), id=id_, detail=f"{name} not found")
+            for id_ in missing
+        ]
+        if on_item_changed:
+            for obj in objs:
+                on_item_changed(getattr(obj, pk_field))
+        return {"items": objs, "errors": sorted(errors, key=lambda e: e.index)}
+
+    @router.post("/bulk/delete", response_model=BulkDeleteResult)
+    async def delete_items(
+        ids: List[pk_type] = Body(..., max_length=MAX_BULK_ITEMS),
+        db: AsyncSession = Depends(get_async_db),
+    ):
+        unique, errors = unique_ids(ids)
+        try:
+            deleted = await repo.bulk_remove_async(db, unique, column=pk_field)
+        except IntegrityConflictException as e:
+            raise HTTPException(status_code=409, detail=str(e))
+        except CrudException as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        found = set(deleted)
+        errors += [
+            BulkItemError(index=ids.index(id_), id=id_, detail=f"{name} not found")
+            for id_ in unique
+            if id_ not in found
+        ]
+        if on_item_changed:
+            for id_ in deleted:
+                on_item_changed(id_)
+        return {"deleted": deleted, "errors": sorted(errors, key=lambda e: e.index)}
+
     @router.get(
         "/{item_id}", response_model=read_schema, response_model_exclude_none=True
     )
-    def get_item(item_id: pk_type, db: Session = Depends(get_db)):
+    async def get_item(item_id: pk_type, db: AsyncSession = Depends(get_async_db)):
         try:
-            return repo.get_one_by_id(db, item_id, column=pk_field)
+            return await repo.get_one_by_id_async(db, item_id, column=pk_field)
         except NotFoundException as e:
             raise HTTPException(status_code=404, detail=str(e))
         except CrudException as e:
@@ -64,9 +301,11 @@ def RouterFactory(
         response_model_exclude_none=True,
         status_code=status.HTTP_201_CREATED,
     )
-    def create_item(payload: create_schema, db: Session = Depends(get_db)):
+    async def create_item(
+        payload: create_schema, db: AsyncSession = Depends(get_async_db)
+    ):
         try:
-            return repo.create(db, payload)
+            return await repo.create_async(db, payload)
         except IntegrityConflictException as e:
             raise HTTPException(status_code=409, detail=str(e))
         except CrudException as e:
@@ -75,25 +314,32 @@ def RouterFactory(
     @router.put(
         "/{item_id}", response_model=read_schema, response_model_exclude_none=True
     )
-    def update_item(
-        item_id: pk_type, payload: update_schema, db: Session = Depends(get_db)
+    async def update_item(
+        item_id: pk_type,
+        payload: update_schema,
+        db: AsyncSession = Depends(get_async_db),
     ):
         try:
-            return repo.update_by_id(db, item_id, payload, column=pk_field)
+            obj = await repo.update_by_id_async(db, item_id, payload, column=pk_field)
         except NotFoundException as e:
             raise HTTPException(status_code=404, detail=str(e))
         except IntegrityConflictException as e:
             raise HTTPException(status_code=409, detail=str(e))
         except CrudException as e:
             raise HTTPException(status_code=400, detail=str(e))
+        if on_item_changed:
+            on_item_changed(item_id)
+        return obj
 
     @router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
-    def delete_item(item_id: pk_type, db: Session = Depends(get_db)):
+    async def delete_item(item_id: pk_type, db: AsyncSession = Depends(get_async_db)):
         try:
-            rows = repo.remove_by_id(db, item_id, column=pk_field)
+            rows = await repo.remove_by_id_async(db, item_id, column=pk_field)
             if rows == 0:
                 raise HTTPException(status_code=404, detail=f"{name} not found")
         except CrudException as e:
             raise HTTPException(status_code=400, detail=str(e))
+        if on_item_changed:
+            on_item_changed(item_id)
 
     return router
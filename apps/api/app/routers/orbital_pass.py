@@ -1,27 +1,178 @@
-from fastapi import APIRouter, Body, Depends, HTTPException
+import asyncio
+import json
+from datetime import datetime
+from typing import Awaitable, Callable, Literal, Optional
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from geoalchemy2.shape import to_shape
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.db.session import get_db
 from app.models.tle import TLE
 from app.models.aoi import AOI
 from app.models.satellite import Satellite
-from app.schemas.orbital_pass import PassComputeRequest, PassComputeResult
-from app.utils.pass_engine import compute_passes_over_aoi
-from geoalchemy2.shape import from_shape
-from shapely.geometry import LineString
-from app.models.orbital_pass import OrbitalPass
+from app.schemas.orbital_pass import (
+    OrbitalPassPage,
+    PassBatchComputeRequest,
+    PassBatchResult,
+    PassComputeRequest,
+    PassComputeResult,
+    PassVisibleAOIsRequest,
+    ReadOrbitalPass,
+    TimeWindow,
+    TrackOptions,
+)
+from app.utils.compute_pool import (
+    compute_passes_batch_async,
+    compute_passes_over_aoi_async,
+    run_in_pool,
+    satellite_cache_stats,
+    to_record,
+)
+from app.utils.pass_cache import assign_to_segments, uncovered_intervals
+from app.utils.pass_engine import (
+    ground_track_envelopes,
+    pad_segments,
+    segment_window_by_epoch,
+)
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.track import apply_track_options, geometry_to_track_geojson
+from shapely.geometry import box, shape
+from app.repositories.aoi import AOIRepo
+from app.repositories.orbital_pass import OrbitalPassRepo
+from app.repositories.tle import TLERepo
+
+# Batch and visibility computations scan a fixed grid, like search_mode="sampled"
+BATCH_SEARCH_MODE = "sampled"
 
 
 orbital_pass_router = APIRouter(prefix="/passes", tags=["orbital_passes"])
 
 
-@orbital_pass_router.post("/compute", response_model=list[PassComputeResult])
-def compute_passes(
-    req: PassComputeRequest = Body(...),
+def store_passes(
+    db: Session,
+    tle: TLE,
+    aoi_id: int,
+    min_elevation_deg,
+    search_mode: str,
+    window,
+    passes,
+):
+    """
+    Bulk-inserts the passes computed for one (TLE, AOI) pair over window and
+    records the window as covered for the pass cache. Does not commit.
+    """
+    OrbitalPassRepo.record_coverage(
+        db, tle.id, aoi_id, min_elevation_deg, search_mode, window.start, window.end
+    )
+    OrbitalPassRepo.bulk_insert(
+        db, tle.satellite_id, aoi_id, tle.id, min_elevation_deg, search_mode, passes
+    )
+
+
+def parse_spatial_filter(bbox: Optional[str], geometry: Optional[str]) -> list:
+    """
+    Shapely geometries of the bbox ("xmin,ymin,xmax,ymax", split in two when
+    xmin > xmax crosses the antimeridian) and GeoJSON geometry query filters.
+    """
+    geometries = []
+    try:
+        if bbox:
+            xmin, ymin, xmax, ymax = (float(v) for v in bbox.split(","))
+            if xmin > xmax:
+                geometries += [
+                    box(xmin, ymin, 180.0, ymax),
+                    box(-180.0, ymin, xmax, ymax),
+                ]
+            else:
+                geometries.append(box(xmin, ymin, xmax, ymax))
+        if geometry:
+            geometries.append(shape(json.loads(geometry)))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Invalid spatial filter: {e}")
+    return geometries
+
+
+@orbital_pass_router.get("/", response_model=OrbitalPassPage)
+def list_passes(
+    satellite_id: Optional[list[int]] = Query(None),
+    aoi_id: Optional[list[int]] = Query(None),
+    start: Optional[datetime] = Query(None, description="Passes ending after this."),
+    end: Optional[datetime] = Query(None, description="Passes starting before this."),
+    min_max_elevation_deg: Optional[float] = Query(None, ge=0, le=90),
+    min_elevation_deg: Optional[float] = Query(None, ge=0, le=90),
+    search_mode: Optional[Literal["adaptive", "sampled"]] = Query(None),
+    bbox: Optional[str] = Query(
+        None, description="xmin,ymin,xmax,ymax (EPSG:4326) the track intersects."
+    ),
+    geometry: Optional[str] = Query(
+        None, description="GeoJSON geometry (EPSG:4326) the track intersects."
+    ),
+    include_track: bool = True,
+    after: Optional[str] = Query(None, description="next_cursor of the previous page."),
+    limit: int = Query(100, ge=1, le=1000),
     db: Session = Depends(get_db),
 ):
+    """Stored passes, filtered and keyset-paginated by (start_time, id)."""
+    try:
+        after_key = decode_cursor(after, datetime, int) if after else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    rows = OrbitalPassRepo.search(
+        db,
+        satellite_ids=satellite_id,
+        aoi_ids=aoi_id,
+        start=start,
+        end=end,
+        min_max_elevation_deg=min_max_elevation_deg,
+        min_elevation_deg=min_elevation_deg,
+        search_mode=search_mode,
+        intersects=parse_spatial_filter(bbox, geometry),
+        after=after_key,
+        limit=limit + 1,
+    )
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].start_time, rows[-1].id)
+
+    items = [
+        ReadOrbitalPass(
+            id=row.id,
+            satellite_id=row.satellite_id,
+            aoi_id=row.aoi_id,
+            tle_id=row.tle_id,
+            start_time=row.start_time,
+            end_time=row.end_time,
+            max_elevation_deg=row.max_elevation_deg,
+            max_elevation_time=row.max_elevation_time,
+            min_elevation_deg=row.min_elevation_deg,
+            search_mode=row.search_mode,
+            track_geojson=(
+                geometry_to_track_geojson(to_shape(row.track_geom))
+                if include_track
+                else None
+            ),
+        )
+        for row in rows
+    ]
+    return OrbitalPassPage(items=items, next_cursor=next_cursor)
+
+
+@orbital_pass_router.get("/cache", response_model=dict)
+def get_satellite_cache_stats():
+    """
+    Hit/miss counters of the in-memory EarthSatellite caches, summed over the
+    API process and its compute workers.
+    """
+    return satellite_cache_stats()
+
+
+def load_compute_inputs(db: Session, req: PassComputeRequest):
     # 1. Get satellite
     sat = db.execute(
         select(Satellite).where(Satellite.id == req.satellite_id)
@@ -29,11 +180,9 @@ def compute_passes(
     if not sat:
         raise HTTPException(status_code=404, detail="Satellite not found")
 
-    # 2. Get latest TLE for this satellite
-    tle = db.execute(
-        select(TLE).where(TLE.satellite_id == sat.id).order_by(TLE.epoch_utc.desc())
-    ).scalar_one_or_none()
-    if not tle:
+    # 2. Get the TLEs whose epochs are nearest to the window
+    tles = TLERepo.covering_window(db, sat.id, req.window.start, req.window.end)
+    if not tles:
         raise HTTPException(
             status_code=404, detail="No TLEs available for this satellite"
         )
@@ -44,34 +193,310 @@ def compute_passes(
         raise HTTPException(status_code=404, detail="AOI not found")
     shapely_geom = to_shape(aoi.geometry)  # returns a Shapely Polygon/MultiPolygon
 
-    # 4. Compute passes
-    try:
-        passes = compute_passes_over_aoi(
-            tle=tle,
-            aoi_geometry=shapely_geom,
+    return tles, shapely_geom
+
+
+def load_batch_inputs(db: Session, req: PassBatchComputeRequest):
+    # 1. Resolve satellites and AOIs ("all" or explicit ids)
+    sat_stmt = select(Satellite.id)
+    if req.satellite_ids != "all":
+        sat_stmt = sat_stmt.where(Satellite.id.in_(req.satellite_ids))
+    sat_ids = set(db.execute(sat_stmt).scalars())
+    if req.satellite_ids != "all" and sat_ids != set(req.satellite_ids):
+        missing = sorted(set(req.satellite_ids) - sat_ids)
+        raise HTTPException(status_code=404, detail=f"Satellites not found: {missing}")
+
+    aoi_stmt = select(AOI).order_by(AOI.id)
+    if req.aoi_ids != "all":
+        aoi_stmt = aoi_stmt.where(AOI.id.in_(req.aoi_ids))
+    aois = db.execute(aoi_stmt).scalars().all()
+    if req.aoi_ids != "all" and len(aois) != len(set(req.aoi_ids)):
+        missing = sorted(set(req.aoi_ids) - {a.id for a in aois})
+        raise HTTPException(status_code=404, detail=f"AOIs not found: {missing}")
+
+    # 2. Latest TLE of every satellite in a single query (satellites without
+    #    TLEs are skipped)
+    tles = TLERepo.latest_for_satellites(db, sat_ids)
+
+    return tles, aois
+
+
+def store_batch_results(
+    db: Session,
+    tles,
+    aois,
+    min_elevation_deg,
+    window,
+    passes,
+    store: bool = True,
+    track: Optional[TrackOptions] = None,
+):
+    results, groups = [], []
+    for tle, sat_passes in zip(tles, passes):
+        for aoi, pair_passes in zip(aois, sat_passes):
+            # Stored tracks stay at full resolution: the pass cache is shared
+            # by requests with any track options
+            if store:
+                OrbitalPassRepo.record_coverage(
+                    db,
+                    tle.id,
+                    aoi.id,
+                    min_elevation_deg,
+                    BATCH_SEARCH_MODE,
+                    window.start,
+                    window.end,
+                )
+                groups.append(
+                    (
+                        tle.satellite_id,
+                        aoi.id,
+                        tle.id,
+                        min_elevation_deg,
+                        BATCH_SEARCH_MODE,
+                        pair_passes,
+                    )
+                )
+            results.append(
+                PassBatchResult(
+                    satellite_id=tle.satellite_id,
+                    aoi_id=aoi.id,
+                    tle_id=tle.id,
+                    passes=(
+                        apply_track_options(pair_passes, track)
+                        if track is not None
+                        else pair_passes
+                    ),
+                )
+            )
+    # All passes of the batch in one COPY
+    OrbitalPassRepo.bulk_insert_many(db, groups)
+    db.commit()
+    return results
+
+
+async def run_compute(db: Session, req: PassComputeRequest) -> list[PassComputeResult]:
+    """
+    Loads inputs and returns the passes of a single request. The window is split
+    between the TLEs nearest to it; per segment, stored passes are read for the
+    already computed parts and only the uncovered sub-intervals are computed (and
+    stored). Segments are searched past their shared boundaries and every pass
+    is kept in the segment holding its culmination.
+    """
+    tles, shapely_geom = await run_in_threadpool(load_compute_inputs, db, req)
+
+    segments = segment_window_by_epoch(tles, req.window)
+    search_ranges = pad_segments(segments)
+    if req.coverage_mode == "footprint":
+        # Footprint passes bypass the pass cache, which is keyed by elevation
+        found = await asyncio.gather(
+            *(
+                compute_passes_over_aoi_async(
+                    tle=tle,
+                    aoi_geometry=shapely_geom,
+                    window=search,
+                    coverage_mode=req.coverage_mode,
+                    off_nadir_deg=req.off_nadir_deg,
+                )
+                for (tle, _), search in zip(segments, search_ranges)
+            )
+        )
+        return apply_track_options(assign_to_segments(segments, found), req.track)
+
+    # 4. Look up stored passes and the uncovered parts of every search range
+    found, work = [], []
+    for i, ((tle, _), search) in enumerate(zip(segments, search_ranges)):
+        covered, segment_cached = await run_in_threadpool(
+            OrbitalPassRepo.find_cached,
+            db,
+            tle.id,
+            req.aoi_id,
+            req.min_elevation_deg,
+            req.search_mode,
+            search.start,
+            search.end,
+        )
+        found.append(segment_cached)
+        work += [
+            (i, tle, TimeWindow(start=start, end=end))
+            for start, end in uncovered_intervals(search.start, search.end, covered)
+        ]
+
+    # 5. Compute passes for the gaps, each with its segment's TLE
+    if work:
+        computed = await asyncio.gather(
+            *(
+                compute_passes_over_aoi_async(
+                    tle=tle,
+                    aoi_geometry=shapely_geom,
+                    window=gap,
+                    min_elevation_deg=req.min_elevation_deg,
+                    search_mode=req.search_mode,
+                )
+                for _, tle, gap in work
+            )
+        )
+
+        # Passes are stored at full resolution; track options only shape the
+        # response
+        for (i, tle, gap), passes in zip(work, computed):
+            await run_in_threadpool(
+                store_passes,
+                db,
+                tle,
+                req.aoi_id,
+                req.min_elevation_deg,
+                req.search_mode,
+                gap,
+                passes,
+            )
+            found[i] += passes
+        await run_in_threadpool(db.commit)
+    return apply_track_options(assign_to_segments(segments, found), req.track)
+
+
+async def run_batch(
+    db: Session,
+    req: PassBatchComputeRequest,
+    on_progress: Optional[Callable[[float], Awaitable[None]]] = None,
+) -> list[PassBatchResult]:
+    """
+    Loads inputs, computes and stores the passes of a batch request.
+
+    When on_progress is given, satellites are computed in groups of
+    settings.pass_compute_workers and on_progress is awaited with the completed
+    fraction after each group.
+    """
+    tles, aois = await run_in_threadpool(load_batch_inputs, db, req)
+    aoi_geometries = [to_shape(a.geometry) for a in aois]
+
+    # 3. Compute and store passes for every (satellite, AOI) pair
+    group = max(1, settings.pass_compute_workers) if on_progress else len(tles)
+    passes = []
+    for first in range(0, len(tles), max(1, group)):
+        passes += await compute_passes_batch_async(
+            tles=tles[first : first + group],
+            aoi_geometries=aoi_geometries,
             window=req.window,
             min_elevation_deg=req.min_elevation_deg,
+            coverage_mode=req.coverage_mode,
+            off_nadir_deg=req.off_nadir_deg,
         )
+        if on_progress:
+            await on_progress(len(passes) / len(tles))
 
-        for p in passes:
-            track_line = LineString(p.track_geojson["coordinates"])
-
-            pass_record = OrbitalPass(
-                satellite_id=req.satellite_id,
-                aoi_id=req.aoi_id,
-                tle_id=tle.id,
-                start_time=p.start_time,
-                end_time=p.end_time,
-                max_elevation_deg=p.max_elevation_deg,
-                max_elevation_time=p.max_elevation_time,
-                min_elevation_deg=req.min_elevation_deg,
-                track_geom=from_shape(track_line, srid=4326),
-            )
+    # Footprint passes are not stored: the pass cache is keyed by elevation
+    return await run_in_threadpool(
+        store_batch_results,
+        db,
+        tles,
+        aois,
+        req.min_elevation_deg,
+        req.window,
+        passes,
+        store=req.coverage_mode == "centroid",
+        track=req.track,
+    )
+
+
+def load_satellite_tle(db: Session, satellite_id: int) -> TLE:
+    tle = next(iter(TLERepo.latest_for_satellites(db, [satellite_id])), None)
+    if not tle:
+        if db.get(Satellite, satellite_id) is None:
+            raise HTTPException(status_code=404, detail="Satellite not found")
+        raise HTTPException(
+            status_code=404, detail="No TLEs available for this satellite"
+        )
+    return tle
+
+
+async def run_visible(
+    db: Session, req: PassVisibleAOIsRequest
+) -> list[PassBatchResult]:
+    """
+    Computes and stores the passes of one satellite over every AOI it can see.
+
+    The ground track is propagated once and buffered by the visibility radius
+    for the threshold elevation (or the footprint radius); only AOIs overlapping
+    the buffer, found through the GiST index on aois.geometry, go through the
+    precise pass computation.
+    """
+    tle = await run_in_threadpool(load_satellite_tle, db, req.satellite_id)
+
+    # 1. Buffered ground track as lon/lat rectangles
+    envelopes = await run_in_pool(
+        ground_track_envelopes,
+        to_record(tle),
+        req.window,
+        min_elevation_deg=req.min_elevation_deg,
+        coverage_mode=req.coverage_mode,
+        off_nadir_deg=req.off_nadir_deg,
+    )
+
+    # 2. Candidate AOIs from the spatial index
+    aois = await run_in_threadpool(AOIRepo.overlapping_envelopes, db, envelopes)
+    if not aois:
+        return []
 
-            db.add(pass_record)
+    # 3. Precise passes over the candidates only
+    passes = await compute_passes_batch_async(
+        tles=[tle],
+        aoi_geometries=[to_shape(a.geometry) for a in aois],
+        window=req.window,
+        min_elevation_deg=req.min_elevation_deg,
+        coverage_mode=req.coverage_mode,
+        off_nadir_deg=req.off_nadir_deg,
+    )
+    results = await run_in_threadpool(
+        store_batch_results,
+        db,
+        [tle],
+        aois,
+        req.min_elevation_deg,
+        req.window,
+        passes,
+        store=req.coverage_mode == "centroid",
+        track=req.track,
+    )
+    return [r for r in results if r.passes]
 
-        db.commit()
+
+# Pass routes are async: database work runs on the threadpool and SGP4
+# propagation in the compute process pool, so the event loop stays free.
+@orbital_pass_router.post("/compute", response_model=list[PassComputeResult])
+async def compute_passes(
+    req: PassComputeRequest = Body(...),
+    db: Session = Depends(get_db),
+):
+    try:
+        return await run_compute(db, req)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Pass computation failed: {e}")
 
-    return passes
+
+@orbital_pass_router.post("/compute/batch", response_model=list[PassBatchResult])
+async def compute_passes_batch_route(
+    req: PassBatchComputeRequest = Body(...),
+    db: Session = Depends(get_db),
+):
+    try:
+        return await run_batch(db, req)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Pass computation failed: {e}")
+
+
+@orbital_pass_router.post("/compute/visible", response_model=list[PassBatchResult])
+async def compute_visible_passes(
+    req: PassVisibleAOIsRequest = Body(...),
+    db: Session = Depends(get_db),
+):
+    """Passes of one satellite over all AOIs it can see during the window."""
+    try:
+        return await run_visible(db, req)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Pass computation failed: {e}")
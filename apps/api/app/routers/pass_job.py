@@ -0,0 +1,243 @@
+import asyncio
+import hashlib
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from fastapi import APIRouter, Body, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import SessionLocal, get_db
+from app.models.pass_job import PassJob
+from app.routers.orbital_pass import run_batch, run_compute
+from app.schemas.orbital_pass import PassBatchComputeRequest, PassComputeRequest
+from app.schemas.pass_job import PassJobResult, ReadPassJob
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = ("queued", "running")
+
+pass_job_router = APIRouter(prefix="/passes/jobs", tags=["pass_jobs"])
+
+
+def request_hash(kind: str, request: dict) -> str:
+    """Stable digest of a job request; batch id lists are order-insensitive."""
+    if kind == "batch":
+        request = {
+            k: sorted(set(v)) if isinstance(v, list) else v for k, v in request.items()
+        }
+    payload = json.dumps({"kind": kind, "request": request}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def enqueue_job(db: Session, kind: str, request: dict) -> PassJob:
+    """Queues a job, or returns the active job already queued for the same request."""
+    digest = request_hash(kind, request)
+    active = select(PassJob).where(
+        PassJob.request_hash == digest, PassJob.status.in_(ACTIVE_STATUSES)
+    )
+    job = db.execute(active).scalar_one_or_none()
+    if job:
+        return job
+
+    job = PassJob(
+        kind=kind, request=request, request_hash=digest, status="queued", progress=0.0
+    )
+    db.add(job)
+    try:
+        db.commit()
+    except IntegrityError:
+        # Identical request enqueued concurrently (uq_pass_jobs_active_request)
+        db.rollback()
+        return db.execute(active).scalar_one()
+    db.refresh(job)
+    return job
+
+
+@pass_job_router.post(
+    "/", response_model=ReadPassJob, status_code=status.HTTP_202_ACCEPTED
+)
+def submit_pass_job(
+    req: PassComputeRequest = Body(...),
+    db: Session = Depends(get_db),
+):
+    return enqueue_job(db, "single", req.model_dump(mode="json"))
+
+
+@pass_job_router.post(
+    "/batch", response_model=ReadPassJob, status_code=status.HTTP_202_ACCEPTED
+)
+def submit_pass_batch_job(
+    req: PassBatchComputeRequest = Body(...),
+    db: Session = Depends(get_db),
+):
+    return enqueue_job(db, "batch", req.model_dump(mode="json"))
+
+
+@pass_job_router.get("/{job_id}", response_model=ReadPassJob)
+def get_pass_job(job_id: int, db: Session = Depends(get_db)):
+    job = db.get(PassJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@pass_job_router.get("/{job_id}/result", response_model=PassJobResult)
+def get_pass_job_result(job_id: int, db: Session = Depends(get_db)):
+    job = db.get(PassJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status == "failed":
+        raise HTTPException(status_code=409, detail=f"Job failed: {job.error}")
+    if job.status != "succeeded":
+        raise HTTPException(
+            status_code=409,
+            detail=f"Job is {job.status} ({job.progress:.0%} done)",
+        )
+    return PassJobResult(id=job.id, kind=job.kind, result=job.result)
+
+
+# ---- Worker ----
+
+
+def claim_next_job() -> Optional[tuple[int, str, dict, datetime]]:
+    """
+    Marks the oldest queued job (or a stale running one) as running.
+
+    FOR UPDATE SKIP LOCKED lets several API processes poll the same table without
+    claiming the same job twice. Running jobs heartbeat (see run_job), so only
+    jobs of a dead worker go stale.
+
+    Returns:
+        tuple | None: Job id, kind, request and the new started_at, which is the
+        lease token of this claim (see set_job_state).
+    """
+    stale_before = func.now() - timedelta(seconds=settings.pass_job_stale_seconds)
+    with SessionLocal() as db:
+        job = db.execute(
+            select(PassJob)
+            .where(
+                or_(
+                    PassJob.status == "queued",
+                    and_(
+                        PassJob.status == "running", PassJob.updated_at < stale_before
+                    ),
+                )
+            )
+            .order_by(PassJob.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        ).scalar_one_or_none()
+        if job is None:
+            return None
+        job.status = "running"
+        job.progress = 0.0
+        job.started_at = func.now()
+        job.updated_at = func.now()
+        db.flush()
+        db.refresh(job, ["started_at"])
+        claimed = (job.id, job.kind, job.request, job.started_at)
+        db.commit()
+        return claimed
+
+
+def set_job_state(job_id: int, lease: datetime, **values) -> bool:
+    """
+    Updates a job claimed with the given lease and touches updated_at.
+
+    A job re-claimed by another worker has a new started_at, so writes from the
+    previous claim are dropped.
+
+    Returns:
+        bool: False if the lease was lost.
+    """
+    with SessionLocal() as db:
+        result = db.execute(
+            update(PassJob)
+            .where(PassJob.id == job_id, PassJob.started_at == lease)
+            .values(updated_at=func.now(), **values)
+        )
+        db.commit()
+        return result.rowcount > 0
+
+
+async def heartbeat(job_id: int, lease: datetime) -> None:
+    """Touches updated_at of a running job until cancelled or the lease is lost."""
+    while True:
+        await asyncio.sleep(settings.pass_job_heartbeat_seconds)
+        try:
+            if not await run_in_threadpool(set_job_state, job_id, lease):
+                logger.warning("Pass job %s was claimed by another worker", job_id)
+                return
+        except Exception:
+            logger.exception("Heartbeat of pass job %s failed", job_id)
+
+
+async def run_job(job_id: int, kind: str, request: dict, lease: datetime) -> None:
+    async def on_progress(fraction: float):
+        await run_in_threadpool(set_job_state, job_id, lease, progress=fraction)
+
+    db = SessionLocal()
+    beat = asyncio.create_task(heartbeat(job_id, lease))
+    try:
+        if kind == "batch":
+            results = await run_batch(
+                db, PassBatchComputeRequest.model_validate(request), on_progress
+            )
+        else:
+            results = await run_compute(db, PassComputeRequest.model_validate(request))
+        await run_in_threadpool(
+            set_job_state,
+            job_id,
+            lease,
+            status="succeeded",
+            progress=1.0,
+            result=[r.model_dump(mode="json") for r in results],
+            finished_at=func.now(),
+        )
+    except Exception as e:
+        try:
+            await run_in_threadpool(db.rollback)
+            await run_in_threadpool(
+                set_job_state,
+                job_id,
+                lease,
+                status="failed",
+                error=e.detail if isinstance(e, HTTPException) else str(e),
+                finished_at=func.now(),
+            )
+        except Exception:
+            # Left running; the job is re-queued once its heartbeat goes stale
+            logger.exception("Recording the failure of pass job %s failed", job_id)
+    finally:
+        beat.cancel()
+        await run_in_threadpool(db.close)
+
+
+async def job_worker_loop() -> None:
+    while True:
+        try:
+            claimed = await run_in_threadpool(claim_next_job)
+        except Exception:
+            logger.exception("Claiming the next pass job failed")
+            claimed = None
+        if claimed is None:
+            await asyncio.sleep(settings.pass_job_poll_seconds)
+            continue
+        try:
+            await run_job(*claimed)
+        except Exception:
+            logger.exception("Pass job %s failed unexpectedly", claimed[0])
+
+
+def start_job_workers() -> list[asyncio.Task]:
+    """Starts the local worker loops; call from the application lifespan."""
+    return [
+        asyncio.create_task(job_worker_loop())
+        for _ in range(settings.pass_job_concurrency)
+    ]
@@ -11,4 +11,6 @@ satellite_router: APIRouter = RouterFactory(
     update_schema=UpdateSatellite,
     read_schema=ReadSatellite,
     repo=SatelliteRepo,
+    filterable=("id", "norad_id"),
+    sortable=("norad_id",),
 )
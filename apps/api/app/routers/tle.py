@@ -1,15 +1,74 @@
-from fastapi import APIRouter, Body, Depends, HTTPException
-from sqlalchemy.exc import IntegrityError
+import io
+from itertools import islice
+from typing import Iterable
+
+from fastapi import APIRouter, Body, Depends, File, HTTPException, Query, UploadFile
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 
+from app.core.config import settings
 from app.db.session import get_db
-from app.models.satellite import Satellite
-from app.models.tle import TLE
+from app.repositories.satellite import SatelliteRepo
 from app.repositories.tle import TLERepo
 from app.routers.factory import RouterFactory
 from app.schemas.tle import CreateTLE, ReadTLE, UpdateTLE
-from app.utils.tle_parser import parse_tle_block, validate_tle_checksum
+from app.utils.satellite_cache import satellite_cache
+from app.utils.tle_parser import (
+    TLEBlock,
+    iter_tle_blocks,
+    parse_tle_block,
+    validate_tle_checksums,
+)
+
+
+MAX_REPORTED_ERRORS = 100
+
+
+def build_tle_rows(blocks: Iterable[TLEBlock]) -> tuple[list[dict], list[str]]:
+    """
+    Parses TLE blocks into TLE rows, validating all checksums in one vectorized
+    pass.
+
+    Returns:
+        tuple[list[dict], list[str]]: Parsed rows and one error per invalid block.
+    """
+    parsed_tles, errors = [], []
+    for block in blocks:
+        try:
+            parsed_tles.append(parse_tle_block(block.name, block.line1, block.line2))
+        except Exception as e:
+            errors.append(f"Line {block.line_no}: {e}")
+
+    checksums_ok = validate_tle_checksums(
+        [t["line1"] for t in parsed_tles] + [t["line2"] for t in parsed_tles]
+    ).tolist()
+    for tle_data, ok_l1, ok_l2 in zip(
+        parsed_tles, checksums_ok[: len(parsed_tles)], checksums_ok[len(parsed_tles) :]
+    ):
+        tle_data["checksum_ok_l1"] = ok_l1
+        tle_data["checksum_ok_l2"] = ok_l2
+        # tle_data["source"] Source of the data
+    return parsed_tles, errors
+
+
+def write_tle_batch(db: Session, parsed_tles: list[dict]) -> tuple[int, list[int]]:
+    """
+    Set-based writes: one satellite upsert, one bulk TLE insert that skips
+    (satellite, epoch) pairs already stored and one current_tles refresh.
+    Does not commit.
+
+    Returns:
+        tuple[int, list[int]]: Inserted TLE count and NORAD ids of the batch.
+    """
+    sat_ids = SatelliteRepo.upsert_by_norad(
+        db, {t["satnum"]: t["name"] or f"NORAD {t['satnum']}" for t in parsed_tles}
+    )
+    for tle_data in parsed_tles:
+        tle_data["satellite_id"] = sat_ids[tle_data["satnum"]]
+    inserted = TLERepo.bulk_insert(db, parsed_tles)
+    TLERepo.refresh_current(db, sat_ids.values())
+    return inserted, sorted(sat_ids)
 
 
 def add_ingest_endpoint(router: APIRouter):
@@ -25,43 +84,83 @@ def add_ingest_endpoint(router: APIRouter):
                 detail="TLE input must be groups of 3 lines (name, line1, line2)",
             )
 
-        parsed_tles = []
-        for i in range(0, len(lines), 3):
-            name, line1, line2 = lines[i : i + 3]
-            try:
-                tle_data = parse_tle_block(name, line1, line2)
-            except Exception as e:
-                raise HTTPException(status_code=400, detail=f"Error parsing TLE: {e}")
-
-            sat = (
-                db.query(Satellite)
-                .filter(Satellite.norad_id == tle_data["satnum"])
-                .first()
+        # 1. Parse every block in a single pass
+        parsed_tles, errors = build_tle_rows(
+            TLEBlock(i + 2, *lines[i : i + 3]) for i in range(0, len(lines), 3)
+        )
+        if errors:
+            raise HTTPException(
+                status_code=400, detail=f"Error parsing TLE: {errors[0]}"
             )
-            if not sat:
-                sat = Satellite(norad_id=tle_data["satnum"], name=tle_data["name"])
-                db.add(sat)
-                db.flush()
-
-            tle_data["satellite_id"] = sat.id
-            tle_data["checksum_ok_l1"] = validate_tle_checksum(line1)
-            tle_data["checksum_ok_l2"] = validate_tle_checksum(line2)
-            # tle_data["source"] Source of the data
-            parsed_tles.append(TLE(**tle_data))
 
+        # 2. Bulk writes
         try:
-            db.add_all(parsed_tles)
+            inserted, satellites = write_tle_batch(db, parsed_tles)
             db.commit()
-        except IntegrityError as e:
+        except SQLAlchemyError as e:
             db.rollback()
-            raise HTTPException(
-                status_code=400,
-                detail="One or multiple TLEs message already exist in the database.",
-            )
+            raise HTTPException(status_code=400, detail=f"Error storing TLEs: {e}")
+
+        return {
+            "message": f"{inserted} TLEs ingested successfully.",
+            "inserted": inserted,
+            "skipped": len(parsed_tles) - inserted,
+            "satellites": satellites,
+        }
+
+    @router.post("/ingest/file", status_code=201)
+    def ingest_tles_from_file(
+        file: UploadFile = File(...),
+        batch_size: int = Query(settings.tle_ingest_batch_size, ge=1, le=100_000),
+        db: Session = Depends(get_db),
+    ):
+        """
+        Streams an uploaded catalog (3-line and/or 2-line sets) into the database.
+
+        The file is read line by line and committed every batch_size element
+        sets, so memory stays flat and earlier batches survive bad records,
+        which are skipped and reported.
+        """
+        # Only the first MAX_REPORTED_ERRORS messages are kept, so a file of
+        # garbage cannot grow the response (or memory) without bound
+        errors: list[str] = []
+        batch_errors: list[str] = []
+        inserted = skipped = failed = batches = invalid = 0
+
+        def report_invalid(message: str):
+            nonlocal invalid
+            invalid += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append(message)
+
+        text = io.TextIOWrapper(file.file, encoding="utf-8", errors="replace")
+        blocks = iter_tle_blocks(text, report_invalid)
+        while batch := list(islice(blocks, batch_size)):
+            parsed_tles, batch_invalid = build_tle_rows(batch)
+            for message in batch_invalid:
+                report_invalid(message)
+
+            batches += 1
+            try:
+                batch_inserted, _ = write_tle_batch(db, parsed_tles)
+                db.commit()
+            except SQLAlchemyError as e:
+                db.rollback()
+                failed += len(parsed_tles)
+                if len(batch_errors) < MAX_REPORTED_ERRORS:
+                    batch_errors.append(f"Batch {batches}: {e}")
+                continue
+            inserted += batch_inserted
+            skipped += len(parsed_tles) - batch_inserted
 
         return {
-            "message": f"{len(parsed_tles)} TLEs ingested successfully.",
-            "satellites": [t.satnum for t in parsed_tles],
+            "message": f"{inserted} TLEs ingested successfully.",
+            "inserted": inserted,
+            "skipped": skipped,
+            "failed": failed,
+            "invalid": invalid,
+            "batches": batches,
+            "errors": (batch_errors + errors)[:MAX_REPORTED_ERRORS],
         }
 
 
@@ -73,4 +172,7 @@ tle_router: APIRouter = RouterFactory(
     read_schema=ReadTLE,
     repo=TLERepo(),
     extra_routes=add_ingest_endpoint,
+    on_item_changed=satellite_cache.invalidate,
+    filterable=("id", "satellite_id", "satnum", "epoch_utc"),
+    sortable=("epoch_utc",),
 )
@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+from typing import Any, Generic, TypeVar
+
+ReadSchema = TypeVar("ReadSchema", bound=BaseModel)
+
+
+class BulkItemError(BaseModel):
+    index: int  # position of the item in the request body
+    id: Any = None
+    detail: str
+
+
+class BulkUpdateResult(BaseModel, Generic[ReadSchema]):
+    items: list[ReadSchema]
+    errors: list[BulkItemError] = []
+
+
+class BulkDeleteResult(BaseModel):
+    deleted: list[Any]
+    errors: list[BulkItemError] = []
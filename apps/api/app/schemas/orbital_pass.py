@@ -9,11 +9,57 @@ class TimeWindow(BaseModel):
     end: datetime
 
 
+class TrackOptions(BaseModel):
+    include: bool = Field(
+        default=True,
+        description="False omits ground tracks from the response.",
+    )
+    max_vertices: Optional[int] = Field(
+        default=None,
+        ge=2,
+        description="Decimate each track to at most this many vertices.",
+    )
+    tolerance_deg: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Douglas-Peucker simplification tolerance (degrees).",
+    )
+    precision: Optional[int] = Field(
+        default=None,
+        ge=0,
+        le=12,
+        description="Round track coordinates to this many decimals.",
+    )
+
+
 class PassComputeRequest(BaseModel):
     satellite_id: int
     aoi_id: int
     window: TimeWindow
     min_elevation_deg: float = Field(default=10.0, ge=0, le=90)
+    search_mode: Literal["adaptive", "sampled"] = Field(
+        default="adaptive",
+        description="'adaptive' refines AOS/LOS by root finding, "
+        "'sampled' evaluates a fixed 10 s grid over the whole window.",
+    )
+    coverage_mode: Literal["centroid", "footprint"] = Field(
+        default="centroid",
+        description="'centroid' detects passes by elevation over the AOI centroid, "
+        "'footprint' when the sensor footprint intersects the AOI polygon "
+        "(min_elevation_deg and search_mode are ignored; results are not stored).",
+    )
+    off_nadir_deg: float = Field(
+        default=30.0,
+        gt=0,
+        lt=90,
+        description="Sensor half-angle from nadir (half the swath angle) used by "
+        "the footprint coverage mode.",
+    )
+    track: TrackOptions = Field(
+        default_factory=TrackOptions,
+        description="Resolution of the returned ground tracks; stored passes keep "
+        "full-resolution tracks.",
+    )
 
 
 class PassComputeResult(BaseModel):
@@ -21,4 +67,64 @@ class PassComputeResult(BaseModel):
     end_time: datetime
     max_elevation_deg: float
     max_elevation_time: datetime
-    track_geojson: dict  # Leaflet-ready LineString
+    track_geojson: Optional[dict] = None  # Leaflet-ready LineString
+
+
+class PassBatchComputeRequest(BaseModel):
+    satellite_ids: Union[list[int], Literal["all"]]
+    aoi_ids: Union[list[int], Literal["all"]]
+    window: TimeWindow
+    min_elevation_deg: float = Field(default=10.0, ge=0, le=90)
+    coverage_mode: Literal["centroid", "footprint"] = Field(
+        default="centroid",
+        description="See PassComputeRequest.coverage_mode.",
+    )
+    off_nadir_deg: float = Field(default=30.0, gt=0, lt=90)
+    track: TrackOptions = Field(
+        default_factory=TrackOptions,
+        description="See PassComputeRequest.track.",
+    )
+
+
+class PassVisibleAOIsRequest(BaseModel):
+    satellite_id: int
+    window: TimeWindow
+    min_elevation_deg: float = Field(default=10.0, ge=0, le=90)
+    coverage_mode: Literal["centroid", "footprint"] = Field(
+        default="centroid",
+        description="See PassComputeRequest.coverage_mode.",
+    )
+    off_nadir_deg: float = Field(default=30.0, gt=0, lt=90)
+    track: TrackOptions = Field(
+        default_factory=TrackOptions,
+        description="See PassComputeRequest.track.",
+    )
+
+
+class PassBatchResult(BaseModel):
+    satellite_id: int
+    aoi_id: int
+    tle_id: int
+    passes: list[PassComputeResult]
+
+
+class ReadOrbitalPass(BaseModel):
+    id: int
+    satellite_id: int
+    aoi_id: int
+    tle_id: int
+    start_time: datetime
+    end_time: datetime
+    max_elevation_deg: float
+    max_elevation_time: datetime
+    min_elevation_deg: float
+    search_mode: Literal["adaptive", "sampled"]
+    track_geojson: Optional[dict] = None
+
+
+class OrbitalPassPage(BaseModel):
+    items: list[ReadOrbitalPass]
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Pass as 'after' to fetch the next page; null on the last page.",
+    )
@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Literal, Optional
+
+
+class ReadPassJob(BaseModel):
+    id: int
+    kind: Literal["single", "batch"]
+    status: Literal["queued", "running", "succeeded", "failed"]
+    progress: float
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class PassJobResult(BaseModel):
+    id: int
+    kind: Literal["single", "batch"]
+    result: list  # list[PassComputeResult] or list[PassBatchResult] by kind
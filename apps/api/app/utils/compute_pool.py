@@ -0,0 +1,141 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.utils.pass_engine import compute_passes_batch, compute_passes_over_aoi
+from app.utils.satellite_cache import satellite_cache
+
+_executor: Optional[Executor] = None
+_worker_stats = None  # (hits, misses, size) per worker, in shared memory
+
+
+class TLERecord(NamedTuple):
+    """Picklable subset of a TLE row needed to propagate it in a worker process."""
+
+    id: int
+    name: Optional[str]
+    line1: str
+    line2: str
+
+
+def to_record(tle) -> TLERecord:
+    return TLERecord(id=tle.id, name=tle.name, line1=tle.line1, line2=tle.line2)
+
+
+def get_executor() -> Optional[Executor]:
+    """
+    Lazily creates the process pool used for pass computation.
+
+    Returns None when settings.pass_compute_workers is 0, in which case work runs
+    on the event loop's default thread pool instead.
+    """
+    global _executor, _worker_stats
+    if _executor is None and settings.pass_compute_workers > 0:
+        # spawn: forking a process that already runs threads is unsafe
+        context = multiprocessing.get_context("spawn")
+        _worker_stats = context.Array("q", 3 * settings.pass_compute_workers)
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.pass_compute_workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(_worker_stats, context.Value("i", 0)),
+        )
+    return _executor
+
+
+def _init_worker(stats, next_slot) -> None:
+    """Gives each worker process its own slot of the shared cache counters."""
+    with next_slot.get_lock():
+        slot = next_slot.value
+        next_slot.value += 1
+    satellite_cache.publish_to(stats, slot)
+
+
+def satellite_cache_stats() -> dict:
+    """
+    Counters of the EarthSatellite caches of this process and of every compute
+    worker started so far, summed.
+    """
+    stats = satellite_cache.stats()
+    stats["processes"] = 1
+    if _worker_stats is not None:
+        counters = np.array(_worker_stats[:], dtype=np.int64).reshape(-1, 3)
+        hits, misses, size = counters.sum(axis=0)
+        stats["hits"] += int(hits)
+        stats["misses"] += int(misses)
+        stats["size"] += int(size)
+        stats["maxsize"] *= 1 + len(counters)
+        stats["processes"] += len(counters)
+    return stats
+
+
+def shutdown_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(cancel_futures=True)
+        _executor = None
+
+
+async def run_in_pool(fn, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), partial(fn, *args, **kwargs))
+
+
+async def compute_passes_over_aoi_async(tle, aoi_geometry, window, **kwargs):
+    """Runs compute_passes_over_aoi in the process pool."""
+    return await run_in_pool(
+        compute_passes_over_aoi, to_record(tle), aoi_geometry, window, **kwargs
+    )
+
+
+async def compute_passes_batch_async(tles, aoi_geometries, window, **kwargs):
+    """
+    Runs compute_passes_batch in the process pool, partitioned across workers.
+
+    Work is split along satellites when there are at least as many satellites as
+    workers (each satellite is still propagated only once), otherwise along AOIs.
+    The result keeps the passes[i][j] layout of compute_passes_batch.
+    """
+    records = [to_record(t) for t in tles]
+    parts = max(1, settings.pass_compute_workers)
+    if not records or not aoi_geometries:
+        return [[[] for _ in aoi_geometries] for _ in records]
+
+    if len(records) >= parts or len(aoi_geometries) < 2:
+        chunks = np.array_split(np.arange(len(records)), min(parts, len(records)))
+        partial_results = await asyncio.gather(
+            *(
+                run_in_pool(
+                    compute_passes_batch,
+                    [records[i] for i in chunk],
+                    aoi_geometries,
+                    window,
+                    **kwargs,
+                )
+                for chunk in chunks
+            )
+        )
+        return [sat_passes for part in partial_results for sat_passes in part]
+
+    chunks = np.array_split(np.arange(len(aoi_geometries)), parts)
+    partial_results = await asyncio.gather(
+        *(
+            run_in_pool(
+                compute_passes_batch,
+                records,
+                [aoi_geometries[j] for j in chunk],
+                window,
+                **kwargs,
+            )
+            for chunk in chunks
+        )
+    )
+    return [
+        [aoi_passes for part in partial_results for aoi_passes in part[i]]
+        for i in range(len(records))
+    ]
@@ -0,0 +1,244 @@
+import numpy as np
+import shapely
+from shapely.geometry import shape
+
+EARTH_RADIUS_KM = 6371.0088  # mean radius; footprints are evaluated on a sphere
+
+
+def unit_vectors(lat_deg: np.ndarray, lon_deg: np.ndarray) -> np.ndarray:
+    """
+    Converts latitudes/longitudes (degrees) to unit vectors on the sphere.
+
+    Returns:
+        np.ndarray: Unit vectors, shape (..., 3).
+    """
+    lat, lon = np.radians(lat_deg), np.radians(lon_deg)
+    return np.stack(
+        [np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)], axis=-1
+    )
+
+
+def footprint_half_angle(altitude_km: np.ndarray, off_nadir_deg: float) -> np.ndarray:
+    """
+    Earth central angle covered by a nadir-pointing sensor cone.
+
+    Args:
+        altitude_km (np.ndarray): Satellite altitude above the sphere (km).
+        off_nadir_deg (float): Sensor half-angle from nadir (deg), i.e. half the
+            swath angle.
+
+    Returns:
+        np.ndarray: Footprint radius as an Earth central angle (rad), capped at
+        the horizon when the cone reaches past the limb.
+    """
+    ratio = (EARTH_RADIUS_KM + altitude_km) / EARTH_RADIUS_KM
+    eta = np.radians(off_nadir_deg)
+    sin_incidence = ratio * np.sin(eta)
+    central = np.arcsin(np.clip(sin_incidence, -1.0, 1.0)) - eta
+    horizon = np.arccos(1.0 / ratio)
+    return np.where(sin_incidence < 1.0, central, horizon)
+
+
+def visibility_half_angle(
+    altitude_km: np.ndarray, min_elevation_deg: float
+) -> np.ndarray:
+    """
+    Earth central angle around the sub-satellite point from which the satellite
+    is seen at or above min_elevation_deg.
+
+    Returns:
+        np.ndarray: Visibility radius as an Earth central angle (rad).
+    """
+    ratio = EARTH_RADIUS_KM / (EARTH_RADIUS_KM + altitude_km)
+    elevation = np.radians(min_elevation_deg)
+    return np.arccos(ratio * np.cos(elevation)) - elevation
+
+
+def track_envelopes(
+    lat_deg: np.ndarray,
+    lon_deg: np.ndarray,
+    radius: np.ndarray,
+    points_per_envelope: int = 5,
+) -> list[tuple[float, float, float, float]]:
+    """
+    Covers a sampled ground track buffered by radius with lon/lat rectangles.
+
+    Each sample gets the bounding box of its spherical cap, widened by half the
+    largest spacing between samples so the track in between is covered too.
+    Consecutive boxes are merged in groups of points_per_envelope, and boxes
+    crossing the antimeridian are split in two, so every rectangle can be
+    matched against a spatial index on its own.
+
+    Args:
+        lat_deg (np.ndarray): Track latitudes (deg), shape (t,).
+        lon_deg (np.ndarray): Track longitudes (deg), shape (t,).
+        radius (np.ndarray): Buffer radius per sample as a central angle (rad).
+        points_per_envelope (int): Samples merged into one rectangle.
+
+    Returns:
+        list[tuple[float, float, float, float]]: (xmin, ymin, xmax, ymax) boxes.
+    """
+    vectors = unit_vectors(lat_deg, lon_deg)
+    spacing = np.arccos(
+        np.clip(np.einsum("ij,ij->i", vectors[1:], vectors[:-1]), -1.0, 1.0)
+    )
+    margin = spacing.max() / 2 if len(spacing) else 0.0
+    radius = (radius + margin) * 1.005  # slack for the spherical approximation
+
+    lat = np.radians(lat_deg)
+    reaches_pole = np.abs(lat) + radius >= np.pi / 2
+    half_width = np.where(
+        reaches_pole,
+        np.pi,
+        np.arcsin(np.clip(np.sin(radius) / np.cos(lat), -1.0, 1.0)),
+    )
+    ymin = np.degrees(np.maximum(lat - radius, -np.pi / 2))
+    ymax = np.degrees(np.minimum(lat + radius, np.pi / 2))
+    # Unwrap so that a group of samples never jumps across the antimeridian
+    lon = np.degrees(np.unwrap(np.radians(lon_deg)))
+    xmin = lon - np.degrees(half_width)
+    xmax = lon + np.degrees(half_width)
+
+    boxes = []
+    for first in range(0, len(lat), points_per_envelope):
+        group = slice(first, first + points_per_envelope)
+        x0, x1 = xmin[group].min(), xmax[group].max()
+        y0, y1 = ymin[group].min(), ymax[group].max()
+        if x1 - x0 >= 360.0:
+            boxes.append((-180.0, y0, 180.0, y1))
+            continue
+        shift = 360.0 * np.floor((x0 + 180.0) / 360.0)
+        x0, x1 = x0 - shift, x1 - shift  # x0 now in [-180, 180)
+        if x1 > 180.0:
+            boxes.append((x0, y0, 180.0, y1))
+            boxes.append((-180.0, y0, x1 - 360.0, y1))
+        else:
+            boxes.append((x0, y0, x1, y1))
+    return [tuple(float(v) for v in box) for box in boxes]
+
+
+def aoi_caps(aoi_geometries) -> dict:
+    """
+    Spherical caps used to prefilter footprint/AOI intersections.
+
+    Args:
+        aoi_geometries (list): AOI geometries (GeoJSON-like or Shapely).
+
+    Returns:
+        dict: "geometries" (prepared Shapely array), "center" (centroid unit
+        vectors, (n, 3)), "center_lon" (deg, (n,)), "radius" (largest central
+        angle from the centroid to a vertex, rad, (n,)) and "inner" (unit
+        vectors of a point guaranteed inside each AOI, (n, 3)).
+    """
+    geometries = np.array([shape(g) for g in aoi_geometries], dtype=object)
+    shapely.prepare(geometries)
+    centroids = shapely.get_coordinates(shapely.centroid(geometries))
+    inner = shapely.get_coordinates(shapely.point_on_surface(geometries))
+
+    center = unit_vectors(centroids[:, 1], centroids[:, 0])
+    coords, index = shapely.get_coordinates(geometries, return_index=True)
+    vertex_angles = np.arccos(
+        np.clip(
+            np.einsum(
+                "ij,ij->i", unit_vectors(coords[:, 1], coords[:, 0]), center[index]
+            ),
+            -1.0,
+            1.0,
+        )
+    )
+    radius = np.zeros(len(geometries))
+    np.maximum.at(radius, index, vertex_angles)
+
+    return {
+        "geometries": geometries,
+        "center": center,
+        "center_lon": centroids[:, 0],
+        "radius": radius,
+        "inner": unit_vectors(inner[:, 1], inner[:, 0]),
+    }
+
+
+def footprint_polygons(
+    lat_deg: np.ndarray,
+    lon_deg: np.ndarray,
+    half_angle: np.ndarray,
+    n_vertices: int = 32,
+) -> np.ndarray:
+    """
+    Builds sensor footprints as lon/lat polygons around the given sub-satellite
+    points. Longitudes are not wrapped, so callers shift lon_deg next to the AOI
+    they test against.
+
+    Args:
+        lat_deg (np.ndarray): Sub-satellite latitudes (deg), shape (k,).
+        lon_deg (np.ndarray): Sub-satellite longitudes (deg), shape (k,).
+        half_angle (np.ndarray): Footprint central angles (rad), shape (k,).
+        n_vertices (int): Vertices per footprint.
+
+    Returns:
+        np.ndarray: Shapely Polygons, shape (k,).
+    """
+    bearings = np.linspace(0.0, 2 * np.pi, n_vertices, endpoint=False)[None, :]
+    lat1 = np.radians(lat_deg)[:, None]
+    radius = half_angle[:, None]
+    lat2 = np.arcsin(
+        np.sin(lat1) * np.cos(radius) + np.cos(lat1) * np.sin(radius) * np.cos(bearings)
+    )
+    dlon = np.arctan2(
+        np.sin(bearings) * np.sin(radius) * np.cos(lat1),
+        np.cos(radius) - np.sin(lat1) * np.sin(lat2),
+    )
+    coords = np.stack(
+        [lon_deg[:, None] + np.degrees(dlon), np.degrees(lat2)], axis=-1
+    )  # (k, n_vertices, 2)
+    return shapely.polygons(shapely.linearrings(coords))
+
+
+def footprint_hits(
+    caps: dict,
+    aoi_index: int,
+    sub_lat: np.ndarray,
+    sub_lon: np.ndarray,
+    half_angle: np.ndarray,
+    cos_distance: np.ndarray,
+) -> np.ndarray:
+    """
+    Exact footprint/AOI intersection test of one AOI over a time grid.
+
+    Cells where the sub-satellite point is farther from the AOI centroid than
+    the footprint plus AOI radius are rejected, and cells whose footprint
+    contains the AOI's inner point are accepted, without building geometry.
+    Only the remaining cells are intersected with Shapely.
+
+    Args:
+        caps (dict): Output of aoi_caps.
+        aoi_index (int): AOI to test.
+        sub_lat (np.ndarray): Sub-satellite latitudes (deg), shape (t,).
+        sub_lon (np.ndarray): Sub-satellite longitudes (deg), shape (t,).
+        half_angle (np.ndarray): Footprint central angles (rad), shape (t,).
+        cos_distance (np.ndarray): Cosine of the central angle between each
+            sub-satellite point and the AOI centroid, shape (t,).
+
+    Returns:
+        np.ndarray: Boolean mask of samples whose footprint intersects the AOI.
+    """
+    reach = np.minimum(half_angle + caps["radius"][aoi_index], np.pi)
+    candidates = np.flatnonzero(cos_distance >= np.cos(reach))
+    hits = np.zeros(len(sub_lat), dtype=bool)
+    if len(candidates) == 0:
+        return hits
+
+    sub_vectors = unit_vectors(sub_lat[candidates], sub_lon[candidates])
+    contains_inner = sub_vectors @ caps["inner"][aoi_index] >= np.cos(
+        half_angle[candidates]
+    )
+    hits[candidates[contains_inner]] = True
+
+    ambiguous = candidates[~contains_inner]
+    if len(ambiguous):
+        # Move each footprint to the AOI's side of the antimeridian
+        lon = sub_lon[ambiguous]
+        lon = lon + 360.0 * np.round((caps["center_lon"][aoi_index] - lon) / 360.0)
+        polygons = footprint_polygons(sub_lat[ambiguous], lon, half_angle[ambiguous])
+        hits[ambiguous] = shapely.intersects(polygons, caps["geometries"][aoi_index])
+    return hits
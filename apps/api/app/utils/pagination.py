@@ -0,0 +1,36 @@
+import base64
+import json
+from datetime import datetime
+
+
+def encode_cursor(*values) -> str:
+    """
+    Encodes the sort key of the last returned row as an opaque keyset cursor.
+
+    Datetimes are stored as ISO 8601 strings; decode with decode_cursor.
+    """
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_cursor(cursor: str, *types) -> tuple:
+    """
+    Decodes a cursor from encode_cursor, converting each value to the given type
+    (datetime values are parsed from ISO 8601).
+
+    Raises:
+        ValueError: The cursor is malformed or does not match types.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {e}") from e
+    if not isinstance(payload, list) or len(payload) != len(types):
+        raise ValueError("Invalid cursor")
+    try:
+        return tuple(
+            datetime.fromisoformat(v) if t is datetime else t(v)
+            for v, t in zip(payload, types)
+        )
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {e}") from e
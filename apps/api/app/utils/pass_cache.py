@@ -0,0 +1,99 @@
+from datetime import datetime
+
+from app.schemas.orbital_pass import PassComputeResult
+from app.utils.track import concat_tracks
+
+
+def uncovered_intervals(
+    start: datetime, end: datetime, covered: list[tuple[datetime, datetime]]
+) -> list[tuple[datetime, datetime]]:
+    """
+    Returns the sub-intervals of [start, end] not covered by any computed range.
+
+    Args:
+        start (datetime): Requested window start.
+        end (datetime): Requested window end.
+        covered (list[tuple[datetime, datetime]]): Already computed ranges.
+
+    Returns:
+        list[tuple[datetime, datetime]]: Gaps in chronological order.
+    """
+    gaps = []
+    cursor = start
+    for covered_start, covered_end in sorted(covered):
+        if covered_start > cursor:
+            gaps.append((cursor, min(covered_start, end)))
+        cursor = max(cursor, covered_end)
+        if cursor >= end:
+            break
+    if cursor < end:
+        gaps.append((cursor, end))
+    return [(a, b) for a, b in gaps if b > a]
+
+
+def merge_passes(passes: list[PassComputeResult]) -> list[PassComputeResult]:
+    """
+    Merges stored and freshly computed passes into one chronological list.
+
+    A pass crossing the boundary between two computed ranges is stored as two
+    pieces, the first ending exactly where the second starts; such pieces are
+    joined back together, tracks included. Passes that overlap are the same pass
+    found by more than one computation: the one spanning more time is kept
+    whole, so a track never runs over the same time span twice. A joined pass
+    has no track if either piece was stored without one.
+    """
+    merged: list[PassComputeResult] = []
+    for p in sorted(passes, key=lambda p: (p.start_time, p.end_time)):
+        if not merged or p.start_time > merged[-1].end_time:
+            merged.append(p)
+            continue
+
+        prev = merged[-1]
+        if p.start_time < prev.end_time:
+            if p.end_time - p.start_time > prev.end_time - prev.start_time:
+                merged[-1] = p
+            continue
+
+        peak = p if p.max_elevation_deg > prev.max_elevation_deg else prev
+        track_geojson = None
+        if prev.track_geojson is not None and p.track_geojson is not None:
+            track_geojson = concat_tracks(prev.track_geojson, p.track_geojson)
+        merged[-1] = PassComputeResult(
+            start_time=prev.start_time,
+            end_time=p.end_time,
+            max_elevation_deg=peak.max_elevation_deg,
+            max_elevation_time=peak.max_elevation_time,
+            track_geojson=track_geojson,
+        )
+    return merged
+
+
+def assign_to_segments(
+    segments: list[tuple], found: list[list[PassComputeResult]]
+) -> list[PassComputeResult]:
+    """
+    Keeps, for every segment, the passes culminating inside it.
+
+    Each segment is searched over a range reaching past its interior boundaries
+    (see pad_segments), so a pass crossing a boundary is found whole on both
+    sides; assigning it by culmination keeps exactly one copy, computed with
+    the element set closest to its peak. The outer edges of the window are not
+    filtered, so passes cut by the window are kept.
+
+    Args:
+        segments (list[tuple]): (tle, TimeWindow) segments in chronological order.
+        found (list[list[PassComputeResult]]): Passes found for each segment.
+
+    Returns:
+        list[PassComputeResult]: Merged passes of the whole window.
+    """
+    passes = []
+    last = len(segments) - 1
+    for i, ((_, segment), segment_passes) in enumerate(zip(segments, found)):
+        passes += [
+            p
+            for p in merge_passes(segment_passes)
+            if (i == 0 or p.max_elevation_time >= segment.start)
+            and (i == last or p.max_elevation_time < segment.end)
+        ]
+    return merge_passes(passes)
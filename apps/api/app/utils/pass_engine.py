@@ -1,14 +1,36 @@
 import numpy as np
-from datetime import datetime, timedelta, timezone
-
-from shapely.geometry import LineString, mapping, shape
-from skyfield.api import EarthSatellite, load, wgs84
-
-from app.schemas.orbital_pass import PassComputeResult
+from datetime import datetime, timedelta
+
+from shapely.geometry import shape
+from skyfield.api import EarthSatellite, wgs84
+from skyfield.framelib import itrs
+from skyfield.positionlib import Geocentric
+
+from app.schemas.orbital_pass import PassComputeResult, TimeWindow
+from app.utils.footprint import (
+    aoi_caps,
+    footprint_half_angle,
+    footprint_hits,
+    track_envelopes,
+    unit_vectors,
+    visibility_half_angle,
+)
+from app.utils.satellite_cache import get_timescale, satellite_cache
+from app.utils.track import track_to_geojson
+
+DAY_S = 86400.0
+GRID_EPOCH_TT = 2451545.0  # J2000; origin of the AOS/LOS tolerance grid
+BATCH_MAX_CELLS = 2_000_000  # observers x samples evaluated per NumPy chunk
 
 
 def create_satellite_from_tle(tle) -> EarthSatellite:
-    return EarthSatellite(tle.line1, tle.line2, tle.name or "SAT", load.timescale())
+    """
+    Returns the Skyfield satellite for a TLE, reusing the process-wide cache when
+    the TLE is a persisted row.
+    """
+    if getattr(tle, "id", None) is None:
+        return EarthSatellite(tle.line1, tle.line2, tle.name or "SAT", get_timescale())
+    return satellite_cache.get(tle)
 
 
 def get_observer_from_aoi_geometry(aoi_geometry) -> tuple:
@@ -27,23 +49,71 @@ def get_observer_from_aoi_geometry(aoi_geometry) -> tuple:
     return (lat, lon), topos
 
 
-def generate_times(start: datetime, end: datetime, step_seconds: int = 10):
+def get_observer_vectors(aoi_geometries) -> tuple[np.ndarray, np.ndarray]:
     """
-    Generates a Skyfield Time array with uniform time steps between start and end.
+    Converts AOI geometries to observer vectors for vectorized elevation.
+
+    Args:
+        aoi_geometries (list): AOI geometries (observer at each centroid).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: ITRF observer positions (km) and geodetic
+        zenith unit vectors, both shaped (n_aois, 3).
+    """
+    vectors = [
+        topos_vectors(get_observer_from_aoi_geometry(aoi_geometry)[1])
+        for aoi_geometry in aoi_geometries
+    ]
+    positions = [position for position, _ in vectors]
+    zeniths = [zenith for _, zenith in vectors]
+    return np.array(positions).reshape(-1, 3), np.array(zeniths).reshape(-1, 3)
+
+
+def topos_vectors(topos) -> tuple[np.ndarray, np.ndarray]:
+    """ITRF position (km) and geodetic zenith unit vector of a wgs84 observer."""
+    lat, lon = topos.latitude.radians, topos.longitude.radians
+    zenith = np.array(
+        [np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)]
+    )
+    return topos.itrs_xyz.km, zenith
+
+
+def grid_offsets(start: datetime, end: datetime, step_seconds: float) -> np.ndarray:
+    """
+    Offsets in seconds from start of a sampling grid over [start, end].
+
+    Interior samples fall on whole multiples of step_seconds since the Unix
+    epoch rather than on start + k * step_seconds, so a pass sampled from
+    overlapping windows gets the same times (and the same stored natural key)
+    whatever the window start. Both ends of the window are always included so
+    adjacent windows meet at a shared sample.
+    """
+    duration = (end - start).total_seconds()
+    first = -start.timestamp() % step_seconds
+    interior = np.arange(first, duration, step_seconds)
+    return np.unique(np.concatenate([[0.0], interior, [max(duration, 0.0)]]))
+
+
+def generate_times(start: datetime, end: datetime, step_seconds: float = 10):
+    """
+    Generates a Skyfield Time array sampling start to end every step_seconds.
+
+    The grid is built in one shot as a NumPy array of TT day fractions offset from
+    the start epoch, so no per-step datetime objects are created. See
+    grid_offsets for how samples are aligned.
 
     Args:
         start (datetime): UTC start time.
         end (datetime): UTC end time.
-        step_seconds (int): Time step in seconds between samples.
+        step_seconds (float): Time step in seconds between samples.
 
     Returns:
         skyfield.timelib.Time: Skyfield Time array covering the interval [start, end].
     """
-    ts = load.timescale()
-    num_steps = int((end - start).total_seconds() / step_seconds) + 1
-    return ts.utc(
-        [start + timedelta(seconds=i * step_seconds) for i in range(num_steps)]
-    )
+    ts = get_timescale()
+    t0 = ts.from_datetime(start)
+    offsets = grid_offsets(start, end, step_seconds) / DAY_S
+    return ts.tt_jd(t0.whole, t0.tt_fraction + offsets)
 
 
 def compute_elevation_series(sat: EarthSatellite, topos, times):
@@ -67,6 +137,27 @@ def compute_elevation_series(sat: EarthSatellite, topos, times):
     return altitudes  # array of elevation angles
 
 
+def compute_elevation_matrix(
+    sat_itrs_km: np.ndarray, observer_km: np.ndarray, observer_zenith: np.ndarray
+) -> np.ndarray:
+    """
+    Computes elevations of one satellite track for many observers at once.
+
+    Args:
+        sat_itrs_km (np.ndarray): Satellite ITRF positions (km), shape (3, n_times).
+        observer_km (np.ndarray): Observer ITRF positions (km), shape (n_obs, 3).
+        observer_zenith (np.ndarray): Observer zenith unit vectors, shape (n_obs, 3).
+
+    Returns:
+        np.ndarray: Elevation angles (degrees), shape (n_obs, n_times).
+    """
+    relative = sat_itrs_km[None, :, :] - observer_km[:, :, None]  # (obs, 3, t)
+    sin_el = np.einsum("oit,oi->ot", relative, observer_zenith) / np.linalg.norm(
+        relative, axis=1
+    )
+    return np.degrees(np.arcsin(np.clip(sin_el, -1.0, 1.0)))
+
+
 def find_pass_windows(elevations: np.ndarray, threshold_deg: float = 10.0):
     """
     Detects visibility intervals based on elevation threshold.
@@ -79,69 +170,624 @@ def find_pass_windows(elevations: np.ndarray, threshold_deg: float = 10.0):
         list[tuple[int, int]]: List of index ranges (start_idx, end_idx) where
         elevation stays above the threshold for at least two consecutive points.
     """
-    above = elevations >= threshold_deg
-    intervals = []
-    start = None
+    return find_runs(elevations >= threshold_deg)
 
-    for i, is_above in enumerate(above):
-        if is_above and start is None:
-            start = i
-        elif not is_above and start is not None:
-            if i > start + 1:  # at least 2 points long
-                intervals.append((start, i - 1))
-            start = None
 
-    # Handle case where the last point is still "above"
-    if start is not None and len(above) > start + 1:
-        intervals.append((start, len(above) - 1))
+def find_runs(above: np.ndarray):
+    """
+    Returns the index ranges (start_idx, end_idx) of the runs of True in a
+    boolean series that are at least two points long.
 
-    return intervals
+    Runs are found by edge detection on the padded mask instead of a Python loop.
+    """
+    padded = np.concatenate(([False], np.asarray(above, dtype=bool), [False]))
+    edges = np.diff(padded.view(np.int8))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
+    keep = ends > starts  # at least 2 points long
+    return list(zip(starts[keep].tolist(), ends[keep].tolist()))
 
 
-def extract_pass_data(times, subpoints, elevations, interval) -> PassComputeResult:
-    start_idx, end_idx = interval
-    start_time = times[start_idx].utc_datetime().replace(tzinfo=timezone.utc)
-    end_time = times[end_idx].utc_datetime().replace(tzinfo=timezone.utc)
+def subpoints_at(geocentric, times, indices: np.ndarray) -> np.ndarray:
+    """
+    Sub-satellite points of an already propagated position at selected samples.
 
-    max_idx = np.argmax(elevations[start_idx : end_idx + 1]) + start_idx
-    max_elevation = elevations[max_idx]
-    max_time = times[max_idx].utc_datetime().replace(tzinfo=timezone.utc)
+    Args:
+        geocentric: Skyfield Geocentric position over times.
+        times: Skyfield Time array the position was computed for.
+        indices (np.ndarray): Sample indices to convert.
 
-    track = [
-        (subpoints[i][1], subpoints[i][0])  # (lon, lat)
-        for i in range(start_idx, end_idx + 1)
-    ]
-    track_geojson = mapping(LineString(track))
+    Returns:
+        np.ndarray: (lat, lon) in degrees, shape (len(indices), 2).
+    """
+    selected = Geocentric(
+        geocentric.position.au[:, indices],
+        t=times[indices],
+        center=399,
+    )
+    lat, lon = wgs84.latlon_of(selected)
+    return np.column_stack((lat.degrees, lon.degrees))
+
+
+def pass_subpoints(geocentric, times, intervals, subpoints=None, known=None):
+    """
+    Fills the sub-satellite points of the samples inside the given intervals.
+
+    Only samples not yet known are converted, so callers handling many observers
+    of the same satellite can share one subpoints array.
+
+    Args:
+        geocentric: Skyfield Geocentric position over times.
+        times: Skyfield Time array.
+        intervals (list[tuple[int, int]]): Inclusive sample index ranges.
+        subpoints (np.ndarray, optional): (n_times, 2) array to fill.
+        known (np.ndarray, optional): Boolean mask of already filled samples.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The subpoints array and the known mask.
+    """
+    if subpoints is None:
+        subpoints = np.full((len(times), 2), np.nan)
+        known = np.zeros(len(times), dtype=bool)
+    needed = np.zeros(len(times), dtype=bool)
+    for start_idx, end_idx in intervals:
+        needed[start_idx : end_idx + 1] = True
+    indices = np.flatnonzero(needed & ~known)
+    if len(indices):
+        subpoints[indices] = subpoints_at(geocentric, times, indices)
+        known[indices] = True
+    return subpoints, known
+
+
+def extract_pass_data(times, subpoints, elevations, interval) -> PassComputeResult:
+    """
+    Builds the pass result of one interval of a sampled series.
+
+    Args:
+        times: Skyfield Time array of the samples.
+        subpoints (np.ndarray): Sub-satellite (lat, lon) in degrees, shape
+            (n_times, 2).
+        elevations (np.ndarray): Elevation (deg) per sample.
+        interval (tuple[int, int]): Inclusive sample index range of the pass.
+    """
+    start_idx, end_idx = interval
+    max_idx = int(np.argmax(elevations[start_idx : end_idx + 1])) + start_idx
+    start_time, end_time, max_time = times[[start_idx, end_idx, max_idx]].utc_datetime()
 
+    track = subpoints[start_idx : end_idx + 1]
     return PassComputeResult(
         start_time=start_time,
         end_time=end_time,
-        max_elevation_deg=max_elevation,
+        max_elevation_deg=elevations[max_idx],
         max_elevation_time=max_time,
-        track_geojson=track_geojson,
+        track_geojson=track_to_geojson(track[:, 1], track[:, 0]),
     )
 
 
-def compute_passes_over_aoi(tle, aoi_geometry, window, min_elevation_deg=10.0):
-    sat = create_satellite_from_tle(tle)
-    (lat, lon), topos = get_observer_from_aoi_geometry(aoi_geometry)
+def coarse_step_seconds(sat: EarthSatellite, orbit_fraction: float = 0.05) -> float:
+    """
+    Chooses the coarse scan step of the adaptive search from the TLE mean motion.
+
+    Elevation seen from a fixed observer has a single maximum per orbit, so sampling
+    a small fraction of the orbital period is enough to bracket every culmination.
+
+    Args:
+        sat (EarthSatellite): Skyfield satellite object.
+        orbit_fraction (float): Fraction of the orbital period used as the step.
+
+    Returns:
+        float: Coarse step in seconds.
+    """
+    revs_per_day = sat.model.no_kozai * 1440.0 / (2 * np.pi)  # no_kozai is rad/min
+    return orbit_fraction * DAY_S / revs_per_day
+
+
+def refine_maxima(elevation_at, lo: np.ndarray, hi: np.ndarray, tol_days: float):
+    """
+    Golden-section search of the elevation maximum inside each [lo, hi] bracket.
+
+    All brackets are refined together so each iteration is a single vectorized
+    propagation.
+
+    Args:
+        elevation_at (Callable): Maps an array of TT Julian dates to elevations (deg).
+        lo (np.ndarray): Lower bracket bounds (TT Julian dates).
+        hi (np.ndarray): Upper bracket bounds (TT Julian dates).
+        tol_days (float): Bracket width (days) at which the search stops.
+
+    Returns:
+        np.ndarray: TT Julian dates of the refined maxima.
+    """
+    ratio = (np.sqrt(5.0) - 1.0) / 2.0
+    n = len(lo)
+    while n and np.max(hi - lo) > tol_days:
+        c = hi - ratio * (hi - lo)
+        d = lo + ratio * (hi - lo)
+        values = elevation_at(np.concatenate([c, d]))
+        left = values[:n] >= values[n:]  # maximum lies in [lo, d]
+        hi = np.where(left, d, hi)
+        lo = np.where(left, lo, c)
+    return (lo + hi) / 2
+
+
+def bisect_crossings(
+    elevation_at,
+    lo: np.ndarray,
+    hi: np.ndarray,
+    threshold_deg: float,
+    rising: bool,
+    tol_days: float,
+):
+    """
+    Bisects the threshold crossing inside each [lo, hi] bracket.
+
+    Args:
+        elevation_at (Callable): Maps an array of TT Julian dates to elevations (deg).
+        lo (np.ndarray): Lower bracket bounds (TT Julian dates).
+        hi (np.ndarray): Upper bracket bounds (TT Julian dates).
+        threshold_deg (float): Elevation threshold (deg).
+        rising (bool): True if elevation crosses upwards inside the brackets (AOS),
+            False if it crosses downwards (LOS).
+        tol_days (float): Bracket width (days) at which the search stops.
+
+    Returns:
+        np.ndarray: TT Julian dates of the crossings, always on the visible side so
+        that the elevation at the returned instant is >= threshold_deg.
+    """
+    while len(lo) and np.max(hi - lo) > tol_days:
+        mid = (lo + hi) / 2
+        above = elevation_at(mid) >= threshold_deg
+        move_hi = above if rising else ~above
+        hi = np.where(move_hi, mid, hi)
+        lo = np.where(move_hi, lo, mid)
+    return hi if rising else lo
+
+
+def snap_crossings(
+    elevation_at,
+    jd: np.ndarray,
+    threshold_deg: float,
+    rising: bool,
+    tol_days: float,
+) -> np.ndarray:
+    """
+    Moves bisected crossings onto a grid of tol_days steps from GRID_EPOCH_TT.
+
+    Bisection only pins a crossing down to within tol_days, and where inside that
+    range it stops depends on the starting bracket, i.e. on the search window.
+    The first (rising) or last (falling) visible grid point next to the estimate
+    is unique, and grid dates are computed from their index alone, so the same
+    crossing found from any window gets bit-identical times (and stored keys).
+
+    Args:
+        elevation_at (Callable): Maps an array of TT Julian dates to elevations (deg).
+        jd (np.ndarray): Crossings from bisect_crossings (TT Julian dates).
+        threshold_deg (float): Elevation threshold (deg).
+        rising (bool): True for AOS, False for LOS.
+        tol_days (float): Grid step (days), the bisection tolerance.
+
+    Returns:
+        np.ndarray: TT Julian dates of the snapped crossings (still visible).
+    """
+    if not len(jd):
+        return jd
+    index = np.floor((jd - GRID_EPOCH_TT) / tol_days)
+    # The crossing is within one step of the estimate: 5 grid points cover it
+    grid = GRID_EPOCH_TT + (index[:, None] + np.arange(-2, 3)) * tol_days
+    visible = elevation_at(grid.ravel()).reshape(grid.shape) >= threshold_deg
+    if not rising:
+        grid, visible = grid[:, ::-1], visible[:, ::-1]
+    first = np.argmax(visible, axis=1)
+    found = visible[np.arange(len(jd)), first]
+    return np.where(found, grid[np.arange(len(jd)), first], jd)
+
+
+def search_passes_sampled(sat, topos, window, min_elevation_deg=10.0):
+    """
+    Detects passes by sampling the whole window every 10 seconds.
+
+    The satellite is propagated once; elevations are derived from its ITRF
+    positions and ground track points are computed only inside passes.
+    """
     times = generate_times(window.start, window.end)
 
-    # compute elevations and sub-satellite points
-    elevations = compute_elevation_series(sat, topos, times)
-    subpoint_objs = sat.at(
-        times
-    ).subpoint()  # Get the sub-satellite points or ground track
-    subpoints = list(
-        zip(subpoint_objs.latitude.degrees, subpoint_objs.longitude.degrees)
-    )  # Turn into simple list of float tuples [(lat, lon)]
+    # propagate once; elevations come from the ITRF positions
+    geocentric = sat.at(times)
+    observer_km, observer_zenith = topos_vectors(topos)
+    elevations = compute_elevation_matrix(
+        geocentric.frame_xyz(itrs).km, observer_km[None, :], observer_zenith[None, :]
+    )[0]
 
     intervals = find_pass_windows(
         elevations, threshold_deg=min_elevation_deg
     )  # Detect intervals where the elevation is greater than the threshold
 
+    # sub-satellite points only for the samples inside passes
+    subpoints, _ = pass_subpoints(geocentric, times, intervals)
+
     passes = [
         extract_pass_data(times, subpoints, elevations, interval)
         for interval in intervals
     ]  # Create a list of PassComputeResult objects
     return passes
+
+
+def search_passes_adaptive(
+    sat,
+    topos,
+    window,
+    min_elevation_deg=10.0,
+    tol_seconds: float = 0.1,
+    track_step_seconds: int = 10,
+):
+    """
+    Detects passes with a coarse-to-fine search instead of dense sampling.
+
+    A coarse scan (step from coarse_step_seconds) brackets every elevation maximum,
+    golden-section search refines each culmination and bisection refines AOS/LOS
+    to tol_seconds, on an absolute grid (see snap_crossings) so overlapping windows
+    agree on them. Only the refined passes are sampled for the ground track.
+
+    Args:
+        sat (EarthSatellite): Skyfield satellite object.
+        topos: Skyfield observer location.
+        window: TimeWindow with UTC start and end.
+        min_elevation_deg (float): Elevation threshold (deg).
+        tol_seconds (float): Accuracy of the refined AOS, culmination and LOS.
+        track_step_seconds (int): Sampling step of the returned ground track.
+
+    Returns:
+        list[PassComputeResult]: Detected passes in chronological order.
+    """
+    ts = get_timescale()
+    tol_days = tol_seconds / DAY_S
+
+    def elevation_at(jd: np.ndarray) -> np.ndarray:
+        return compute_elevation_series(sat, topos, ts.tt_jd(jd))
+
+    # 1. Coarse scan
+    start_jd = ts.from_datetime(window.start).tt
+    end_jd = ts.from_datetime(window.end).tt
+    jd = generate_times(window.start, window.end, coarse_step_seconds(sat)).tt
+    if len(jd) < 2:
+        return []
+    elevations = elevation_at(jd)
+
+    # 2. Bracket local maxima of the coarse series (window edges included)
+    padded = np.concatenate([[-np.inf], elevations, [-np.inf]])
+    peak_idx = np.flatnonzero(
+        (padded[1:-1] >= padded[:-2]) & (padded[1:-1] > padded[2:])
+    )
+    lo = jd[np.maximum(peak_idx - 1, 0)]
+    hi = jd[np.minimum(peak_idx + 1, len(jd) - 1)]
+    peak_jd = refine_maxima(elevation_at, lo, hi, tol_days)
+    peak_el = elevation_at(peak_jd)
+
+    visible = peak_el >= min_elevation_deg
+    peak_jd, peak_el = peak_jd[visible], peak_el[visible]
+    if not len(peak_jd):
+        return []
+
+    # 3. Bracket AOS/LOS between each peak and the neighbouring coarse samples
+    #    below the threshold. Peaks without such a sample before (after) them are
+    #    already visible at the window start (end).
+    below_idx = np.flatnonzero(elevations < min_elevation_deg)
+    bounds_jd = np.concatenate([[start_jd], jd[below_idx], [end_jd]])
+    coarse_idx = np.searchsorted(jd, peak_jd, side="right") - 1
+    pos = np.searchsorted(below_idx, coarse_idx, side="right")
+    has_before = pos > 0
+    has_after = pos < len(below_idx)
+    before_jd = bounds_jd[pos]
+    after_jd = bounds_jd[pos + 1]
+
+    # Several coarse maxima between the same pair of low samples are one pass
+    _, first = np.unique(before_jd, return_index=True)
+    keep = []
+    for group_start, group_end in zip(first, np.append(first[1:], len(before_jd))):
+        keep.append(group_start + np.argmax(peak_el[group_start:group_end]))
+    keep = np.array(keep, dtype=int)
+    peak_jd, peak_el = peak_jd[keep], peak_el[keep]
+    has_before, has_after = has_before[keep], has_after[keep]
+    before_jd, after_jd = before_jd[keep], after_jd[keep]
+
+    aos_jd = np.where(has_before, 0.0, start_jd)
+    los_jd = np.where(has_after, 0.0, end_jd)
+    aos_jd[has_before] = snap_crossings(
+        elevation_at,
+        bisect_crossings(
+            elevation_at,
+            before_jd[has_before],
+            peak_jd[has_before],
+            min_elevation_deg,
+            rising=True,
+            tol_days=tol_days,
+        ),
+        min_elevation_deg,
+        rising=True,
+        tol_days=tol_days,
+    )
+    los_jd[has_after] = snap_crossings(
+        elevation_at,
+        bisect_crossings(
+            elevation_at,
+            peak_jd[has_after],
+            after_jd[has_after],
+            min_elevation_deg,
+            rising=False,
+            tol_days=tol_days,
+        ),
+        min_elevation_deg,
+        rising=False,
+        tol_days=tol_days,
+    )
+
+    # 4. Ground track sampled only inside the passes
+    track_step_days = track_step_seconds / DAY_S
+    track_jds = [
+        np.append(np.arange(aos, los, track_step_days), los)
+        for aos, los in zip(aos_jd, los_jd)
+    ]
+    track_times = ts.tt_jd(np.concatenate(track_jds))
+    lat, lon = wgs84.latlon_of(sat.at(track_times))
+    splits = np.cumsum([len(t) for t in track_jds])[:-1]
+    tracks = zip(
+        np.split(lon.degrees, splits),
+        np.split(lat.degrees, splits),
+    )
+
+    aos_utc = ts.tt_jd(aos_jd).utc_datetime()
+    los_utc = ts.tt_jd(los_jd).utc_datetime()
+    peak_utc = ts.tt_jd(peak_jd).utc_datetime()
+
+    passes = []
+    for i, (track_lon, track_lat) in enumerate(tracks):
+        if los_jd[i] <= aos_jd[i]:
+            continue  # grazing maximum exactly at the threshold
+        passes.append(
+            PassComputeResult(
+                start_time=aos_utc[i],
+                end_time=los_utc[i],
+                max_elevation_deg=float(peak_el[i]),
+                max_elevation_time=peak_utc[i],
+                track_geojson=track_to_geojson(track_lon, track_lat),
+            )
+        )
+    return passes
+
+
+def segment_window_by_epoch(tles, window) -> list[tuple]:
+    """
+    Splits window at the midpoints between consecutive TLE epochs so that every
+    instant is propagated with the element set closest to it.
+
+    Args:
+        tles (list): TLEs (anything with epoch_utc) of a single satellite.
+        window (TimeWindow): Window to split.
+
+    Returns:
+        list[tuple]: (tle, TimeWindow) segments in chronological order. TLEs whose
+            segment falls outside the window are dropped.
+    """
+    tles = sorted(tles, key=lambda t: t.epoch_utc)
+    segments = []
+    seg_start = window.start
+    for tle, next_tle in zip(tles, tles[1:] + [None]):
+        if next_tle is None:
+            seg_end = window.end
+        else:
+            midpoint = tle.epoch_utc + (next_tle.epoch_utc - tle.epoch_utc) / 2
+            seg_end = min(window.end, midpoint)
+        if seg_end > seg_start:
+            segments.append((tle, TimeWindow(start=seg_start, end=seg_end)))
+            seg_start = seg_end
+    return segments
+
+
+def pad_segments(segments: list[tuple]) -> list:
+    """
+    Search ranges of the segments from segment_window_by_epoch: every boundary
+    shared by two segments is widened by one orbital period of the segment's
+    TLE, so passes crossing it are found whole on both sides (see
+    pass_cache.assign_to_segments). The outer edges of the window are kept.
+
+    Returns:
+        list[TimeWindow]: One search range per segment.
+    """
+    ranges = []
+    for i, (tle, segment) in enumerate(segments):
+        period = timedelta(days=1 / float(tle.mean_motion_rev_per_day))
+        ranges.append(
+            TimeWindow(
+                start=segment.start - period if i > 0 else segment.start,
+                end=segment.end + period if i < len(segments) - 1 else segment.end,
+            )
+        )
+    return ranges
+
+
+def compute_passes_over_aoi(
+    tle,
+    aoi_geometry,
+    window,
+    min_elevation_deg=10.0,
+    search_mode="adaptive",
+    coverage_mode="centroid",
+    off_nadir_deg=30.0,
+):
+    if coverage_mode == "footprint":
+        return compute_footprint_passes_batch(
+            [tle], [aoi_geometry], window, off_nadir_deg
+        )[0][0]
+
+    sat = create_satellite_from_tle(tle)
+    (lat, lon), topos = get_observer_from_aoi_geometry(aoi_geometry)
+
+    if search_mode == "sampled":
+        return search_passes_sampled(sat, topos, window, min_elevation_deg)
+    return search_passes_adaptive(sat, topos, window, min_elevation_deg)
+
+
+def compute_passes_batch(
+    tles,
+    aoi_geometries,
+    window,
+    min_elevation_deg=10.0,
+    coverage_mode="centroid",
+    off_nadir_deg=30.0,
+):
+    """
+    Computes passes for every (satellite, AOI) combination on a shared time grid.
+
+    Each satellite is propagated once; its ITRF positions are then broadcast
+    against all AOI observers so elevations for the whole AOI set come out of a
+    single NumPy evaluation (chunked to bound memory).
+
+    Args:
+        tles (list): Latest TLE of each satellite.
+        aoi_geometries (list): AOI geometries (observer at each centroid).
+        window: TimeWindow with UTC start and end.
+        min_elevation_deg (float): Elevation threshold (deg).
+        coverage_mode (str): "centroid" or "footprint" (see
+            compute_footprint_passes_batch, which ignores min_elevation_deg).
+        off_nadir_deg (float): Sensor half-angle for the footprint mode (deg).
+
+    Returns:
+        list[list[list[PassComputeResult]]]: passes[i][j] holds the passes of
+        tles[i] over aoi_geometries[j].
+    """
+    if coverage_mode == "footprint":
+        return compute_footprint_passes_batch(
+            tles, aoi_geometries, window, off_nadir_deg
+        )
+
+    times = generate_times(window.start, window.end)
+    observer_km, observer_zenith = get_observer_vectors(aoi_geometries)
+    chunk = max(1, BATCH_MAX_CELLS // len(times))
+
+    results = []
+    for tle in tles:
+        sat = create_satellite_from_tle(tle)
+        geocentric = sat.at(times)
+        sat_itrs_km = geocentric.frame_xyz(itrs).km
+        subpoints = known = None
+
+        sat_results = []
+        for first in range(0, len(aoi_geometries), chunk):
+            elevations = compute_elevation_matrix(
+                sat_itrs_km,
+                observer_km[first : first + chunk],
+                observer_zenith[first : first + chunk],
+            )
+            chunk_intervals = [
+                find_pass_windows(aoi_elevations, threshold_deg=min_elevation_deg)
+                for aoi_elevations in elevations
+            ]
+            # Ground track only for samples inside some pass of this chunk
+            subpoints, known = pass_subpoints(
+                geocentric,
+                times,
+                [interval for intervals in chunk_intervals for interval in intervals],
+                subpoints,
+                known,
+            )
+            for aoi_elevations, intervals in zip(elevations, chunk_intervals):
+                sat_results.append(
+                    [
+                        extract_pass_data(times, subpoints, aoi_elevations, interval)
+                        for interval in intervals
+                    ]
+                )
+        results.append(sat_results)
+    return results
+
+
+def compute_footprint_passes_batch(
+    tles, aoi_geometries, window, off_nadir_deg=30.0, step_seconds: int = 10
+):
+    """
+    Computes passes as the intervals during which the sensor footprint of each
+    satellite intersects each AOI polygon, instead of elevation over the centroid.
+
+    Each satellite is propagated once on a shared grid. A centroid + radius
+    spherical-cap test over the whole (AOI, time) matrix rejects most cells and
+    accepts those whose footprint covers a point inside the AOI; exact Shapely
+    intersection only runs on the remaining cells near pass edges (see
+    footprint_hits). Max elevation is reported as seen from the AOI centroid.
+
+    Args:
+        tles (list): TLE of each satellite.
+        aoi_geometries (list): AOI geometries.
+        window: TimeWindow with UTC start and end.
+        off_nadir_deg (float): Sensor half-angle from nadir (deg).
+        step_seconds (int): Grid step, which bounds AOS/LOS precision.
+
+    Returns:
+        list[list[list[PassComputeResult]]]: passes[i][j] holds the passes of
+        tles[i] over aoi_geometries[j].
+    """
+    times = generate_times(window.start, window.end, step_seconds)
+    caps = aoi_caps(aoi_geometries)
+    observer_km, observer_zenith = get_observer_vectors(aoi_geometries)
+    chunk = max(1, BATCH_MAX_CELLS // len(times))
+
+    results = []
+    for tle in tles:
+        sat = create_satellite_from_tle(tle)
+        geocentric = sat.at(times)
+        sat_itrs_km = geocentric.frame_xyz(itrs).km
+        position = wgs84.geographic_position_of(geocentric)
+        lat, lon = position.latitude.degrees, position.longitude.degrees
+        half_angle = footprint_half_angle(position.elevation.km, off_nadir_deg)
+        sub_vectors = unit_vectors(lat, lon)
+        subpoints = np.column_stack((lat, lon))
+
+        sat_results = []
+        for first in range(0, len(aoi_geometries), chunk):
+            cos_distance = caps["center"][first : first + chunk] @ sub_vectors.T
+            for offset, aoi_cos_distance in enumerate(cos_distance):
+                j = first + offset
+                hits = footprint_hits(caps, j, lat, lon, half_angle, aoi_cos_distance)
+                intervals = find_runs(hits)
+                if not intervals:
+                    sat_results.append([])
+                    continue
+                elevations = compute_elevation_matrix(
+                    sat_itrs_km, observer_km[j : j + 1], observer_zenith[j : j + 1]
+                )[0]
+                sat_results.append(
+                    [
+                        extract_pass_data(times, subpoints, elevations, interval)
+                        for interval in intervals
+                    ]
+                )
+        results.append(sat_results)
+    return results
+
+
+def ground_track_envelopes(
+    tle,
+    window,
+    min_elevation_deg=10.0,
+    coverage_mode="centroid",
+    off_nadir_deg=30.0,
+    step_seconds: int = 60,
+) -> list[tuple[float, float, float, float]]:
+    """
+    Propagates a satellite once over window and returns lon/lat rectangles that
+    contain every ground point from which it can be seen (above
+    min_elevation_deg, or inside the sensor footprint for the footprint mode).
+
+    Used to prefilter AOIs against the spatial index before precise pass
+    computation; see track_envelopes.
+    """
+    sat = create_satellite_from_tle(tle)
+    times = generate_times(window.start, window.end, step_seconds)
+    position = wgs84.geographic_position_of(sat.at(times))
+    altitude_km = position.elevation.km
+    if coverage_mode == "footprint":
+        radius = footprint_half_angle(altitude_km, off_nadir_deg)
+    else:
+        radius = visibility_half_angle(altitude_km, min_elevation_deg)
+    return track_envelopes(
+        position.latitude.degrees, position.longitude.degrees, radius
+    )
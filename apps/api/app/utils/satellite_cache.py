@@ -0,0 +1,96 @@
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+
+from skyfield.api import EarthSatellite, load
+from skyfield.timelib import Timescale
+
+from app.core.config import settings
+
+
+@lru_cache(maxsize=1)
+def get_timescale() -> Timescale:
+    """Process-wide Skyfield timescale (builtin leap-second and Delta T tables)."""
+    return load.timescale()
+
+
+class SatelliteCache:
+    """
+    Bounded LRU cache of Skyfield EarthSatellite objects keyed by TLE lines.
+
+    Keying on the lines rather than the TLE id means a TLE row edited behind the
+    cache's back is rebuilt instead of served stale. This matters in compute
+    worker processes, which never see the router's invalidations; there, stale
+    entries simply age out of the LRU.
+
+    A cache in a worker process publishes its counters to a shared-memory slot
+    (see publish_to), so the API process can report totals over all workers.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()  # (line1, line2) -> (id, sat)
+        self._lock = Lock()
+        self._shared = None
+
+    def get(self, tle) -> EarthSatellite:
+        key = (tle.line1, tle.line2)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                self._publish()
+                return entry[1]
+            self.misses += 1
+
+        sat = EarthSatellite(tle.line1, tle.line2, tle.name or "SAT", get_timescale())
+        with self._lock:
+            self._entries[key] = (tle.id, sat)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            self._publish()
+        return sat
+
+    def invalidate(self, tle_id) -> None:
+        """Drops the entries built from a TLE id (this process only)."""
+        with self._lock:
+            for key in [k for k, (id_, _) in self._entries.items() if id_ == tle_id]:
+                del self._entries[key]
+            self._publish()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self._publish()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def publish_to(self, shared, slot: int) -> None:
+        """
+        Mirrors hits, misses and size into shared[3 * slot : 3 * slot + 3]
+        (a multiprocessing Array of integers) on every change.
+        """
+        with self._lock:
+            self._shared = (shared, 3 * slot)
+            self._publish()
+
+    def _publish(self) -> None:
+        if self._shared is not None:
+            shared, offset = self._shared
+            shared[offset : offset + 3] = [self.hits, self.misses, len(self._entries)]
+
+
+satellite_cache = SatelliteCache(maxsize=settings.satellite_cache_size)
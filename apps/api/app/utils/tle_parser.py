@@ -1,27 +1,71 @@
-from skyfield.api import EarthSatellite
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional, Sequence
 
+import numpy as np
 
-def parse_tle_block(name: str, line1: str, line2: str) -> dict:
-    """Parses a TLE block into a skyfield.api.EarthSatellite object"""
-    satellite = EarthSatellite(line1, line2, name)
-    sat_id = int(line1[2:7])
-    epoch = satellite.epoch.utc_datetime()
+
+# Widths of the tles.name / satellites.name and tles.line1 / line2 columns
+MAX_NAME_LENGTH = 128
+MAX_LINE_LENGTH = 80
+
+
+class TLEBlock(NamedTuple):
+    line_no: int  # 1-based line number of line1 in the source
+    name: Optional[str]
+    line1: str
+    line2: str
+
+
+def _tle_epoch(field: str) -> datetime:
+    """Converts a YYDDD.DDDDDDDD epoch field to a UTC datetime."""
+    two_digit_year = int(field[:2])
+    year = two_digit_year + (2000 if two_digit_year < 57 else 1900)
+    return datetime(year, 1, 1, tzinfo=timezone.utc) + timedelta(
+        days=float(field[2:]) - 1
+    )
+
+
+def _implied_decimal(field: str) -> float:
+    """Converts an implied-decimal exponent field such as ' 10270-3' (0.10270e-3)."""
+    field = field.strip()
+    if not field:
+        return 0.0
+    sign = "-" if field[0] == "-" else ""
+    field = field.lstrip("+-")
+    return float(f"{sign}0.{field[:-2]}e{field[-2:]}")
+
+
+def parse_tle_block(name: Optional[str], line1: str, line2: str) -> dict:
+    """
+    Parses a TLE block into the TLE column values by reading its fixed columns.
+
+    No Skyfield/SGP4 object is built; SGP4 is initialized only when a TLE is
+    propagated by the pass engine.
+    """
+    line1, line2 = line1.strip(), line2.strip()
+    name = name.strip() if name else None
+    if line1[:2] != "1 " or line2[:2] != "2 " or len(line2) < 63:
+        raise ValueError("TLE lines must start with '1 ' and '2 '")
+    if max(len(line1), len(line2)) > MAX_LINE_LENGTH:
+        raise ValueError(f"TLE lines longer than {MAX_LINE_LENGTH} characters")
+    if name and len(name) > MAX_NAME_LENGTH:
+        raise ValueError(f"Name longer than {MAX_NAME_LENGTH} characters")
 
     return {
-        "name": name.strip(),
-        "line1": line1.strip(),
-        "line2": line2.strip(),
-        "epoch_utc": epoch,
-        "satnum": sat_id,
+        "name": name,
+        "line1": line1,
+        "line2": line2,
+        "epoch_utc": _tle_epoch(line1[18:32]),
+        "satnum": int(line1[2:7]),
         "intl_desg": line1[9:17].strip(),
-        "inclination_deg": float(satellite.model.inclo),
-        "raan_deg": float(satellite.model.nodeo),
-        "eccentricity": float(satellite.model.ecco),
-        "arg_perigee_deg": float(satellite.model.argpo),
-        "mean_anomaly_deg": float(satellite.model.mo),
-        "mean_motion_rev_per_day": float(satellite.model.no_kozai),
-        "bstar": float(satellite.model.bstar),
-        "rev_number": int(line2[63:68].strip()),
+        "inclination_deg": float(line2[8:16]),
+        "raan_deg": float(line2[17:25]),
+        "eccentricity": float("0." + line2[26:33].strip()),
+        "arg_perigee_deg": float(line2[34:42]),
+        "mean_anomaly_deg": float(line2[43:51]),
+        "mean_motion_rev_per_day": float(line2[52:63]),
+        "bstar": _implied_decimal(line1[53:61]),
+        "rev_number": int(line2[63:68].strip() or 0),
     }
 
 
@@ -41,3 +85,92 @@ def validate_tle_checksum(tle_line: str) -> bool:
         elif ch == "-":
             total += 1
     return total % 10 == expected
+
+
+def validate_tle_checksums(tle_lines: Sequence[str]) -> np.ndarray:
+    """
+    Vectorized validate_tle_checksum over many lines.
+
+    Args:
+        tle_lines (Sequence[str]): TLE lines (line 1 and/or line 2).
+
+    Returns:
+        np.ndarray: Boolean array, True where the line's checksum is valid.
+    """
+    if not tle_lines:
+        return np.zeros(0, dtype=bool)
+    long_enough = np.array([len(line) >= 69 for line in tle_lines])
+    chars = np.frombuffer(
+        "".join(line[:69].ljust(69) for line in tle_lines).encode("ascii", "replace"),
+        dtype=np.uint8,
+    ).reshape(-1, 69)
+
+    chars = chars.astype(np.int64)
+    body, checksum = chars[:, :68], chars[:, 68]
+    is_digit = (body >= ord("0")) & (body <= ord("9"))
+    total = np.where(is_digit, body - ord("0"), 0).sum(axis=1)
+    total += (body == ord("-")).sum(axis=1)
+
+    checksum_is_digit = (checksum >= ord("0")) & (checksum <= ord("9"))
+    return long_enough & checksum_is_digit & (total % 10 == checksum - ord("0"))
+
+
+def _is_element_line(line: str, number: str) -> bool:
+    return line[:2] == f"{number} " and len(line) >= 68
+
+
+def iter_tle_blocks(
+    lines: Iterable[str], on_error: Optional[Callable[[str], None]] = None
+) -> Iterator[TLEBlock]:
+    """
+    Lazily groups text lines into TLE blocks, one block at a time.
+
+    Accepts 3-line (name, line1, line2; a leading "0 " on the name is dropped)
+    and 2-line (line1, line2, no name) sets, mixed freely. Malformed input does
+    not stop the iteration: it is reported to on_error (when given) and skipped.
+
+    Args:
+        lines (Iterable[str]): Source lines, e.g. an open text file.
+        on_error (Callable[[str], None] | None): Called with one message per
+            skipped record; the caller decides how many to keep.
+
+    Yields:
+        TLEBlock: Name (or None), line1 and line2 of each element set.
+    """
+    name = None  # (line_no, name) waiting for its element lines
+    pending = None  # (line_no, line1) waiting for its line2
+
+    def report(message: str):
+        if on_error is not None:
+            on_error(message)
+
+    for line_no, raw in enumerate(lines, start=1):
+        line = raw.rstrip()
+        if not line:
+            continue
+
+        if pending is not None:
+            line1_no, line1 = pending
+            pending = None
+            if _is_element_line(line, "2"):
+                yield TLEBlock(line1_no, name[1] if name else None, line1, line)
+                name = None
+                continue
+            report(f"Line {line1_no}: line 1 not followed by line 2")
+            name = None
+
+        if _is_element_line(line, "1"):
+            pending = (line_no, line)
+        elif _is_element_line(line, "2"):
+            report(f"Line {line_no}: line 2 without preceding line 1")
+            name = None
+        else:
+            if name is not None:
+                report(f"Line {name[0]}: name '{name[1]}' without element lines")
+            text = line.strip()
+            name = (line_no, text[2:].strip() if text.startswith("0 ") else text)
+
+    if pending is not None:
+        report(f"Line {pending[0]}: line 1 not followed by line 2")
+    elif name is not None:
+        report(f"Line {name[0]}: name '{name[1]}' without element lines")
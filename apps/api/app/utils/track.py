@@ -0,0 +1,137 @@
+from typing import Optional
+
+import numpy as np
+import shapely
+
+from app.schemas.orbital_pass import PassComputeResult, TrackOptions
+
+
+def split_antimeridian(lon: np.ndarray, lat: np.ndarray) -> list[np.ndarray]:
+    """
+    Splits a sampled ground track where it crosses the antimeridian.
+
+    A step of more than 180 deg in longitude between consecutive samples is
+    treated as a crossing; both pieces are extended to +/-180 deg at the
+    linearly interpolated crossing latitude.
+
+    Args:
+        lon (np.ndarray): Longitudes (deg) in [-180, 180], shape (n,).
+        lat (np.ndarray): Latitudes (deg), shape (n,).
+
+    Returns:
+        list[np.ndarray]: (lon, lat) coordinate arrays, one per piece.
+    """
+    coords = np.column_stack((lon, lat))
+    crossings = np.flatnonzero(np.abs(np.diff(lon)) > 180.0)
+    if not len(crossings):
+        return [coords]
+
+    parts, start = [], 0
+    for i in crossings:
+        edge = 180.0 if lon[i] > 0 else -180.0
+        next_lon = lon[i + 1] + 2 * edge  # next sample, unwrapped past the edge
+        fraction = (edge - lon[i]) / (next_lon - lon[i])
+        edge_lat = lat[i] + fraction * (lat[i + 1] - lat[i])
+        parts.append(np.vstack((coords[start : i + 1], [[edge, edge_lat]])))
+        coords[i] = [-edge, edge_lat]  # the next piece starts on the other side
+        start = i
+    parts.append(coords[start:])
+    return parts
+
+
+def track_to_geojson(lon: np.ndarray, lat: np.ndarray) -> dict:
+    """
+    Builds a GeoJSON track straight from coordinate arrays (degrees): a
+    LineString, or a MultiLineString when it crosses the antimeridian.
+    """
+    return parts_to_geojson(split_antimeridian(lon, lat))
+
+
+def parts_to_geojson(parts: list[np.ndarray]) -> dict:
+    if len(parts) == 1:
+        return {"type": "LineString", "coordinates": parts[0].tolist()}
+    return {
+        "type": "MultiLineString",
+        "coordinates": [part.tolist() for part in parts],
+    }
+
+
+def track_parts(track_geojson: dict) -> list[np.ndarray]:
+    """Coordinate arrays of a GeoJSON LineString or MultiLineString track."""
+    if track_geojson["type"] == "LineString":
+        return [np.asarray(track_geojson["coordinates"], dtype=float)]
+    return [np.asarray(c, dtype=float) for c in track_geojson["coordinates"]]
+
+
+def geometry_to_track_geojson(geometry) -> dict:
+    """
+    GeoJSON track of a stored Shapely LineString/MultiLineString; single-piece
+    tracks come back as a LineString, like freshly computed ones.
+    """
+    parts = [shapely.get_coordinates(line) for line in shapely.get_parts(geometry)]
+    return parts_to_geojson(parts)
+
+
+def concat_tracks(first: dict, second: dict) -> dict:
+    """
+    Joins two consecutive pieces of a track, dropping the shared vertex and
+    re-splitting the junction at the antimeridian when needed.
+    """
+    head, tail = track_parts(first), track_parts(second)
+    joint = tail[0]
+    if len(head[-1]) and len(joint) and np.array_equal(head[-1][-1], joint[0]):
+        joint = joint[1:]
+    joined = np.vstack((head[-1], joint))
+    middle = split_antimeridian(joined[:, 0], joined[:, 1])
+    return parts_to_geojson(head[:-1] + middle + tail[1:])
+
+
+def simplify_track(track_geojson: Optional[dict], options: TrackOptions):
+    """
+    Reduces a GeoJSON track according to options.
+
+    Douglas-Peucker simplification (tolerance_deg) runs first, then uniform
+    decimation down to max_vertices (first and last vertex of every piece kept,
+    vertices shared across pieces by length), then rounding to precision
+    decimals.
+
+    Returns:
+        Optional[dict]: The reduced track, or None when tracks are omitted.
+    """
+    if track_geojson is None or not options.include:
+        return None
+    parts = track_parts(track_geojson)
+    total = sum(len(part) for part in parts)
+
+    reduced = []
+    for coords in parts:
+        if options.tolerance_deg is not None and len(coords) > 2:
+            simplified = shapely.simplify(
+                shapely.linestrings(coords),
+                options.tolerance_deg,
+                preserve_topology=False,
+            )
+            coords = shapely.get_coordinates(simplified)
+        if options.max_vertices is not None:
+            budget = max(2, options.max_vertices * len(coords) // max(total, 1))
+            if len(coords) > budget:
+                keep = np.unique(
+                    np.linspace(0, len(coords) - 1, budget).round().astype(int)
+                )
+                coords = coords[keep]
+        if options.precision is not None:
+            coords = coords.round(options.precision)
+        reduced.append(coords)
+    return parts_to_geojson(reduced)
+
+
+def apply_track_options(
+    passes: list[PassComputeResult], options: TrackOptions
+) -> list[PassComputeResult]:
+    """Returns the passes with their tracks reduced by simplify_track."""
+    if options == TrackOptions():
+        return passes
+    return [
+        p.model_copy(update={"track_geojson": simplify_track(p.track_geojson, options)})
+        for p in passes
+    ]
@@ -0,0 +1,68 @@
+"""
+Benchmark of the time-grid construction used by the pass engine.
+
+Compares the previous list-of-datetimes construction against the vectorized
+generate_times for 1, 7 and 30 day windows at 1 s and 10 s steps.
+
+Usage (from apps/api):
+    python -m benchmarks.bench_generate_times [--repeat N]
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+
+from skyfield.api import load
+
+from app.utils.pass_engine import generate_times
+
+WINDOW_DAYS = (1, 7, 30)
+STEPS_SECONDS = (1, 10)
+
+
+def generate_times_datetime_list(start: datetime, end: datetime, step_seconds: int):
+    """Previous implementation: one datetime per step handed to ts.utc."""
+    ts = load.timescale()
+    num_steps = int((end - start).total_seconds() / step_seconds) + 1
+    return ts.utc(
+        [start + timedelta(seconds=i * step_seconds) for i in range(num_steps)]
+    )
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    load.timescale()  # warm up the builtin leap-second tables
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    print(
+        f"{'window':>8} {'step':>6} {'samples':>10} {'list (s)':>10} "
+        f"{'vector (s)':>11} {'speedup':>8}"
+    )
+    for days in WINDOW_DAYS:
+        end = start + timedelta(days=days)
+        for step in STEPS_SECONDS:
+            samples = int(days * 86400 / step) + 1
+            legacy = best_of(
+                lambda: generate_times_datetime_list(start, end, step), args.repeat
+            )
+            vector = best_of(lambda: generate_times(start, end, step), args.repeat)
+            print(
+                f"{days:>7}d {step:>5}s {samples:>10} {legacy:>10.3f} "
+                f"{vector:>11.4f} {legacy / vector:>7.0f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+Query-count check of the generic CRUD endpoints.
+
+Calls every RouterFactory route of satellites and TLEs in-process and asserts
+how many SQL statements each one sends, so refresh round trips, load-before-
+write and N+1 loading show up as a failure instead of as latency. Statements
+are counted on both engines; each request also costs a COMMIT, which is not a
+statement.
+
+Needs a migrated database (DATABASE_URL). Rows are created with NORAD ids from
+--norad-base and deleted again. tests/test_query_counts.py runs the same checks
+under pytest.
+
+Usage (from apps/api):
+    python -m benchmarks.bench_query_counts [--norad-base N]
+"""
+
+import argparse
+import sys
+
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.db.query_counter import count_queries
+from app.db.session import SessionLocal, async_engine, engine
+from app.main import app
+from app.repositories.satellite import SatelliteRepo
+from app.schemas.satellite import ReadSatellite
+from app.schemas.tle import ReadTLE
+from app.utils.tle_parser import parse_tle_block
+
+ISS_TLE = (
+    "ISS (ZARYA)",
+    "1 25544U 98067A   25230.50000000  .00016717  00000-0  10270-3 0  9990",
+    "2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.50000000 10000",
+)
+
+
+class SatelliteWithTLEs(ReadSatellite):
+    tles: list[ReadTLE]
+
+
+def tle_payload(satellite_id: int, norad_id: int, day: int) -> dict:
+    name, line1, line2 = ISS_TLE
+    line1 = f"1 {norad_id:05d}{line1[7:18]}{day:03d}{line1[21:]}"
+    line2 = f"2 {norad_id:05d}{line2[7:]}"
+    row = parse_tle_block(name, line1, line2)
+    row.update(checksum_ok_l1=True, checksum_ok_l2=True, satellite_id=satellite_id)
+    return {k: v.isoformat() if hasattr(v, "isoformat") else v for k, v in row.items()}
+
+
+def run_checks(client: TestClient, base: int) -> list[tuple[str, int, int]]:
+    """
+    Sends one request to every CRUD route and counts its statements.
+
+    Args:
+        client (TestClient): Client of the running app.
+        base (int): First NORAD id of the rows created (and deleted again).
+
+    Returns:
+        list[tuple[str, int, int]]: (route, expected, actual) per request.
+    """
+    results = []
+
+    def check(label: str, expected: int, method: str, url: str, **kwargs):
+        with count_queries(engine, async_engine) as statements:
+            response = client.request(method, url, **kwargs)
+        assert response.status_code < 400, (label, response.status_code, response.text)
+        results.append((label, expected, len(statements)))
+        return response
+
+    sat = check(
+        "POST /satellites/",
+        1,
+        "POST",
+        "/satellites/",
+        json={"norad_id": base, "name": "QC"},
+    ).json()
+    sid = sat["id"]
+    check("GET /satellites/", 1, "GET", "/satellites/")
+    check("GET /satellites/?count=true", 2, "GET", "/satellites/?count=true")
+    check("GET /satellites/{id}", 1, "GET", f"/satellites/{sid}")
+    check("PUT /satellites/{id}", 1, "PUT", f"/satellites/{sid}", json={"name": "QC2"})
+    bulk = check(
+        "POST /satellites/bulk",
+        1,
+        "POST",
+        "/satellites/bulk",
+        json=[{"norad_id": base + i, "name": f"QC{i}"} for i in range(1, 11)],
+    ).json()
+    check(
+        "PATCH /satellites/bulk",
+        1,
+        "PATCH",
+        "/satellites/bulk",
+        json=[{"id": s["id"], "name": s["name"] + "b"} for s in bulk],
+    )
+
+    # TLE writes also repoint current_tles (one INSERT ... SELECT)
+    tle = check(
+        "POST /tles/",
+        2,
+        "POST",
+        "/tles/",
+        json=tle_payload(sid, base, 230),
+    ).json()
+    tles = check(
+        "POST /tles/bulk",
+        2,
+        "POST",
+        "/tles/bulk",
+        json=[tle_payload(sid, base, 231 + i) for i in range(10)],
+    ).json()
+    # All-NULL columns must keep their type in the VALUES source
+    patched = check(
+        "PATCH /tles/bulk (nulls)",
+        2,
+        "PATCH",
+        "/tles/bulk",
+        json=[
+            {
+                **tle_payload(sid, base, 231 + i),
+                "id": t["id"],
+                "bstar": None,
+                "rev_number": None,
+            }
+            for i, t in enumerate(tles)
+        ],
+    ).json()
+    assert not patched["errors"], patched["errors"]
+    assert all(
+        t.get("bstar") is None and t.get("rev_number") is None for t in patched["items"]
+    ), patched
+    # Serialising a satellite with its TLEs: one SELECT each (selectinload)
+    with SessionLocal() as db, count_queries(engine, async_engine) as statements:
+        rows = SatelliteRepo.list_all(db, filters=[("id", "eq", sid)], load=("tles",))
+        loaded = [SatelliteWithTLEs.model_validate(row) for row in rows]
+    assert len(loaded[0].tles) == len(tles) + 1, loaded
+    results.append(("Satellite load=('tles',)", 2, len(statements)))
+
+    check(
+        "GET /tles/?satnum=..",
+        1,
+        "GET",
+        "/tles/",
+        params={"satnum": base, "sort": "-epoch_utc"},
+    )
+    check(
+        "PUT /tles/{id}",
+        2,
+        "PUT",
+        f"/tles/{tle['id']}",
+        json={**tle_payload(sid, base, 230), "source": "qc"},
+    )
+    check("DELETE /tles/{id}", 2, "DELETE", f"/tles/{tle['id']}")
+    check(
+        "POST /tles/bulk/delete",
+        2,
+        "POST",
+        "/tles/bulk/delete",
+        json=[t["id"] for t in tles],
+    )
+
+    check(
+        "POST /satellites/bulk/delete",
+        1,
+        "POST",
+        "/satellites/bulk/delete",
+        json=[s["id"] for s in bulk],
+    )
+    check("DELETE /satellites/{id}", 1, "DELETE", f"/satellites/{sid}")
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--norad-base", type=int, default=89000)
+    args = parser.parse_args()
+
+    # The job worker would poll the instrumented engine inside the counts
+    settings.pass_job_worker_enabled = False
+    with TestClient(app) as client:
+        results = run_checks(client, args.norad_base)
+
+    failed = 0
+    for label, expected, actual in results:
+        status = "ok" if actual == expected else "FAIL"
+        failed += actual != expected
+        print(f"{label:<30} expected {expected:>2}  got {actual:>2}  {status}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
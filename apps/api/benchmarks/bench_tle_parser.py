@@ -0,0 +1,108 @@
+"""
+Benchmark of TLE parsing and checksum validation on a synthetic catalog.
+
+Compares the previous Skyfield-based parse_tle_block (builds an EarthSatellite,
+SGP4 initialization included, per record) and per-line checksum loop against
+the fixed-column parser and the vectorized checksum.
+
+Usage (from apps/api):
+    python -m benchmarks.bench_tle_parser [--records N] [--repeat N]
+"""
+
+import argparse
+import time
+
+from skyfield.api import EarthSatellite
+
+from app.utils.tle_parser import (
+    parse_tle_block,
+    validate_tle_checksum,
+    validate_tle_checksums,
+)
+
+
+def checksum_digit(line: str) -> str:
+    total = sum(int(c) if c.isdigit() else c == "-" for c in line[:68])
+    return str(total % 10)
+
+
+def synthetic_catalog(records: int) -> list[tuple[str, str, str]]:
+    """Valid 3-line element sets with distinct catalog numbers and elements."""
+    blocks = []
+    for k in range(records):
+        satnum = 10000 + k
+        line1 = (
+            f"1 {satnum:05d}U 98067A   25{230 + k % 100:03d}.50000000 "
+            " .00016717  00000-0  10270-3 0  999"
+        )
+        line2 = (
+            f"2 {satnum:05d} {k % 180:8.4f} {k * 7 % 360:8.4f} 0006317 "
+            f" 69.9862  25.2906 15.50000000 1000"
+        )
+        blocks.append(
+            (
+                f"SAT {satnum}",
+                line1[:68] + checksum_digit(line1),
+                line2[:68] + checksum_digit(line2),
+            )
+        )
+    return blocks
+
+
+def parse_tle_block_skyfield(name: str, line1: str, line2: str) -> dict:
+    """Previous implementation: reads the elements back from an EarthSatellite."""
+    satellite = EarthSatellite(line1, line2, name)
+    return {
+        "name": name.strip(),
+        "line1": line1.strip(),
+        "line2": line2.strip(),
+        "epoch_utc": satellite.epoch.utc_datetime(),
+        "satnum": int(line1[2:7]),
+        "intl_desg": line1[9:17].strip(),
+        "inclination_deg": float(satellite.model.inclo),
+        "raan_deg": float(satellite.model.nodeo),
+        "eccentricity": float(satellite.model.ecco),
+        "arg_perigee_deg": float(satellite.model.argpo),
+        "mean_anomaly_deg": float(satellite.model.mo),
+        "mean_motion_rev_per_day": float(satellite.model.no_kozai),
+        "bstar": float(satellite.model.bstar),
+        "rev_number": int(line2[63:68].strip()),
+    }
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=25_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    blocks = synthetic_catalog(args.records)
+    lines = [line for _, l1, l2 in blocks for line in (l1, l2)]
+
+    rows = [
+        (
+            "parse (EarthSatellite)",
+            lambda: [parse_tle_block_skyfield(*b) for b in blocks],
+        ),
+        ("parse (fixed columns)", lambda: [parse_tle_block(*b) for b in blocks]),
+        ("checksum (loop)", lambda: [validate_tle_checksum(line) for line in lines]),
+        ("checksum (vectorized)", lambda: validate_tle_checksums(lines)),
+    ]
+    assert all(validate_tle_checksums(lines))
+
+    print(f"{args.records} records")
+    for label, fn in rows:
+        print(f"{label:<24} {best_of(fn, args.repeat):8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
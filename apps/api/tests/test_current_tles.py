@@ -0,0 +1,74 @@
+"""
+current_tles bookkeeping of TLERepo writes.
+
+Needs a migrated database: skipped unless DATABASE_URL is set.
+"""
+
+import os
+
+import pytest
+
+if not os.getenv("DATABASE_URL"):
+    pytest.skip("DATABASE_URL is not set", allow_module_level=True)
+
+from pydantic import BaseModel
+from sqlalchemy import select
+
+from app.db.session import SessionLocal
+from app.models.current_tle import CurrentTLE
+from app.repositories.satellite import SatelliteRepo
+from app.repositories.tle import TLERepo
+from app.schemas.satellite import CreateSatellite
+from app.schemas.tle import CreateTLE
+from benchmarks.bench_query_counts import tle_payload
+
+NORAD_BASE = 89100
+
+
+class MoveTLE(BaseModel):
+    satellite_id: int
+
+
+def current(db, *satellite_ids) -> dict[int, int]:
+    rows = db.execute(
+        select(CurrentTLE.satellite_id, CurrentTLE.tle_id).where(
+            CurrentTLE.satellite_id.in_(satellite_ids)
+        )
+    )
+    return dict(rows.all())
+
+
+def remove_test_satellites(db) -> None:
+    satellites = SatelliteRepo.list_all(
+        db,
+        filters=[("norad_id", "gte", NORAD_BASE), ("norad_id", "lt", NORAD_BASE + 2)],
+    )
+    SatelliteRepo.bulk_remove(db, [sat.id for sat in satellites])
+
+
+@pytest.fixture
+def db():
+    with SessionLocal() as db:
+        remove_test_satellites(db)  # left behind by an interrupted run
+        try:
+            yield db
+        finally:
+            db.rollback()
+            remove_test_satellites(db)
+
+
+def test_moving_a_tle_repoints_both_satellites(db):
+    a, b = (
+        SatelliteRepo.create(db, CreateSatellite(norad_id=NORAD_BASE + i, name="QC"))
+        for i in range(2)
+    )
+    newer = TLERepo.create(db, CreateTLE(**tle_payload(a.id, a.norad_id, 230)))
+    older = TLERepo.create(db, CreateTLE(**tle_payload(b.id, b.norad_id, 100)))
+    assert current(db, a.id, b.id) == {a.id: newer.id, b.id: older.id}
+
+    # a loses its only TLE, which becomes the newest of b
+    TLERepo.update_by_id(db, newer.id, MoveTLE(satellite_id=b.id))
+    assert current(db, a.id, b.id) == {b.id: newer.id}
+
+    TLERepo.bulk_update(db, [(newer.id, MoveTLE(satellite_id=a.id))])
+    assert current(db, a.id, b.id) == {a.id: newer.id, b.id: older.id}
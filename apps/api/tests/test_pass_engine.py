@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+from shapely.geometry import Point
+
+from app.schemas.orbital_pass import TimeWindow
+from app.utils.compute_pool import TLERecord
+from app.utils.pass_engine import (
+    compute_passes_over_aoi,
+    find_pass_windows,
+    find_runs,
+    generate_times,
+    grid_offsets,
+)
+
+ISS = TLERecord(
+    1,
+    "ISS (ZARYA)",
+    "1 25544U 98067A   25230.50000000  .00016717  00000-0  10270-3 0  9990",
+    "2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.50000000 10000",
+)
+START = datetime(2025, 8, 18, tzinfo=timezone.utc)
+AOI = Point(10, 45).buffer(0.5)
+
+
+def window(start: datetime, hours: float) -> TimeWindow:
+    return TimeWindow(start=start, end=start + timedelta(hours=hours))
+
+
+@pytest.mark.parametrize("search_mode", ["adaptive", "sampled"])
+@pytest.mark.parametrize("shift_seconds", [0.37, 5175.532253, 6327.452162])
+def test_overlapping_windows_agree_on_pass_keys(search_mode, shift_seconds):
+    first = window(START, 36)
+    second = window(START + timedelta(seconds=shift_seconds), 36)
+
+    def keys(w: TimeWindow) -> set:
+        passes = compute_passes_over_aoi(ISS, AOI, w, search_mode=search_mode)
+        # Passes cut by the edge of either window legitimately differ
+        return {
+            (p.start_time, p.end_time)
+            for p in passes
+            if p.start_time > second.start + timedelta(seconds=1)
+            and p.end_time < first.end - timedelta(seconds=1)
+        }
+
+    shared = keys(first)
+    assert shared
+    assert keys(second) == shared
+
+
+def test_grid_offsets_include_both_ends_and_align_interior_samples():
+    start = START + timedelta(seconds=3.25)
+    offsets = grid_offsets(start, start + timedelta(seconds=60), 10)
+    assert offsets[0] == 0.0
+    assert offsets[-1] == 60.0
+    # interior samples sit on whole multiples of the step since the Unix epoch
+    assert np.allclose((start.timestamp() + offsets[1:-1]) % 10, 0.0)
+    assert np.all(np.diff(offsets) > 0)
+
+
+def test_overlapping_windows_share_interior_samples():
+    def samples(start: datetime) -> set:
+        end = START + timedelta(minutes=10)
+        return {
+            round(start.timestamp() + offset, 6)
+            for offset in grid_offsets(start, end, 10)[1:-1]
+        }
+
+    later = samples(START + timedelta(seconds=123.4))
+    assert later
+    assert later <= samples(START + timedelta(seconds=1.7))
+
+
+def test_generate_times_spans_the_window():
+    end = START + timedelta(minutes=5, seconds=7)
+    times = generate_times(START, end, 10)
+    utc = times.utc_datetime()
+    assert len(times) == len(grid_offsets(START, end, 10))
+    assert abs((utc[0] - START).total_seconds()) < 1e-3
+    assert abs((utc[-1] - end).total_seconds()) < 1e-3
+
+
+@pytest.mark.parametrize(
+    "above, runs",
+    [
+        ([], []),
+        ([False, False], []),
+        ([True], []),
+        ([True, False, True], []),
+        ([True, True, False], [(0, 1)]),
+        ([False, True, True], [(1, 2)]),
+        ([True, True, True], [(0, 2)]),
+        ([True, True, False, True, False, True, True, True], [(0, 1), (5, 7)]),
+    ],
+)
+def test_find_runs_edges(above, runs):
+    assert find_runs(np.array(above, dtype=bool)) == runs
+
+
+def test_find_pass_windows_threshold_is_inclusive():
+    elevations = np.array([5.0, 10.0, 10.0, 9.9, 12.0, 30.0, 11.0])
+    assert find_pass_windows(elevations, threshold_deg=10.0) == [(1, 2), (4, 6)]
+
+
+def test_adaptive_agrees_with_sampled():
+    w = window(START, 24)
+    adaptive = compute_passes_over_aoi(ISS, AOI, w, search_mode="adaptive")
+    sampled = compute_passes_over_aoi(ISS, AOI, w, search_mode="sampled")
+    assert adaptive
+    assert len(adaptive) == len(sampled)
+    step = timedelta(seconds=10)
+    tol = timedelta(seconds=0.2)
+    for a, s in zip(adaptive, sampled):
+        # sampled AOS/LOS are the first/last 10 s samples inside the pass
+        assert a.start_time - tol <= s.start_time <= a.start_time + step + tol
+        assert a.end_time - step - tol <= s.end_time <= a.end_time + tol
+        assert abs(a.max_elevation_time - s.max_elevation_time) <= step
+        assert a.max_elevation_deg >= s.max_elevation_deg - 1e-3
@@ -0,0 +1,63 @@
+"""
+Query counts of the CRUD routes, see benchmarks/bench_query_counts.py.
+
+Needs a migrated database: skipped unless DATABASE_URL is set.
+"""
+
+import os
+
+import pytest
+
+if not os.getenv("DATABASE_URL"):
+    pytest.skip("DATABASE_URL is not set", allow_module_level=True)
+
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.main import app
+from app.repositories.satellite import SatelliteRepo
+from benchmarks.bench_query_counts import SatelliteWithTLEs, run_checks
+
+NORAD_BASE = 89000
+
+
+@pytest.fixture(scope="module")
+def client():
+    # Rows left behind by an interrupted run would fail the inserts
+    with SessionLocal() as db:
+        leftovers = SatelliteRepo.list_all(
+            db,
+            filters=[
+                ("norad_id", "gte", NORAD_BASE),
+                ("norad_id", "lt", NORAD_BASE + 20),
+            ],
+        )
+        SatelliteRepo.bulk_remove(db, [sat.id for sat in leftovers])
+    # The job worker would poll the instrumented engine inside the counts
+    enabled, settings.pass_job_worker_enabled = settings.pass_job_worker_enabled, False
+    try:
+        with TestClient(app) as client:
+            yield client
+    finally:
+        settings.pass_job_worker_enabled = enabled
+
+
+def test_crud_routes_statement_counts(client):
+    results = run_checks(client, NORAD_BASE)
+    mismatched = [r for r in results if r[1] != r[2]]
+    assert not mismatched, f"(route, expected, actual): {mismatched}"
+
+
+def test_relationships_are_not_loaded_implicitly(client):
+    sat = client.post(
+        "/satellites/", json={"norad_id": NORAD_BASE, "name": "QC"}
+    ).json()
+    try:
+        with SessionLocal() as db:
+            row = SatelliteRepo.get_one_by_id(db, sat["id"])
+            with pytest.raises(ValidationError, match="raise_on_sql"):
+                SatelliteWithTLEs.model_validate(row)
+    finally:
+        client.delete(f"/satellites/{sat['id']}")
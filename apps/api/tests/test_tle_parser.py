@@ -0,0 +1,68 @@
+import pytest
+
+from app.routers.tle import build_tle_rows
+from app.utils.tle_parser import (
+    MAX_LINE_LENGTH,
+    MAX_NAME_LENGTH,
+    iter_tle_blocks,
+    parse_tle_block,
+)
+
+LINE1 = "1 25544U 98067A   25230.50000000  .00016717  00000-0  10270-3 0  9990"
+LINE2 = "2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.50000000 10000"
+
+
+def test_over_long_name_is_rejected():
+    with pytest.raises(ValueError, match="Name longer"):
+        parse_tle_block("X" * (MAX_NAME_LENGTH + 1), LINE1, LINE2)
+
+
+def test_over_long_line_is_rejected():
+    with pytest.raises(ValueError, match="lines longer"):
+        parse_tle_block("ISS", LINE1 + "X" * (MAX_LINE_LENGTH - len(LINE1) + 1), LINE2)
+
+
+def test_over_long_name_skips_only_its_record():
+    text = ["X" * (MAX_NAME_LENGTH + 1), LINE1, LINE2, "ISS", LINE1, LINE2]
+    rows, errors = build_tle_rows(iter_tle_blocks(text))
+    assert [row["name"] for row in rows] == ["ISS"]
+    assert errors == [f"Line 2: Name longer than {MAX_NAME_LENGTH} characters"]
+
+
+def test_two_and_three_line_sets_mix():
+    text = ["0 ISS (ZARYA)", LINE1, LINE2, "", LINE1, LINE2, "ISS", LINE1, LINE2]
+    blocks = list(iter_tle_blocks(text))
+    assert [(b.line_no, b.name) for b in blocks] == [
+        (2, "ISS (ZARYA)"),
+        (5, None),
+        (8, "ISS"),
+    ]
+    assert all((b.line1, b.line2) == (LINE1, LINE2) for b in blocks)
+
+
+def test_malformed_records_are_reported_and_skipped():
+    errors = []
+    text = [
+        "ORPHAN",
+        "ISS",
+        LINE1,
+        "BROKEN",
+        LINE2,
+        LINE1,
+        LINE2,
+        "DANGLING",
+    ]
+    blocks = list(iter_tle_blocks(text, on_error=errors.append))
+    assert [(b.line_no, b.name) for b in blocks] == [(6, None)]
+    assert errors == [
+        "Line 1: name 'ORPHAN' without element lines",
+        "Line 3: line 1 not followed by line 2",
+        "Line 5: line 2 without preceding line 1",
+        "Line 8: name 'DANGLING' without element lines",
+    ]
+
+
+def test_trailing_line1_is_reported():
+    errors = []
+    assert list(iter_tle_blocks([LINE1], on_error=errors.append)) == []
+    assert errors == ["Line 1: line 1 not followed by line 2"]
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from app.utils.track import split_antimeridian, track_to_geojson
+
+
+def test_track_without_crossing_is_one_line():
+    lon = np.array([10.0, 12.0, 14.0])
+    lat = np.array([40.0, 41.0, 42.0])
+    parts = split_antimeridian(lon, lat)
+    assert len(parts) == 1
+    assert parts[0].tolist() == [[10.0, 40.0], [12.0, 41.0], [14.0, 42.0]]
+    assert track_to_geojson(lon, lat)["type"] == "LineString"
+
+
+@pytest.mark.parametrize(
+    "lon, edge",
+    [([178.0, 179.0, -179.0, -178.0], 180.0), ([-178.0, -179.0, 179.0, 178.0], -180.0)],
+)
+def test_crossing_splits_at_interpolated_latitude(lon, edge):
+    lat = np.array([0.0, 10.0, 20.0, 30.0])
+    parts = split_antimeridian(np.array(lon), lat)
+    assert len(parts) == 2
+    first, second = parts
+    # the crossing is halfway between 179 and -179, so at latitude 15
+    assert first.tolist() == [[lon[0], 0.0], [lon[1], 10.0], [edge, 15.0]]
+    assert second.tolist() == [[-edge, 15.0], [lon[2], 20.0], [lon[3], 30.0]]
+
+
+def test_crossing_gives_multilinestring():
+    lon = np.array([170.0, 178.0, -176.0, -170.0, 178.0])
+    lat = np.array([0.0, 4.0, 8.0, 12.0, 16.0])
+    track = track_to_geojson(lon, lat)
+    assert track["type"] == "MultiLineString"
+    assert len(track["coordinates"]) == 3
+    assert [part[-1][0] for part in track["coordinates"][:-1]] == [180.0, -180.0]
+    assert [part[0][0] for part in track["coordinates"][1:]] == [-180.0, 180.0]
@@ -6,7 +6,7 @@ import "leaflet/dist/leaflet.css";
 
 type Props = {
   geojsonData: GeoJSONTypes.GeoJsonObject | null; // AOI
-  tracks?: GeoJSONTypes.LineString[]; // pass tracks
+  tracks?: (GeoJSONTypes.LineString | GeoJSONTypes.MultiLineString)[]; // pass tracks, split at the antimeridian
 };
 
 function FitOnData({ aoi, tracks }: { aoi: any; tracks?: any[] }) {
@@ -51,7 +51,7 @@ export default function MapViewer({ geojsonData, tracks = [] }: Props) {
                 type: "Feature",
                 geometry: line,
                 properties: {},
-              } as GeoJSON.Feature<GeoJSON.LineString>
+              } as GeoJSON.Feature<GeoJSON.LineString | GeoJSON.MultiLineString>
             }
             style={{ color: "red ", weight: 3 }}
           />
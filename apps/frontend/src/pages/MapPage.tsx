@@ -64,7 +64,7 @@ export default function MapPage() {
 
       {/* RIGHT COLUMN */}
       <div className="hidden lg:block w-3/4 h-screen">
-        <MapViewer geojsonData={geojson} tracks={passes.map((p) => p.track_geojson)} />
+        <MapViewer geojsonData={geojson} tracks={passes.map((p) => p.track_geojson).filter(Boolean)} />
       </div>
     </div>
   );